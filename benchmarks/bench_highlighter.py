@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: metric highlighting across the full render matrix
+
+Highlights every string in comprehensive_master_achievements.json once per
+color scheme and format, the way a full matrix run does, with the original
+per-call regex implementation and with the cached tokenizer.
+
+Usage:
+    python benchmarks/bench_highlighter.py [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.append('.')
+
+from resumes.core_services import highlight_quantitative_metrics
+from resumes.document_model import _link_tokens, _metric_tokens, token_cache_info
+
+
+MASTER_FILE = Path("comprehensive_master_achievements.json")
+COLOR_SCHEMES = 8
+FORMATS = ("pdf", "docx", "rtf", "md")
+
+
+def legacy_highlight(text: str, format_type: str = "pdf", color: str = "#2C3E50") -> str:
+    """The highlighter as it was before tokenization: two re.sub passes per call"""
+    def format_link(match):
+        if format_type == "pdf":
+            return f'<a href="{match.group(2)}" color="blue">{match.group(1)}</a>'
+        elif format_type == "md":
+            return f'[{match.group(1)}]({match.group(2)})'
+        return match.group(1)
+
+    def format_match(match_text):
+        if format_type == "md":
+            return f"**{match_text}**"
+        elif format_type == "pdf":
+            return f'<font color="{color}"><b>{match_text}</b></font>'
+        elif format_type == "docx":
+            return f"**METRIC_HIGHLIGHT_START**{match_text}**METRIC_HIGHLIGHT_END**"
+        elif format_type == "rtf":
+            return f"\\b {match_text}\\b0"
+        return match_text
+
+    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', format_link, text)
+    pattern = r'(\$[\d,]+(?:\.\d+)?[KMB]?|±[\d,]+(?:\.\d+)?%|[\d,]+(?:\.\d+)?%|\b\d{1,3}(?:,\d{3})+\b|\b\d+(?:\.\d+)?[KMB]\b|[\d,]+(?:\.\d+)?x)'
+    return re.sub(pattern, lambda m: format_match(m.group(1)), text)
+
+
+def collect_strings(value, strings):
+    """Every string value in a JSON document"""
+    if isinstance(value, str):
+        strings.append(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            collect_strings(item, strings)
+    elif isinstance(value, list):
+        for item in value:
+            collect_strings(item, strings)
+    return strings
+
+
+def run_matrix(highlight, texts):
+    """One highlight call per text, color scheme and format"""
+    for scheme in range(COLOR_SCHEMES):
+        color = f"#{scheme:06X}"
+        for format_type in FORMATS:
+            for text in texts:
+                highlight(text, format_type, color)
+
+
+def best_of(repeat, function):
+    """Fastest of several timed runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def clear_token_cache():
+    _link_tokens.cache_clear()
+    _metric_tokens.cache_clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark metric highlighting over the full render matrix")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant (best is reported)")
+    args = parser.parse_args(argv)
+
+    with open(MASTER_FILE, "r", encoding="utf-8") as f:
+        texts = collect_strings(json.load(f), [])
+
+    # Both implementations must agree before their speed is compared
+    for format_type in FORMATS:
+        for text in texts:
+            if "](" not in text:
+                assert legacy_highlight(text, format_type) == highlight_quantitative_metrics(text, format_type), text
+
+    calls = len(texts) * COLOR_SCHEMES * len(FORMATS)
+    legacy = best_of(args.repeat, lambda: run_matrix(legacy_highlight, texts))
+
+    def cold():
+        clear_token_cache()
+        run_matrix(highlight_quantitative_metrics, texts)
+    tokenized_cold = best_of(args.repeat, cold)
+    tokenized_warm = best_of(args.repeat, lambda: run_matrix(highlight_quantitative_metrics, texts))
+
+    print(f"📊 {len(texts)} strings × {COLOR_SCHEMES} color schemes × {len(FORMATS)} formats = {calls} calls")
+    print(f"   legacy re.sub per call:     {legacy * 1000:8.1f} ms")
+    print(f"   tokenizer, cold cache:      {tokenized_cold * 1000:8.1f} ms  ({legacy / tokenized_cold:.1f}x)")
+    print(f"   tokenizer, warm cache:      {tokenized_warm * 1000:8.1f} ms  ({legacy / tokenized_warm:.1f}x)")
+    print(f"   token cache: {token_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
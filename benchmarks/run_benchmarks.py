@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the rendering hot paths
+
+Times metric highlighting, stylesheet creation, the PDF/DOCX/Markdown
+writers on small, real and synthetic 10x inputs (highlighting and writers
+with cold and warm caches), each PDF profile (build time against file
+size), and full-matrix throughput at several worker counts (up to the
+machine's core count, over the inputs present on disk). Results are written
+as JSON; compare two result files to flag changes beyond a threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py run [--output benchmarks/latest.json] [--repeat 5] [--workers 1,2,4]
+    python benchmarks/run_benchmarks.py compare [--baseline benchmarks/baseline.json] [--current benchmarks/latest.json] [--threshold 0.15]
+
+Record a new baseline with: run --output benchmarks/baseline.json
+"""
+
+import argparse
+import copy
+import datetime
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'resume_generator_django.settings')
+
+from benchmarks.bench_highlighter import MASTER_FILE, best_of, clear_token_cache, collect_strings, run_matrix
+
+
+BASELINE_FILE = Path("benchmarks/baseline.json")
+LATEST_FILE = Path("benchmarks/latest.json")
+REAL_INPUT = Path("inputs/dheeraj_chand_comprehensive_full/resume_data.json")
+COLOR_SCHEME = "default_professional"
+WRITERS = ("pdf", "docx", "md")
+DEFAULT_THRESHOLD = 0.15
+# Changes smaller than this are timer noise however large they are relatively
+MIN_CHANGE_SECONDS = 0.001
+
+# Smallest resume that exercises every section
+SMALL_INPUT = {
+    "personal_info": {
+        "name": "Test User",
+        "contact": {"email": "test@example.com", "phone": "123-456-7890", "website": "https://example.com"},
+    },
+    "summary": "Data engineer who cut pipeline costs by 40%",
+    "achievements": {"Impact": ["Saved $1.2M annually", "Grew throughput 3x"]},
+    "competencies": {"Data": ["SQL", "Spark"]},
+    "experience": [{
+        "title": "Senior Engineer",
+        "company": "Test Company",
+        "location": "Austin, TX",
+        "dates": "2020 - Present",
+        "responsibilities": ["Built pipelines serving 12,000 users", "Reduced latency by 35%"],
+    }],
+    "education": [{"degree": "BS Computer Science", "institution": "Test University"}],
+}
+
+
+def synthetic_input(data, factor=10):
+    """Real resume data with every list section repeated factor times"""
+    synthetic = copy.deepcopy(data)
+    for key in ("experience", "projects", "education"):
+        if isinstance(synthetic.get(key), list):
+            synthetic[key] = synthetic[key] * factor
+    for key in ("achievements", "competencies"):
+        if isinstance(synthetic.get(key), dict):
+            synthetic[key] = {category: items * factor if isinstance(items, list) else items
+                              for category, items in synthetic[key].items()}
+    return synthetic
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def bench_highlighting(repeat):
+    """Highlight every master achievement string across the scheme x format matrix, cold and warm token cache"""
+    from resumes.core_services import highlight_quantitative_metrics
+
+    texts = collect_strings(load_json(MASTER_FILE), [])
+
+    def warm():
+        run_matrix(highlight_quantitative_metrics, texts)
+
+    def cold():
+        clear_token_cache()
+        warm()
+
+    return {
+        "highlight.matrix.cold": {"seconds": best_of(repeat, cold), "calls": len(texts)},
+        "highlight.matrix.warm": {"seconds": best_of(repeat, warm), "calls": len(texts)},
+    }
+
+
+def bench_styles(repeat):
+    """_create_styles for every shipped color scheme, with an empty and a warm registry"""
+    from resumes.core_services import ResumeGenerator
+    from resumes.style_registry import clear_stylesheet_cache
+
+    generators = [
+        ResumeGenerator.from_data(SMALL_INPUT, load_json(scheme_file), scheme_file.stem)
+        for scheme_file in sorted(Path("color_schemes").glob("*.json"))
+    ]
+
+    def create_all():
+        for generator in generators:
+            generator._create_styles()
+
+    def cold():
+        clear_stylesheet_cache()
+        create_all()
+
+    return {
+        "create_styles.cold": {"seconds": best_of(repeat, cold), "schemes": len(generators)},
+        "create_styles.warm": {"seconds": best_of(repeat, create_all), "schemes": len(generators)},
+    }
+
+
+def bench_writers(repeat):
+    """
+    generate_pdf/docx/markdown on small, real and synthetic 10x inputs, each
+    from a fresh generator.
+
+    Cold runs empty the token and section caches before every render, so they
+    time tokenizing, _get_sections and flowable building; warm runs time the
+    cache hits repeated renders of the same content get.
+    """
+    from resumes.core_services import ResumeGenerator
+    from resumes.section_cache import clear_section_cache
+
+    config = load_json(Path("color_schemes") / f"{COLOR_SCHEME}.json")
+    real = load_json(REAL_INPUT)
+    inputs = {"small": SMALL_INPUT, "real": real, "synthetic10x": synthetic_input(real)}
+    output_dir = tempfile.mkdtemp(prefix="resume_bench_")
+    results = {}
+    try:
+        for input_name, data in inputs.items():
+            for format_type in WRITERS:
+                filename = os.path.join(output_dir, f"{input_name}.{format_type}")
+
+                def render():
+                    ResumeGenerator.from_data(data, config, COLOR_SCHEME).generate(format_type, filename)
+
+                def cold():
+                    clear_token_cache()
+                    clear_section_cache()
+                    render()
+
+                results[f"render.{format_type}.{input_name}.cold"] = {"seconds": best_of(repeat, cold)}
+                results[f"render.{format_type}.{input_name}.warm"] = {"seconds": best_of(repeat, render)}
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    return results
+
+
+def bench_pdf_profiles(repeat):
+    """generate_pdf under every PDF profile on real and synthetic 10x inputs: build time and file size"""
+    from resumes.core_services import PDF_PROFILES, ResumeGenerator
+
+    config = load_json(Path("color_schemes") / f"{COLOR_SCHEME}.json")
+    real = load_json(REAL_INPUT)
+    results = {}
+    for input_name, data in (("real", real), ("synthetic10x", synthetic_input(real))):
+        for profile in PDF_PROFILES:
+            def render():
+                return ResumeGenerator.from_data(data, config, COLOR_SCHEME, pdf_profile=profile).render_bytes("pdf")
+
+            results[f"pdf_profile.{profile}.{input_name}"] = {
+                "seconds": best_of(repeat, render),
+                "bytes": len(render()),
+            }
+    return results
+
+
+def bench_matrix(worker_counts):
+    """
+    Full-matrix throughput for each worker count, forcing every render.
+
+    The matrix covers the ATS output type for the inputs present on disk; in a
+    plain checkout only the full-length inputs exist, so the abbreviated and
+    brief groups fail to load and "files" counts the long variants alone (256).
+    Worker counts above the machine's core count are skipped, since extra
+    processes there only time-slice one another, and each entry records the
+    core count it ran on so compare_results can tell comparable runs apart.
+    """
+    from resumes.core_services import ResumeManager
+
+    cpu_count = os.cpu_count() or 1
+    results = {}
+    for workers in worker_counts:
+        if workers > cpu_count:
+            print(f"   skipping {workers} workers ({cpu_count} CPU{'s' if cpu_count != 1 else ''})")
+            continue
+        output_dir = tempfile.mkdtemp(prefix="resume_bench_matrix_")
+        try:
+            start = time.perf_counter()
+            outcome = ResumeManager().generate_all_combinations(output_dir, workers=workers, force=True)
+            seconds = time.perf_counter() - start
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+        results[f"matrix.workers{workers}"] = {
+            "seconds": seconds,
+            "files": outcome["success"],
+            "files_per_second": round(outcome["success"] / seconds, 2) if seconds else 0.0,
+            "cpu_count": cpu_count,
+        }
+    return results
+
+
+def run_suite(repeat=5, worker_counts=(1, 2, 4)):
+    """Run every benchmark and return the results document"""
+    import django
+    django.setup()
+
+    results = {}
+    for name, bench in (("highlighting", lambda: bench_highlighting(repeat)),
+                        ("styles", lambda: bench_styles(repeat)),
+                        ("writers", lambda: bench_writers(repeat)),
+                        ("pdf profiles", lambda: bench_pdf_profiles(repeat)),
+                        ("matrix", lambda: bench_matrix(worker_counts))):
+        print(f"⏱️  {name}...")
+        results.update(bench())
+
+    return {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two results documents benchmark by benchmark.
+
+    Args:
+        baseline: Results document to compare against
+        current: Newer results document
+        threshold: Relative change in seconds beyond which a benchmark is flagged
+            (changes under MIN_CHANGE_SECONDS never are)
+
+    Returns:
+        List of (name, baseline seconds, current seconds, relative change, status)
+        rows, where status is "regression", "improvement", "ok", "new", "missing"
+        or "skipped" (recorded on different core counts, so not comparable)
+    """
+    rows = []
+    baseline_results, current_results = baseline["results"], current["results"]
+    for name in sorted(set(baseline_results) | set(current_results)):
+        if name not in baseline_results:
+            rows.append((name, None, current_results[name]["seconds"], None, "new"))
+            continue
+        if name not in current_results:
+            rows.append((name, baseline_results[name]["seconds"], None, None, "missing"))
+            continue
+        before, after = baseline_results[name]["seconds"], current_results[name]["seconds"]
+        if baseline_results[name].get("cpu_count") != current_results[name].get("cpu_count"):
+            rows.append((name, before, after, None, "skipped"))
+            continue
+        change = (after - before) / before if before else 0.0
+        if abs(after - before) < MIN_CHANGE_SECONDS:
+            status = "ok"
+        elif change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, before, after, change, status))
+    return rows
+
+
+def print_comparison(rows, threshold):
+    marks = {"regression": "❌", "improvement": "🚀", "ok": "  ", "new": "🆕", "missing": "❔", "skipped": "⏭️"}
+    print(f"{'benchmark':32} {'baseline':>10} {'current':>10} {'change':>8}   (threshold ±{threshold:.0%})")
+    for name, before, after, change, status in rows:
+        before_text = f"{before * 1000:8.1f}ms" if before is not None else f"{'-':>10}"
+        after_text = f"{after * 1000:8.1f}ms" if after is not None else f"{'-':>10}"
+        change_text = f"{change:+8.1%}" if change is not None else f"{'':>8}"
+        print(f"{name:32} {before_text} {after_text} {change_text} {marks[status]} {status if status != 'ok' else ''}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume rendering hot paths")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the suite and write a results file")
+    run_parser.add_argument("--output", type=Path, default=LATEST_FILE, help="Results file to write")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (best is kept)")
+    run_parser.add_argument("--workers", default="1,2,4",
+                            help="Comma-separated worker counts for the full-matrix benchmark (empty to skip)")
+
+    compare_parser = commands.add_parser("compare", help="Compare a results file with the baseline")
+    compare_parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline results file")
+    compare_parser.add_argument("--current", type=Path, default=LATEST_FILE, help="Results file to check")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Relative slowdown that counts as a regression (0.15 = 15%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        worker_counts = [int(count) for count in args.workers.split(",") if count.strip()]
+        document = run_suite(args.repeat, worker_counts)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+            f.write("\n")
+        for name, result in sorted(document["results"].items()):
+            size = f" {result['bytes'] / 1024:10.1f} KiB" if "bytes" in result else ""
+            print(f"   {name:32} {result['seconds'] * 1000:10.1f} ms{size}")
+        print(f"📄 Results written to {args.output}")
+        return 0
+
+    rows = compare_results(load_json(args.baseline), load_json(args.current), args.threshold)
+    print_comparison(rows, args.threshold)
+    regressions = [row for row in rows if row[4] == "regression"]
+    if regressions:
+        print(f"❌ {len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+        return 1
+    print("✅ No regressions beyond the threshold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
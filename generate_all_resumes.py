@@ -3,12 +3,17 @@
 Generate all resume versions (ATS and Human) for all resume types
 """
 
+import argparse
 import sys
 import os
 from pathlib import Path
 sys.path.append('.')
 
-from resumes.core_services import ResumeManager
+from resumes.core_services import DEFAULT_PDF_PROFILE, PDF_PROFILES, ResumeManager
+from resumes.manifest import merge_shard_manifests
+from resumes.metrics import registry as metrics_registry
+from resumes.profiling import RenderProfiler
+from resumes.sharding import parse_shard
 
 
 GITHUB_BASE = "https://raw.githubusercontent.com/dheerajchand/resume_generator/main/outputs"
@@ -100,62 +105,98 @@ def generate_output_readme(output_dir="outputs"):
     print(f"✅ Generated: {readme_path}")
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate all resume versions (ATS and Human)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of worker processes to render with (0 = one per CPU core)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild every file, ignoring outputs/.manifest.json")
+    parser.add_argument("--profile", nargs="?", const="profiles", default=None, metavar="DIR",
+                        help="Profile every render; write per-format pstats, a speedscope flamegraph "
+                             "and a stage breakdown to DIR (default: profiles)")
+    parser.add_argument("--metrics-json", default=None, metavar="PATH",
+                        help="Also write the render span latencies (p50/p95 per span, format and scheme) to PATH as JSON")
+    parser.add_argument("--shard", default=None, metavar="I/N",
+                        help="Render only shard I of N cost-balanced slices of the matrix, recording a partial manifest")
+    parser.add_argument("--pdf-profile", choices=list(PDF_PROFILES), default=DEFAULT_PDF_PROFILE,
+                        help="PDF output profile: preview (fastest, uncompressed), standard, web (fast web view) "
+                             "or archive (smallest)")
+    parser.add_argument("--merge-shards", action="store_true",
+                        help="Merge the partial shard manifests in outputs/ into outputs/.manifest.json, "
+                             "regenerate outputs/README.md and exit")
+    args = parser.parse_args(argv)
+    if args.shard:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
     manager = ResumeManager()
-    
-    # All resume types from the configuration
-    resume_types = [
-        "comprehensive",
-        "data_engineering", 
-        "software_engineering",
-        "gis",
-        "product",
-        "marketing",
-        "data_analysis_visualization",
-        "polling_research_redistricting"
-    ]
+    profiler = RenderProfiler() if args.profile else None
+
+    if args.merge_shards:
+        merged = merge_shard_manifests("outputs")
+        print(f"🧩 Merged {len(merged)} shard manifest(s) into outputs/.manifest.json")
+        generate_output_readme()
+        return
     
     # All output types
     output_types = ["ats", "human"]
     
     total_generated = 0
     total_failed = 0
+    total_skipped = 0
+
+    def report(task, success):
+        resume_type, length_variant, color_scheme, format_type, _, output_type = task
+        if success:
+            print(f"✓ Generated {output_type} {resume_type} {length_variant} {color_scheme} {format_type}")
+        else:
+            print(f"✗ Failed to generate {output_type} {resume_type} {length_variant} {color_scheme} {format_type}")
     
     for output_type in output_types:
         print(f"\n{'='*60}")
         print(f"Generating {output_type.upper()} resumes...")
         print(f"{'='*60}")
-        
-        for resume_type in resume_types:
-            print(f"\nGenerating {output_type} {resume_type} resumes...")
-            
-            for color_scheme in manager.color_schemes:
-                for format_type in manager.formats:
-                    for length_variant in manager.length_variants:
-                        success = manager.generate_single_resume(
-                            version=resume_type,
-                            color_scheme=color_scheme,
-                            format_type=format_type,
-                            output_dir="outputs",
-                            length_variant=length_variant,
-                            output_type=output_type
-                        )
-                        if success:
-                            print(f"✓ Generated {output_type} {resume_type} {length_variant} {color_scheme} {format_type}")
-                            total_generated += 1
-                        else:
-                            print(f"✗ Failed to generate {output_type} {resume_type} {length_variant} {color_scheme} {format_type}")
-                            total_failed += 1
+
+        results = manager.generate_all_combinations("outputs", output_type, workers=args.jobs, on_result=report, force=args.force,
+                                                   profiler=profiler, shard=args.shard, pdf_profile=args.pdf_profile)
+        total_generated += results["success"]
+        total_failed += results["failed"]
+        total_skipped += results["skipped"]
     
     print(f"\n{'='*60}")
     print(f"GENERATION COMPLETE")
     print(f"{'='*60}")
     print(f"Total generated: {total_generated}")
+    print(f"Total skipped (inputs unchanged): {total_skipped}")
     print(f"Total failed: {total_failed}")
-    print(f"Success rate: {(total_generated/(total_generated+total_failed)*100):.1f}%")
-
-    # Generate the output links page
-    generate_output_readme()
+    attempted = total_generated + total_failed
+    if attempted:
+        print(f"Success rate: {(total_generated/attempted*100):.1f}%")
+
+    if total_generated:
+        print(f"\nRender latency by span:")
+        for line in metrics_registry.summary_lines():
+            print(f"  {line}")
+    if args.metrics_json:
+        metrics_registry.dump(args.metrics_json)
+        print(f"  📄 {args.metrics_json}")
+
+    if profiler is not None:
+        print(f"\nTime by stage (profiled, all renders):")
+        for line in profiler.summary_lines():
+            print(f"  {line}")
+        for path in profiler.write(args.profile):
+            print(f"  📄 {path}")
+
+    # Generate the output links page (shards leave it to --merge-shards)
+    if not args.shard:
+        generate_output_readme()
 
 if __name__ == "__main__":
     main()
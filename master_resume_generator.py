@@ -299,81 +299,79 @@ def create_brief_resume(full_resume, resume_type):
     return brief
 
 
-def generate_all_specialized_resumes():
-    """Generate all specialized resume types from master data — long, abbreviated, and brief"""
-
-    master_data = load_master_achievements()
-
-    resume_types = [
-        "comprehensive", "data_engineering", "software_engineering",
-        "gis", "product", "marketing", "data_analysis_visualization",
-        "polling_research_redistricting"
-    ]
-
-    output_types = ["ats", "human"]
-
-    # Map to actual directory names
-    type_mapping = {
-        "comprehensive": "dheeraj_chand_comprehensive_full",
-        "data_engineering": "dheeraj_chand_data_engineering",
-        "software_engineering": "dheeraj_chand_software_engineering",
-        "gis": "dheeraj_chand_gis",
-        "product": "dheeraj_chand_product",
-        "marketing": "dheeraj_chand_marketing",
-        "data_analysis_visualization": "dheeraj_chand_data_analysis_visualization",
-        "polling_research_redistricting": "dheeraj_chand_polling_research_redistricting"
+# Map to actual directory names
+TYPE_DIRECTORIES = {
+    "comprehensive": "dheeraj_chand_comprehensive_full",
+    "data_engineering": "dheeraj_chand_data_engineering",
+    "software_engineering": "dheeraj_chand_software_engineering",
+    "gis": "dheeraj_chand_gis",
+    "product": "dheeraj_chand_product",
+    "marketing": "dheeraj_chand_marketing",
+    "data_analysis_visualization": "dheeraj_chand_data_analysis_visualization",
+    "polling_research_redistricting": "dheeraj_chand_polling_research_redistricting"
+}
+
+# Directory suffix for each length variant
+LENGTH_SUFFIXES = {
+    "long": "",
+    "short": "_abbreviated",
+    "brief": "_brief",
+}
+
+
+def variant_directory(resume_type, output_type, length_variant):
+    """Input directory for one resume type, output type and length variant"""
+    dir_name = TYPE_DIRECTORIES[resume_type]
+    if output_type == "human":
+        dir_name += "_human"
+    return Path("inputs") / (dir_name + LENGTH_SUFFIXES[length_variant])
+
+
+def build_variants(master_data, resume_type, output_type="ats"):
+    """Build the long, abbreviated (short) and brief variants of one resume type"""
+    specialized_resume = create_specialized_resume(master_data, resume_type, output_type)
+    return {
+        "long": specialized_resume,
+        "short": create_abbreviated_resume(specialized_resume, resume_type),
+        "brief": create_brief_resume(specialized_resume, resume_type),
     }
 
-    generated = 0
-
-    for resume_type in resume_types:
-        for output_type in output_types:
-
-            # Generate specialized resume (long version)
-            specialized_resume = create_specialized_resume(master_data, resume_type, output_type)
 
-            # --- Long variant ---
-            dir_name = type_mapping[resume_type]
-            if output_type == "human":
-                dir_name += "_human"
+def write_resume_data(output_file, resume):
+    """Write resume data as JSON, leaving the file untouched when its content is unchanged.
 
-            output_dir = Path("inputs") / dir_name
-            output_dir.mkdir(exist_ok=True)
-
-            output_file = output_dir / "resume_data.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(specialized_resume, f, indent=2, ensure_ascii=False)
-
-            print(f"✅ Generated: {output_file}")
-            generated += 1
-
-            # --- Abbreviated variant ---
-            abbreviated_resume = create_abbreviated_resume(specialized_resume, resume_type)
+    Returns True if the file was written. Skipping identical writes keeps
+    mtimes and content hashes stable, so downstream renders are not redone.
+    """
+    content = json.dumps(resume, indent=2, ensure_ascii=False)
+    output_file = Path(output_file)
+    if output_file.exists() and output_file.read_text(encoding='utf-8') == content:
+        return False
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(content, encoding='utf-8')
+    return True
 
-            abbrev_dir_name = dir_name + "_abbreviated"
-            abbrev_output_dir = Path("inputs") / abbrev_dir_name
-            abbrev_output_dir.mkdir(exist_ok=True)
 
-            abbrev_output_file = abbrev_output_dir / "resume_data.json"
-            with open(abbrev_output_file, 'w', encoding='utf-8') as f:
-                json.dump(abbreviated_resume, f, indent=2, ensure_ascii=False)
+def generate_all_specialized_resumes():
+    """Generate all specialized resume types from master data — long, abbreviated, and brief"""
 
-            print(f"✅ Generated: {abbrev_output_file}")
-            generated += 1
+    master_data = load_master_achievements()
 
-            # --- Brief variant ---
-            brief_resume = create_brief_resume(specialized_resume, resume_type)
+    output_types = ["ats", "human"]
 
-            brief_dir_name = dir_name + "_brief"
-            brief_output_dir = Path("inputs") / brief_dir_name
-            brief_output_dir.mkdir(exist_ok=True)
+    generated = 0
 
-            brief_output_file = brief_output_dir / "resume_data.json"
-            with open(brief_output_file, 'w', encoding='utf-8') as f:
-                json.dump(brief_resume, f, indent=2, ensure_ascii=False)
+    for resume_type in TYPE_DIRECTORIES:
+        for output_type in output_types:
+            variants = build_variants(master_data, resume_type, output_type)
 
-            print(f"✅ Generated: {brief_output_file}")
-            generated += 1
+            for length_variant, resume in variants.items():
+                output_file = variant_directory(resume_type, output_type, length_variant) / "resume_data.json"
+                if write_resume_data(output_file, resume):
+                    print(f"✅ Generated: {output_file}")
+                else:
+                    print(f"⏸️  Unchanged: {output_file}")
+                generated += 1
 
     print(f"\n🎯 Generated {generated} specialized resumes from master data!")
 
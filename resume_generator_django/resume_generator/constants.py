@@ -344,6 +344,28 @@ def get_theme_font_size(color_scheme, role):
 MAX_BULLETS_FOR_KEEP_TOGETHER = 3
 BULLETS_WITH_HEADER = 2
 
+# =============================================================================
+# AUTO-FIT LAYOUT
+# =============================================================================
+
+# Page target per length variant when PDFs are rendered with auto_fit
+AUTO_FIT_PAGE_TARGETS = {
+    'long': 5,
+    'short': 2,
+    'brief': 1,
+}
+
+# Auto-fit shrinks spacing first, then font size, never below these scales
+AUTO_FIT_MIN_SPACE_SCALE = 0.5
+AUTO_FIT_SPACE_STEP = 0.05
+AUTO_FIT_MIN_FONT_SCALE = 0.85
+AUTO_FIT_FONT_STEP = 0.01
+
+# Largest blank space allowed at the bottom of any page but the last (1.5 inches)
+AUTO_FIT_MAX_PAGE_WHITESPACE = 108
+# Smaller layouts tried when the largest fitting one breaks the whitespace limit
+AUTO_FIT_WHITESPACE_RETRIES = 4
+
 # =============================================================================
 # STYLE CONFIGURATION
 # =============================================================================
@@ -191,6 +191,8 @@ RESUME_GENERATOR = {
     'MAX_FILE_SIZE': 10 * 1024 * 1024,  # 10MB
     'ALLOWED_IMAGE_EXTENSIONS': ['.jpg', '.jpeg', '.png', '.gif'],
     'TEMPLATE_CACHE_TIMEOUT': 3600,  # 1 hour
+    'PREWARM_STYLES': True,  # Build color scheme stylesheets at startup
+    'PREVIEW_DEBOUNCE_SECONDS': 0.3,  # Live previews render only the settled state of rapid edits
 }
 
 # Content Management settings
@@ -204,8 +206,14 @@ CONTENT_MANAGEMENT = {
 # File generation settings
 FILE_GENERATION = {
     'OUTPUT_DIR': MEDIA_ROOT / 'generated_resumes',
+    'BLOB_DIR': MEDIA_ROOT / 'blobs',  # Content-addressed store of rendered files
     'TEMP_DIR': BASE_DIR / 'temp',
     'CLEANUP_AFTER_HOURS': 24,
+    # Let the web server send downloads: None, 'x-sendfile' or 'x-accel-redirect'
+    # (nginx, with an internal location ACCEL_REDIRECT_PREFIX aliased to ACCEL_REDIRECT_ROOT)
+    'DOWNLOAD_OFFLOAD': os.environ.get('DOWNLOAD_OFFLOAD') or None,
+    'ACCEL_REDIRECT_PREFIX': '/protected/',
+    'ACCEL_REDIRECT_ROOT': MEDIA_ROOT,
 }
 
 # Security settings
@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ResumesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "resumes"
+
+    def ready(self):
+        # Build the paragraph stylesheets of the shipped color schemes once at
+        # startup so the first render request does not pay for it
+        if getattr(settings, "RESUME_GENERATOR", {}).get("PREWARM_STYLES"):
+            from .style_registry import prewarm_stylesheets
+            prewarm_stylesheets(color_schemes_dir=settings.BASE_DIR / "color_schemes")
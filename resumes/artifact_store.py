@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Artifact Store
+
+Rendered files are stored once, under their SHA-256, in
+FILE_GENERATION['BLOB_DIR']/<first two hex digits>/<hash>, however many
+resumes and jobs produced the same bytes. Three tables track them:
+
+- RenderBlob: one row per stored file, with a reference count
+- RenderArtifact: render key of one format -> blob, so a repeat render is
+  a metadata insert instead of a ReportLab build
+- StoredFile: a resume's or job's format -> blob; each one is a reference
+
+Blobs nothing references stay until collect_garbage deletes them (and
+their render-key entries). Deleting a resume or job drops its StoredFile
+rows by cascade without touching the counts, so collect_garbage goes by the
+StoredFile rows themselves and resets every ref_count from them.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, ProtectedError, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import RenderArtifact, RenderBlob, StoredFile
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactStore:
+    """Blob files under root plus the RenderBlob/RenderArtifact/StoredFile rows that index them"""
+
+    def __init__(self, root=None):
+        self.root = Path(root or settings.FILE_GENERATION.get('BLOB_DIR') or Path(settings.MEDIA_ROOT) / 'blobs')
+
+    def blob_path(self, blob: RenderBlob) -> Path:
+        return self.root / blob.sha256[:2] / blob.sha256
+
+    def ingest(self, path, format_type: str, move: bool = False) -> RenderBlob:
+        """
+        Store a file by content, returning its blob (an existing one if the bytes are already stored).
+
+        Args:
+            path: File to store
+            format_type: Format of the file ("pdf", "docx", ...)
+            move: Move the file into the store instead of copying it
+        """
+        path = Path(path)
+        sha256 = _sha256(path)
+        target = self.root / sha256[:2] / sha256
+        if target.exists():
+            if move:
+                path.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Write beside the target and rename, so a blob file is never seen half-written
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{sha256[:12]}.")
+            os.close(fd)
+            if move:
+                shutil.move(str(path), tmp_name)
+            else:
+                shutil.copyfile(path, tmp_name)
+            os.replace(tmp_name, target)
+        blob, _ = RenderBlob.objects.get_or_create(
+            sha256=sha256, defaults={"format": format_type, "size": target.stat().st_size}
+        )
+        return blob
+
+    def lookup(self, render_key: str) -> Optional[RenderBlob]:
+        """Blob previously rendered for a render key, if it is still on disk"""
+        artifact = RenderArtifact.objects.select_related('blob').filter(render_key=render_key).first()
+        if artifact is None:
+            return None
+        if not self.blob_path(artifact.blob).exists():
+            artifact.delete()
+            return None
+        return artifact.blob
+
+    def remember(self, render_key: str, blob: RenderBlob):
+        """Record that render_key produces blob"""
+        RenderArtifact.objects.update_or_create(render_key=render_key, defaults={"blob": blob})
+
+    def attach(self, blob: RenderBlob, format_type: str, resume=None, job=None) -> StoredFile:
+        """Point one format of a resume or job at a blob, moving the reference from any blob it replaces"""
+        owner = {"resume": resume} if resume is not None else {"job": job}
+        with transaction.atomic():
+            stored = StoredFile.objects.select_for_update().filter(format=format_type, **owner).first()
+            if stored is not None and stored.blob_id == blob.id:
+                return stored
+            if stored is None:
+                stored = StoredFile.objects.create(blob=blob, format=format_type, **owner)
+            else:
+                RenderBlob.objects.filter(id=stored.blob_id).update(ref_count=F('ref_count') - 1)
+                stored.blob = blob
+                stored.save(update_fields=['blob'])
+            RenderBlob.objects.filter(id=blob.id).update(ref_count=F('ref_count') + 1)
+        return stored
+
+    def detach(self, format_type: Optional[str] = None, resume=None, job=None) -> int:
+        """Drop a resume's or job's references (one format, or all); returns how many were dropped"""
+        owner = {"resume": resume} if resume is not None else {"job": job}
+        stored = StoredFile.objects.filter(**owner)
+        if format_type is not None:
+            stored = stored.filter(format=format_type)
+        with transaction.atomic():
+            dropped = 0
+            for reference in stored.select_for_update():
+                RenderBlob.objects.filter(id=reference.blob_id).update(ref_count=F('ref_count') - 1)
+                reference.delete()
+                dropped += 1
+        return dropped
+
+    def files(self, resume=None, job=None) -> Dict[str, RenderBlob]:
+        """Blobs of a resume or job by format"""
+        owner = {"resume": resume} if resume is not None else {"job": job}
+        return {stored.format: stored.blob for stored in StoredFile.objects.select_related('blob').filter(**owner)}
+
+    def resolve(self, format_type: str, resume=None, job=None) -> Optional[Path]:
+        """Path of one format of a resume or job, if stored"""
+        blob = self.files(resume=resume, job=job).get(format_type)
+        return self.blob_path(blob) if blob is not None else None
+
+    def collect_garbage(self) -> int:
+        """
+        Delete unreferenced blobs and their render-key entries, then reset every ref_count.
+
+        A blob is deleted only if no StoredFile row points at it when it is
+        rechecked under a row lock; one that gains a reference meanwhile is
+        kept (and the PROTECT foreign key stops the delete if it races past).
+
+        Returns:
+            Number of blobs deleted
+        """
+        deleted = 0
+        for blob in RenderBlob.objects.annotate(references_count=Count('references')).filter(references_count=0):
+            try:
+                with transaction.atomic():
+                    # Recheck under the transaction: a render may have just reused it
+                    locked = RenderBlob.objects.select_for_update().filter(id=blob.id).first()
+                    if locked is None or StoredFile.objects.filter(blob_id=blob.id).exists():
+                        continue
+                    locked.delete()
+            except ProtectedError:
+                continue
+            self.blob_path(blob).unlink(missing_ok=True)
+            deleted += 1
+
+        references = (
+            StoredFile.objects.filter(blob=OuterRef('pk')).order_by().values('blob')
+            .annotate(count=Count('id')).values('count')
+        )
+        with transaction.atomic():
+            RenderBlob.objects.update(ref_count=Coalesce(Subquery(references), 0))
+        return deleted
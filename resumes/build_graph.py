@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Dependency-Graph Build for the Full Resume Pipeline
+
+Models the pipeline from comprehensive_master_achievements.json to rendered
+files as a make-like graph:
+
+    master achievements ─► specialize (type, output type) ─► long/short/brief
+                           resume_data.json ─► render (version, length, scheme)
+
+Each node is planned only after its dependencies finish, so a render sees
+the data file the specialize step just wrote. Specialize nodes are skipped
+when the master file, the type definitions and the specializer source are
+unchanged (tracked in inputs/.manifest.json); they rewrite a data file only
+when its content changes, so renders downstream of an unchanged variant are
+skipped by the output manifest. Independent nodes run in parallel.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any
+
+import master_resume_generator
+
+from .core_services import ResumeManager, _pool_render_group, absorb_worker_report
+from .manifest import BuildManifest, MANIFEST_FILENAME
+from .style_registry import prewarm_stylesheets
+
+
+# Files every specialized resume is derived from
+MASTER_FILE = Path("comprehensive_master_achievements.json")
+TYPE_DEFINITIONS_FILE = Path("resume_type_definitions.json")
+SPECIALIZER_SOURCE = Path(master_resume_generator.__file__)
+
+INPUTS_DIR = Path("inputs")
+
+
+class BuildNode:
+    """
+    One unit of work in a BuildGraph.
+
+    plan() runs in the parent process once every dependency has finished and
+    returns None when the node is up to date, or a picklable (function, args)
+    pair to execute. finish() receives the function's return value and
+    returns the node status ("built" or "failed").
+    """
+
+    def __init__(self, node_id: str, deps: List[str], plan: Callable[[], Optional[tuple]],
+                 finish: Callable[[Any], str]):
+        self.node_id = node_id
+        self.deps = list(deps)
+        self.plan = plan
+        self.finish = finish
+
+
+class BuildGraph:
+    """A set of BuildNodes executed in dependency order"""
+
+    def __init__(self, initializer: Optional[Callable[[], Any]] = None):
+        self.nodes: Dict[str, BuildNode] = {}
+        # Run once in each worker process before it takes any work
+        self.initializer = initializer
+
+    def add(self, node_id: str, deps: List[str], plan: Callable[[], Optional[tuple]],
+            finish: Callable[[Any], str]) -> BuildNode:
+        """Add a node; dependencies must already be in the graph"""
+        if node_id in self.nodes:
+            raise ValueError(f"Duplicate build node: {node_id}")
+        missing = [dep for dep in deps if dep not in self.nodes]
+        if missing:
+            raise ValueError(f"Unknown dependencies for {node_id}: {', '.join(missing)}")
+        node = BuildNode(node_id, deps, plan, finish)
+        self.nodes[node_id] = node
+        return node
+
+    def run(self, workers: int = 1) -> Dict[str, str]:
+        """
+        Execute every node whose plan() asks for work.
+
+        Args:
+            workers: Number of worker processes (1 runs in-process, 0 uses every core)
+
+        Returns:
+            Status per node in insertion order: "built", "skipped", "failed",
+            or "blocked" when a dependency failed
+        """
+        workers = workers or os.cpu_count() or 1
+        order = {node_id: index for index, node_id in enumerate(self.nodes)}
+        waiting = {node_id: set(node.deps) for node_id, node in self.nodes.items()}
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in self.nodes}
+        for node in self.nodes.values():
+            for dep in node.deps:
+                dependents[dep].append(node.node_id)
+
+        status: Dict[str, str] = {}
+        ready = [node_id for node_id, deps in waiting.items() if not deps]
+        running = {}
+
+        def complete(node_id, node_status):
+            status[node_id] = node_status
+            for dependent in dependents[node_id]:
+                waiting[dependent].discard(node_id)
+                if not waiting[dependent]:
+                    ready.append(dependent)
+            ready.sort(key=order.get)
+
+        def finish(node, result):
+            try:
+                return node.finish(result)
+            except Exception as e:
+                print(f"ERROR: Build step {node.node_id} failed: {e}")
+                return "failed"
+
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=self.initializer) if workers > 1 else None
+        try:
+            while ready or running:
+                while ready:
+                    node = self.nodes[ready.pop(0)]
+                    if any(status[dep] in ("failed", "blocked") for dep in node.deps):
+                        complete(node.node_id, "blocked")
+                        continue
+                    action = node.plan()
+                    if action is None:
+                        complete(node.node_id, "skipped")
+                        continue
+                    function, args = action
+                    if pool is None:
+                        try:
+                            result = function(*args)
+                        except Exception as e:
+                            print(f"ERROR: Build step {node.node_id} failed: {e}")
+                            complete(node.node_id, "failed")
+                        else:
+                            complete(node.node_id, finish(node, result))
+                    else:
+                        running[pool.submit(function, *args)] = node
+
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in sorted(done, key=lambda f: order[running[f].node_id]):
+                        node = running.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            print(f"ERROR: Build step {node.node_id} failed: {e}")
+                            complete(node.node_id, "failed")
+                        else:
+                            complete(node.node_id, finish(node, result))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return {node_id: status[node_id] for node_id in self.nodes}
+
+
+def _specialize(resume_type: str, output_type: str) -> Dict[str, tuple]:
+    """Write the long/short/brief data files of one resume type; module-level so process pools can pickle it"""
+    master_data = master_resume_generator.load_master_achievements()
+    variants = master_resume_generator.build_variants(master_data, resume_type, output_type)
+    written = {}
+    for length_variant, resume in variants.items():
+        output_file = master_resume_generator.variant_directory(resume_type, output_type, length_variant) / "resume_data.json"
+        written[length_variant] = (str(output_file), master_resume_generator.write_resume_data(output_file, resume))
+    return written
+
+
+def build_pipeline(output_dir: str = "outputs", workers: int = 1, force: bool = False,
+                   output_types: tuple = ("ats", "human"),
+                   manager: Optional[ResumeManager] = None) -> Dict[str, Any]:
+    """
+    Bring every specialized input and rendered file up to date with the master achievements.
+
+    Args:
+        output_dir: Root directory for generated files
+        workers: Number of worker processes (1 runs in-process, 0 uses every core)
+        force: Re-specialize and re-render everything regardless of the manifests
+        output_types: Output types to build
+        manager: ResumeManager whose versions, lengths, schemes and formats define the matrix
+
+    Returns:
+        Dictionary with specialize step counts, data files rewritten, and
+        rendered file success/failed/skipped counts with failures in matrix order
+    """
+    manager = manager or ResumeManager()
+    inputs_manifest = BuildManifest(INPUTS_DIR / MANIFEST_FILENAME)
+    outputs_manifest = BuildManifest.for_output_dir(output_dir)
+    graph = BuildGraph(initializer=prewarm_stylesheets)
+
+    results: Dict[str, Any] = {
+        "specialized": {"built": 0, "skipped": 0, "failed": 0},
+        "inputs_changed": 0,
+        "success": 0,
+        "failed": 0,
+        "skipped": 0,
+        "failures": [],
+    }
+    failures: Dict[str, List[tuple]] = {}
+
+    def add_specialize_node(resume_type: str, output_type: str) -> str:
+        node_id = f"specialize:{output_type}:{resume_type}"
+        data_files = [
+            master_resume_generator.variant_directory(resume_type, output_type, length_variant) / "resume_data.json"
+            for length_variant in master_resume_generator.LENGTH_SUFFIXES
+        ]
+        source_hash = {}
+
+        def plan():
+            source_hash["value"] = inputs_manifest.files_hash([MASTER_FILE, TYPE_DEFINITIONS_FILE, SPECIALIZER_SOURCE])
+            if not force and all(inputs_manifest.is_current(data_file, source_hash["value"]) for data_file in data_files):
+                return None
+            return _specialize, (resume_type, output_type)
+
+        def finish(written):
+            for data_file, changed in written.values():
+                inputs_manifest.record(data_file, source_hash["value"])
+                results["inputs_changed"] += int(changed)
+            return "built"
+
+        graph.add(node_id, [], plan, finish)
+        return node_id
+
+    def add_render_node(task: tuple, deps: List[str]):
+        node_id = "render:{5}:{0}:{1}:{2}".format(*task)
+        version, length_variant, color_scheme, formats, _, output_type = task
+        planned = {}
+
+        def plan():
+            stale, input_hash = manager._stale_formats(outputs_manifest, task, force)
+            results["skipped"] += len(formats) - len(stale)
+            if not stale:
+                return None
+            planned["formats"], planned["hash"] = stale, input_hash
+            return _pool_render_group, (task[:3] + (stale,) + task[4:],)
+
+        def finish(report):
+            group_results, timings = absorb_worker_report(report)
+            group_failures = failures.setdefault(node_id, [])
+            for format_type in planned["formats"]:
+                if group_results[format_type]:
+                    results["success"] += 1
+                    if planned["hash"] is not None:
+                        output_file = manager._output_file(output_dir, version, length_variant, color_scheme, output_type, format_type)
+                        outputs_manifest.record(output_file, planned["hash"], timings.get(format_type))
+                else:
+                    results["failed"] += 1
+                    group_failures.append((version, length_variant, color_scheme, format_type))
+            return "failed" if group_failures else "built"
+
+        graph.add(node_id, deps, plan, finish)
+
+    for output_type in output_types:
+        specialize_nodes = {
+            version: add_specialize_node(version, output_type)
+            for version in manager.versions
+            if version in master_resume_generator.TYPE_DIRECTORIES
+        }
+        for task in manager._combination_tasks(output_dir, output_type):
+            deps = [specialize_nodes[task[0]]] if task[0] in specialize_nodes else []
+            add_render_node(task, deps)
+
+    status = graph.run(workers)
+
+    for node_id, node_status in status.items():
+        if node_id.startswith("specialize:"):
+            if node_status in results["specialized"]:
+                results["specialized"][node_status] += 1
+        elif node_status == "blocked":
+            # Renders whose inputs could not be specialized count as failed
+            version, length_variant, color_scheme = node_id.split(":")[2:]
+            failures[node_id] = [(version, length_variant, color_scheme, format_type) for format_type in manager.formats]
+            results["failed"] += len(manager.formats)
+        results["failures"].extend(failures.get(node_id, []))
+
+    inputs_manifest.save()
+    outputs_manifest.save()
+    return results
@@ -9,8 +9,11 @@ For the minimal/backup format, see core_services_minimal.py
 
 import json
 import os
+import time
+import multiprocessing
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import BinaryIO, Callable, Dict, List, Mapping, Optional, Any, Tuple, Union
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white
@@ -20,10 +23,26 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT
 from reportlab.platypus.frames import Frame
 from reportlab.platypus.doctemplate import PageTemplate
-from docx import Document
 from docx.shared import Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+import io
 import tempfile
+import zipfile
+import pikepdf
+import pymupdf
+from datetime import datetime, timezone
+from .manifest import BuildManifest
+from .metrics import registry as metrics_registry, span as timing_span
+from .profiling import RenderProfiler, profile_call
+from .sharding import plan_shards
+from .section_cache import cached_section
+from .docx_template import add_heading, new_document
+from .style_registry import config_hash, get_stylesheet, prewarm_stylesheets
+from .document_model import (
+    ResumeDocument, DETAIL_TEXT, LINK, METRIC, build_document, span, join_spans, plain_text,
+    link_spans, metric_spans,
+    spans_to_pdf, spans_to_markdown, spans_to_rtf, add_docx_runs
+)
 from resume_generator_django.resume_generator.constants import (
     SPACE_BASE, SPACE_BETWEEN_SECTIONS, SPACE_BETWEEN_JOB_UNITS, 
     SPACE_BETWEEN_JOB_COMPONENTS, SPACE_HEADER_TO_CONTENT, SPACE_SUBHEADER_TO_BULLETS, SPACE_HEADER_TOP,
@@ -45,7 +64,9 @@ from resume_generator_django.resume_generator.constants import (
     HEADER_RECURRING_EMAIL_Y, HEADER_RECURRING_PHONE_Y, HEADER_RECURRING_GITHUB_Y,
     FOOTER_Y, FONT_THEMES, FONT_ROLES, FONT_SIZE_THEMES,
     get_spacing_constant, get_font_size, get_color_role, get_theme_font, get_theme_font_size,
-    MAX_BULLETS_FOR_KEEP_TOGETHER, BULLETS_WITH_HEADER
+    MAX_BULLETS_FOR_KEEP_TOGETHER, BULLETS_WITH_HEADER,
+    AUTO_FIT_PAGE_TARGETS, AUTO_FIT_MIN_SPACE_SCALE, AUTO_FIT_SPACE_STEP, AUTO_FIT_MIN_FONT_SCALE,
+    AUTO_FIT_FONT_STEP, AUTO_FIT_MAX_PAGE_WHITESPACE, AUTO_FIT_WHITESPACE_RETRIES
 )
 
 
@@ -54,28 +75,140 @@ from resume_generator_django.resume_generator.constants import (
 import re
 
 
+# Number of render groups (every format of one version/length/scheme) a pool
+# worker handles before it is replaced by a fresh process, so ReportLab and
+# python-docx allocations never accumulate in one worker
+WORKER_MAX_TASKS = 12
+
+
+# Link and metric markup written by highlight_quantitative_metrics for each format
+LINK_FORMATS = {
+    "pdf": '<a href="{url}" color="blue">{text}</a>',
+    "md": "[{text}]({url})",
+}
+METRIC_FORMATS = {
+    "pdf": '<font color="{color}"><b>{text}</b></font>',
+    "md": "**{text}**",
+    # DOCX: markers are turned into bold runs by the caller
+    "docx": "**METRIC_HIGHLIGHT_START**{text}**METRIC_HIGHLIGHT_END**",
+    "rtf": "\\b {text}\\b0",
+}
+
+# Padding platypus keeps inside every Frame; SimpleDocTemplate's body frame uses the default
+FRAME_PADDING = 6
+
+# Where a writer puts its output: a path, or a binary file-like object (BytesIO, a socket-backed stream)
+OutputTarget = Union[str, os.PathLike, BinaryIO]
+
+
+# Creation/modification time written into reproducible outputs (ReportLab's invariant date)
+REPRODUCIBLE_TIMESTAMP = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+# Named PDF output profiles. "compress" is ReportLab's page-stream compression
+# at build time; "linearize" re-saves the built file with qpdf (via pikepdf)
+# and a "rewrite" re-serializes it with PyMuPDF.
+PDF_PROFILES = {
+    # Uncompressed, no post-pass: fastest build, for previews and debugging
+    "preview": {"compress": 0},
+    # ReportLab's light compression only
+    "standard": {"compress": 1},
+    # Fast web view: linearized, so viewers show page 1 before the download finishes
+    "web": {"compress": 1, "linearize": True},
+    # Smallest file: a clean rewrite that drops unused objects, packs them into
+    # object streams and deflates at maximum effort. No font subsetting: the
+    # renderer only uses the standard-14 fonts, which are never embedded
+    "archive": {"compress": 1,
+                "rewrite": {"garbage": 4, "deflate": True, "use_objstms": 1, "compression_effort": 100}},
+}
+DEFAULT_PDF_PROFILE = "standard"
+
+
+def pdf_profile_settings(profile: str) -> Dict[str, Any]:
+    """Settings of a named PDF profile; raises ValueError for an unknown name"""
+    if profile not in PDF_PROFILES:
+        raise ValueError(f"Unknown PDF profile: {profile} (expected one of {', '.join(PDF_PROFILES)})")
+    return PDF_PROFILES[profile]
+
+
+def _apply_pdf_profile(data: bytes, profile: str) -> bytes:
+    """Post-process a built PDF as profile asks; equal input bytes always give equal output bytes"""
+    settings = pdf_profile_settings(profile)
+    if settings.get("linearize"):
+        # MuPDF dropped linearization in 1.26, so qpdf writes it; the ID is derived from the content
+        output = io.BytesIO()
+        with pikepdf.open(io.BytesIO(data)) as pdf:
+            pdf.save(output, linearize=True, deterministic_id=True, compress_streams=True,
+                     object_stream_mode=pikepdf.ObjectStreamMode.generate)
+        return output.getvalue()
+    rewrite = settings.get("rewrite")
+    if not rewrite:
+        return data
+    # Keep ReportLab's document ID, so reproducible files stay reproducible
+    options = dict(rewrite, no_new_id=1)
+    with pymupdf.open(stream=data, filetype="pdf") as pdf:
+        return pdf.tobytes(**options)
+
+
+def _write_output(target: OutputTarget, data: bytes) -> bool:
+    """
+    Write rendered bytes to a binary stream, or to a path unless the file already holds exactly these bytes.
+
+    Skipping unchanged files keeps their mtime, so rebuilds cause no I/O or
+    VCS churn for outputs that did not change.
+
+    Returns:
+        Whether anything was written
+    """
+    if hasattr(target, "write"):
+        target.write(data)
+        return True
+    path = Path(target)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _write_text(target: OutputTarget, text: str) -> bool:
+    """Write a text format's content, UTF-8 encoded, to a path or binary stream"""
+    return _write_output(target, text.encode("utf-8"))
+
+
+def _normalize_zip(data: bytes, timestamp: datetime = REPRODUCIBLE_TIMESTAMP) -> bytes:
+    """Rewrite a ZIP (e.g. a DOCX) with every member stamped with timestamp, so equal contents give equal bytes"""
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(output, "w") as target:
+        for info in source.infolist():
+            member = zipfile.ZipInfo(info.filename, timestamp.timetuple()[:6])
+            member.compress_type = info.compress_type
+            member.create_system = 3
+            member.external_attr = info.external_attr
+            target.writestr(member, source.read(info))
+    return output.getvalue()
+
+
 def convert_markdown_links(text: str, format_type: str = "pdf") -> str:
     """Convert markdown-style [text](url) links to format-appropriate output."""
-    def format_link(match):
-        link_text = match.group(1)
-        link_url = match.group(2)
-        if format_type == "pdf":
-            return f'<a href="{link_url}" color="blue">{link_text}</a>'
-        elif format_type == "md":
-            return f'[{link_text}]({link_url})'
-        elif format_type == "docx":
-            return link_text  # DOCX doesn't support inline links easily in this pipeline
-        elif format_type == "rtf":
-            return link_text
-        else:
-            return link_text
-    return re.sub(r'\[([^\]]+)\]\(([^)]+)\)', format_link, text)
+    # DOCX and RTF don't support inline links easily in this pipeline, so they keep the text
+    link_format = LINK_FORMATS.get(format_type, "{text}")
+    return "".join(
+        link_format.format(text=text, url=url) if role == LINK else text
+        for text, role, url in link_spans(text)
+    )
 
 
 def highlight_quantitative_metrics(text: str, format_type: str = "pdf", color: str = "#2C3E50") -> str:
     """
     Highlight quantitative impact metrics in text using bold and color formatting.
     
+    The text is tokenized once (see document_model.metric_spans, which caches
+    by text), so highlighting the same bullet for another format or color
+    only re-emits markup.
+    
     Args:
         text: The text to process
         format_type: The output format ("pdf", "docx", "rtf", "md")
@@ -84,46 +217,115 @@ def highlight_quantitative_metrics(text: str, format_type: str = "pdf", color: s
     Returns:
         Text with quantitative metrics highlighted
     """
-    def format_match(match_text: str) -> str:
-        """Format a matched metric based on output format"""
-        if format_type == "md":
-            # Markdown: bold only
-            return f"**{match_text}**"
-        elif format_type == "pdf":
-            # PDF: bold + color using ReportLab markup
-            return f'<font color="{color}"><b>{match_text}</b></font>'
-        elif format_type == "docx":
-            # DOCX: will be handled separately in DOCX generation
-            return f"**METRIC_HIGHLIGHT_START**{match_text}**METRIC_HIGHLIGHT_END**"
-        elif format_type == "rtf":
-            # RTF: bold markup
-            return f"\\b {match_text}\\b0"
+    link_format = LINK_FORMATS.get(format_type, "{text}")
+    metric_format = METRIC_FORMATS.get(format_type, "{text}")
+    parts = []
+    for span_text, role, url in metric_spans(text):
+        if role == METRIC:
+            parts.append(metric_format.format(text=span_text, color=color))
+        elif role == LINK:
+            parts.append(link_format.format(text=span_text, url=url))
         else:
-            return match_text
-    
-    # Convert markdown-style links before processing metrics
-    text = convert_markdown_links(text, format_type)
-
-    # Single comprehensive pattern for all quantitative metrics
-    # Order matters - more specific patterns first
-    pattern = r'(\$[\d,]+(?:\.\d+)?[KMB]?|±[\d,]+(?:\.\d+)?%|[\d,]+(?:\.\d+)?%|\b\d{1,3}(?:,\d{3})+\b|\b\d+(?:\.\d+)?[KMB]\b|[\d,]+(?:\.\d+)?x)'
-
-    result = re.sub(pattern, lambda m: format_match(m.group(1)), text)
-    return result
+            parts.append(span_text)
+    return "".join(parts)
 
 
 class ResumeGenerator:
     """Core resume generator supporting all formats"""
     
-    def __init__(self, data_file: str, config_file: Optional[str] = None, color_scheme: str = 'default_professional', length_variant: str = 'long', output_type: str = 'ats'):
-        self.data = self._load_json(data_file)
-        self.config = self._load_json(config_file) if config_file else {}
+    # File extension written for each supported format
+    FORMAT_EXTENSIONS = {"pdf": "pdf", "docx": "docx", "rtf": "rtf", "md": "md"}
+    
+    def __init__(self, data_file: str, config_file: Optional[str] = None, color_scheme: str = 'default_professional', length_variant: str = 'long', output_type: str = 'ats',
+                 reproducible: bool = False, pdf_profile: str = DEFAULT_PDF_PROFILE):
+        with timing_span("load", scheme=color_scheme):
+            data = self._load_json(data_file)
+            config = self._load_json(config_file) if config_file else {}
+        self._setup(data, config, color_scheme, length_variant, output_type, reproducible, pdf_profile)
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], config: Optional[Dict[str, Any]] = None, color_scheme: str = 'default_professional', length_variant: str = 'long', output_type: str = 'ats',
+                  reproducible: bool = False, pdf_profile: str = DEFAULT_PDF_PROFILE) -> "ResumeGenerator":
+        """Create a generator from already-loaded resume data and color scheme config"""
+        generator = cls.__new__(cls)
+        generator._setup(data, config or {}, color_scheme, length_variant, output_type, reproducible, pdf_profile)
+        return generator
+    
+    def _setup(self, data: Dict[str, Any], config: Dict[str, Any], color_scheme: str, length_variant: str, output_type: str,
+               reproducible: bool = False, pdf_profile: str = DEFAULT_PDF_PROFILE):
+        pdf_profile_settings(pdf_profile)
+        self.data = data
+        self.config = config
         self.color_scheme = color_scheme
         self.length_variant = length_variant
         self.output_type = output_type
+        # Fixed timestamps and document IDs, so identical inputs give byte-identical files;
+        # batch builds turn it on, request-time renders keep real creation dates
+        self.reproducible = reproducible
+        # Named PDF_PROFILES entry generate_pdf uses unless told otherwise
+        self.pdf_profile = pdf_profile
         self.styles = self._create_styles()
+        self.layout_scale = (1.0, 1.0)
+        self._sorted_experience = None
+        self._document = None
         self._init_spacing_constants()
     
+    def generate(self, format_type: str, filename: OutputTarget) -> OutputTarget:
+        """Generate a single format into a path or binary stream, dispatching to the matching writer"""
+        writers = {
+            "pdf": self.generate_pdf,
+            "docx": self.generate_docx,
+            "rtf": self.generate_rtf,
+            "md": self.generate_markdown,
+        }
+        if format_type not in writers:
+            raise ValueError(f"Unsupported format: {format_type}")
+        with timing_span("render", format_type, self.color_scheme):
+            return writers[format_type](filename)
+    
+    def render_bytes(self, format_type: str) -> bytes:
+        """Render a single format in memory, without touching the filesystem"""
+        buffer = io.BytesIO()
+        self.generate(format_type, buffer)
+        return buffer.getvalue()
+    
+    def generate_many(self, formats: List[str], output_dir: str, basename: str = "resume", format_subdirs: bool = False,
+                      profiles: Optional[Dict[str, Dict]] = None, timings: Optional[Dict[str, float]] = None) -> Dict[str, str]:
+        """
+        Generate several formats from this generator's already-loaded state.
+        
+        Data, color scheme, styles and sorted experience are shared by every
+        format, so rendering N formats costs one setup instead of N.
+        
+        Args:
+            formats: Formats to render ("pdf", "docx", "rtf", "md")
+            output_dir: Directory to write into
+            basename: Filename without extension
+            format_subdirs: Write each format into output_dir/<format>/
+            profiles: If given, each render is profiled and its raw cProfile stats stored here by format
+            timings: If given, each render's wall time in seconds is stored here by format
+            
+        Returns:
+            Dictionary mapping each format to the path written
+        """
+        unsupported = [format_type for format_type in formats if format_type not in self.FORMAT_EXTENSIONS]
+        if unsupported:
+            raise ValueError(f"Unsupported format(s): {', '.join(unsupported)}")
+        
+        outputs = {}
+        for format_type in formats:
+            target_dir = Path(output_dir) / format_type if format_subdirs else Path(output_dir)
+            target_dir.mkdir(parents=True, exist_ok=True)
+            filename = target_dir / f"{basename}.{self.FORMAT_EXTENSIONS[format_type]}"
+            start = time.perf_counter()
+            if profiles is None:
+                outputs[format_type] = self.generate(format_type, str(filename))
+            else:
+                outputs[format_type], profiles[format_type] = profile_call(self.generate, format_type, str(filename))
+            if timings is not None:
+                timings[format_type] = time.perf_counter() - start
+        return outputs
+    
     def _get_contact_info(self, personal_info: dict) -> dict:
         """
         Get contact information from personal_info, handling both nested and flat structures.
@@ -203,15 +405,27 @@ class ResumeGenerator:
         
         return sorted(experience, key=sort_key)
     
-    def _init_spacing_constants(self):
+    def _get_sorted_experience(self) -> list:
+        """Experience entries sorted most recent first, computed once per generator"""
+        if self._sorted_experience is None:
+            self._sorted_experience = self._sort_experience_chronologically(self.data.get("experience", []))
+        return self._sorted_experience
+    
+    def _init_spacing_constants(self, space_scale: float = 1.0):
         """Initialize spacing constants as instance variables"""
-        # Spacing system constants (imported from settings)
-        self.SPACE_BASE = SPACE_BASE
-        self.SPACE_BETWEEN_SECTIONS = SPACE_BETWEEN_SECTIONS
-        self.SPACE_BETWEEN_JOB_UNITS = SPACE_BETWEEN_JOB_UNITS
-        self.SPACE_BETWEEN_JOB_COMPONENTS = SPACE_BETWEEN_JOB_COMPONENTS
-        self.SPACE_HEADER_TO_CONTENT = SPACE_HEADER_TO_CONTENT
-        self.SPACE_SUBHEADER_TO_BULLETS = SPACE_SUBHEADER_TO_BULLETS
+        # Spacing system constants (imported from settings), scaled by auto-fit layouts
+        self.SPACE_BASE = SPACE_BASE * space_scale
+        self.SPACE_BETWEEN_SECTIONS = SPACE_BETWEEN_SECTIONS * space_scale
+        self.SPACE_BETWEEN_JOB_UNITS = SPACE_BETWEEN_JOB_UNITS * space_scale
+        self.SPACE_BETWEEN_JOB_COMPONENTS = SPACE_BETWEEN_JOB_COMPONENTS * space_scale
+        self.SPACE_HEADER_TO_CONTENT = SPACE_HEADER_TO_CONTENT * space_scale
+        self.SPACE_SUBHEADER_TO_BULLETS = SPACE_SUBHEADER_TO_BULLETS * space_scale
+    
+    def _apply_layout_scale(self, font_scale: float, space_scale: float):
+        """Switch PDF styles and spacing to a scaled layout (1.0, 1.0 is the designed layout)"""
+        self.layout_scale = (font_scale, space_scale)
+        self.styles = get_stylesheet(self.color_scheme, self.config, font_scale, space_scale)
+        self._init_spacing_constants(space_scale)
     
     def _load_json(self, file_path: str) -> Dict[str, Any]:
         """Load JSON data from file"""
@@ -221,160 +435,19 @@ class ResumeGenerator:
         except Exception as e:
             raise Exception(f"Error loading {file_path}: {e}")
     
-    def _create_styles(self) -> Dict[str, ParagraphStyle]:
-        """Create paragraph styles based on config with theme-specific fonts"""
-        styles = getSampleStyleSheet()
-        
-        # Get colors from config (color schemes have colors directly, not wrapped in "colors")
-        colors = self.config if self.config else {}
-        
-        # Get color scheme name for font theme selection
+    def _create_styles(self) -> Mapping[str, ParagraphStyle]:
+        """Paragraph styles for this color scheme and config, shared process-wide"""
         color_scheme = getattr(self, 'color_scheme', 'default_professional')
-        
-        # Helper function to get theme-specific font with proper bold/italic handling
-        def get_font(role, bold=False, italic=False):
-            base_font = get_theme_font(color_scheme, role)
-            
-            # If the theme already specifies bold/italic, use it directly
-            if '-Bold' in base_font or '-Oblique' in base_font:
-                return base_font
-            
-            # Handle font variations for ReportLab
-            if bold and italic:
-                return f"{base_font}-BoldOblique"
-            elif bold:
-                return f"{base_font}-Bold"
-            elif italic:
-                return f"{base_font}-Oblique"
-            else:
-                return base_font
-        
-        custom_styles = {
-            "Name": ParagraphStyle(
-                "CustomName",
-                parent=styles["Heading1"],
-                fontSize=28,  # Bigger name - keep as special case, consistent across all themes
-                textColor=HexColor(colors.get("NAME_COLOR", "#2C3E50")),
-                alignment=TA_RIGHT,
-                spaceAfter=get_spacing_constant('base') * 1,
-                fontName=get_font('name', bold=True),
-            ),
-            "Title": ParagraphStyle(
-                "CustomTitle",
-                parent=styles["Heading2"],
-                fontSize=get_font_size('section_header'),
-                textColor=HexColor(colors.get("TITLE_COLOR", "#34495E")),
-                alignment=TA_CENTER,
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_LARGE,
-                fontName=get_font('primary', bold=True),
-            ),
-            "Subtitle": ParagraphStyle(
-                "CustomSubtitle",
-                parent=styles["Normal"],
-                fontSize=get_font_size('bullet_point'),
-                textColor=HexColor(colors.get("TITLE_COLOR", "#7F8C8D")),
-                alignment=TA_CENTER,
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_LARGE,
-                fontName=get_font('secondary'),
-            ),
-            # DESIGN SYSTEM: Consistent spacing scale (0.25, 0.5, 1, 2, 4 units)
-            # Typography hierarchy: 8, 9, 10, 11, 12, 14pt
-            # Color hierarchy: primary, secondary, accent, muted
-            
-            "SectionHeader": ParagraphStyle(
-                "CustomSectionHeader",
-                parent=styles["Heading2"],
-                fontSize=get_font_size('section_header'),
-                textColor=HexColor(colors.get("SECTION_HEADER_COLOR", "#2C3E50")),
-                spaceAfter=get_spacing_constant('header_to_content'),  # Minimal gap to content
-                spaceBefore=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,     # Medium units spacing - reduced whitespace between main sections
-                fontName=get_font('primary', bold=True),
-            ),
-            "JobTitle": ParagraphStyle(
-                "CustomJobTitle",
-                parent=styles["Normal"],
-                fontSize=get_font_size('job_title'),
-                textColor=HexColor(colors.get("JOB_TITLE_COLOR", "#666666")),  # Muted color
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_SMALL,   # Small spacing - increased gap between job title and subtitle
-                spaceBefore=get_spacing_constant('base') * SPACE_MULTIPLIER_SMALL,  # Small spacing
-                fontName=get_font('accent'),
-            ),
-            "Company": ParagraphStyle(
-                "CustomCompany",
-                parent=styles["Heading3"],
-                fontSize=get_font_size('company'),
-                textColor=HexColor(colors.get("COMPANY_COLOR", "#2C3E50")),  # Primary color
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MINIMAL,    # Minimal spacing after company
-                spaceBefore=get_spacing_constant('base') * SPACE_MULTIPLIER_MINIMAL,   # Minimal spacing before company
-                fontName=get_font('primary', bold=True),
-            ),
-            "Body": ParagraphStyle(
-                "CustomBody",
-                parent=styles["Normal"],
-                fontSize=get_font_size('body'),
-                textColor=HexColor(colors.get("DARK_TEXT_COLOR", "#2C3E50")),
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,      # Medium unit spacing
-                fontName=get_font('secondary'),
-            ),
-            "BulletPoint": ParagraphStyle(
-                "CustomBulletPoint",
-                parent=styles["Normal"],
-                fontSize=get_font_size('bullet_point'),
-                textColor=HexColor(colors.get("MEDIUM_TEXT_COLOR", "#666666")),
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_SMALL,    # Small unit spacing - tighter bullet spacing
-                leftIndent=12,
-                fontName=get_font('secondary'),
-            ),
-            "MainCompetency": ParagraphStyle(
-                "CustomMainCompetency",
-                parent=styles["Normal"],
-                fontSize=get_font_size('main_competency'),
-                textColor=HexColor(colors.get("COMPETENCY_HEADER_COLOR", "#2C3E50")),
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MINIMAL,    # Minimal unit spacing - minimal gap to bullets
-                spaceBefore=get_spacing_constant('base') * SPACE_MULTIPLIER_MINIMAL,   # Minimal unit spacing - minimal gap from previous
-                fontName=get_font('primary', bold=True),
-            ),
-            "SubCompetency": ParagraphStyle(
-                "CustomSubCompetency",
-                parent=styles["Normal"],
-                fontSize=get_font_size('sub_competency'),
-                textColor=HexColor(colors.get("ACCENT_COLOR", "#4682B4")),
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,    # Medium unit spacing
-                leftIndent=12,
-                fontName=get_font('accent', bold=True),
-            ),
-            "CompetencyDetail": ParagraphStyle(
-                "CustomCompetencyDetail",
-                parent=styles["Normal"],
-                fontSize=get_font_size('competency_detail'),
-                textColor=HexColor(colors.get("DARK_TEXT_COLOR", "#2C3E50")),
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,    # Medium unit spacing
-                leftIndent=0,
-                fontName=get_font('secondary'),
-                allowWidows=1,
-                allowOrphans=1,
-            ),
-            "Contact": ParagraphStyle(
-                "CustomContact",
-                parent=styles["Normal"],
-                fontSize=get_font_size('body'),
-                textColor=HexColor(colors.get("ACCENT_COLOR", "#4682B4")),  # Use accent color for header contact
-                alignment=TA_RIGHT,
-                spaceAfter=get_spacing_constant('base') * 1,
-                fontName=get_font('secondary'),
-            ),
-            "ContactStacked": ParagraphStyle(
-                "CustomContactStacked",
-                parent=styles["Normal"],
-                fontSize=get_font_size('body'),
-                textColor=HexColor(colors.get("ACCENT_COLOR", "#4682B4")),
-                alignment=TA_RIGHT,
-                spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,
-                fontName=get_font('secondary'),
-            ),
-        }
-        
-        return custom_styles
+        with timing_span("styles", scheme=color_scheme):
+            return get_stylesheet(color_scheme, self.config)
+    
+    def _get_document(self) -> ResumeDocument:
+        """Format-neutral document model, compiled once per generator and shared by every writer"""
+        if self._document is None:
+            contact_info = self._get_contact_info(self.data.get("personal_info", {}))
+            with timing_span("model", scheme=self.color_scheme):
+                self._document = build_document(self.data, contact_info, self._get_sorted_experience(), self.length_variant)
+        return self._document
     
     def _get_sections(self):
         """Build all resume sections with headers embedded in content.
@@ -384,220 +457,88 @@ class ResumeGenerator:
         2. Build content items
         3. Wrap header + first content item(s) in KeepTogether to prevent orphaning
         4. Remaining items are separate flowables for flexible page breaking
+
+        Each section's flowables come from the process-wide section cache,
+        so after an edit only the sections whose content changed are rebuilt.
         """
-        sections = []
-        colors = self.config if self.config else {}
-        highlight_color = colors.get("COMPETENCY_HEADER_COLOR", "#2C3E50")
-
-        # --- PROFESSIONAL SUMMARY ---
-        summary = self.data.get("summary", "")
-        if summary:
-            header = Paragraph("PROFESSIONAL SUMMARY", self.styles["SectionHeader"])
-            body = Paragraph(summary, self.styles["Body"])
-            sections.append({"content": [KeepTogether([header, body])]})
-
-        # --- KEY ACHIEVEMENTS AND IMPACT ---
-        achievements = self.data.get("achievements", {})
-        if achievements:
-            all_achievements = []
-            for category, achievement_list in achievements.items():
-                if isinstance(achievement_list, list) and achievement_list:
-                    all_achievements.extend(achievement_list)
-            if all_achievements:
-                achievement_text = " • ".join(all_achievements)
-                highlighted = highlight_quantitative_metrics(achievement_text, "pdf", highlight_color)
-                header = Paragraph("KEY ACHIEVEMENTS AND IMPACT", self.styles["SectionHeader"])
-                body = Paragraph(highlighted, self.styles["CompetencyDetail"])
-                sections.append({"content": [KeepTogether([header, body])]})
-
-        # --- CORE COMPETENCIES ---
-        competencies_data = self.data.get("competencies", {})
-        if competencies_data:
-            core_competencies = list(competencies_data.keys())
-            competency_text = " • ".join(core_competencies)
-            header = Paragraph("CORE COMPETENCIES", self.styles["SectionHeader"])
-            body = Paragraph(competency_text, self.styles["CompetencyDetail"])
-            sections.append({"content": [KeepTogether([header, body])]})
-
-        # --- PROFESSIONAL EXPERIENCE ---
-        experience = self.data.get("experience", [])
-        if experience:
-            experience = self._sort_experience_chronologically(experience)
-            experience_content = []
-            header = Paragraph("PROFESSIONAL EXPERIENCE", self.styles["SectionHeader"])
-
-            for idx, job in enumerate(experience):
-                company_line = job.get("company", "")
-                if job.get("title"):
-                    company_line += f" | {job['title']}"
-                if job.get("location"):
-                    company_line += f" - {job['location']}"
-                if job.get("dates"):
-                    company_line += f" {job['dates']}"
-
-                job_unit = [Paragraph(company_line, self.styles["Company"])]
-
-                if job.get("subtitle"):
-                    job_unit.append(Spacer(1, self.SPACE_BETWEEN_JOB_COMPONENTS))
-                    job_unit.append(Paragraph(job["subtitle"], self.styles["SubCompetency"]))
-
-                responsibilities = job.get("responsibilities", [])
-
-                if len(responsibilities) > MAX_BULLETS_FOR_KEEP_TOGETHER:
-                    # Many bullets: keep header + first bullet together, rest can split
-                    first_resp = highlight_quantitative_metrics(responsibilities[0], "pdf", highlight_color)
-                    job_unit.append(Paragraph(f"• {first_resp}", self.styles["BulletPoint"]))
-
-                    if idx == 0:
-                        experience_content.append(KeepTogether([header] + job_unit))
-                    else:
-                        experience_content.append(KeepTogether(job_unit))
+        style_key = (self.color_scheme, config_hash(self.config), self.layout_scale)
+        return [
+            {"key": section.key, "title": section.title,
+             "content": cached_section(section, style_key, self._section_flowables)}
+            for section in self._get_document().sections
+        ]
 
-                    for resp in responsibilities[1:]:
-                        highlighted = highlight_quantitative_metrics(resp, "pdf", highlight_color)
-                        experience_content.append(Paragraph(f"• {highlighted}", self.styles["BulletPoint"]))
+    def _section_flowables(self, section) -> list:
+        """Flowables of one document-model section"""
+        colors = self.config if self.config else {}
+        header = Paragraph(section.title.upper(), self.styles["SectionHeader"]) if section.title else None
 
-                elif len(responsibilities) > BULLETS_WITH_HEADER:
-                    # Medium bullets: same split strategy
-                    first_resp = highlight_quantitative_metrics(responsibilities[0], "pdf", highlight_color)
-                    job_unit.append(Paragraph(f"• {first_resp}", self.styles["BulletPoint"]))
+        if section.key == "achievements":
+            # All categories flow together as one space-efficient paragraph
+            achievement_spans = join_spans([item for block in section.blocks for item in block.items], " • ")
+            body = Paragraph(spans_to_pdf(achievement_spans, colors), self.styles["CompetencyDetail"])
+            return [KeepTogether([header, body])]
 
-                    if idx == 0:
-                        experience_content.append(KeepTogether([header] + job_unit))
-                    else:
-                        experience_content.append(KeepTogether(job_unit))
+        if section.key == "experience":
+            return self._experience_flowables(header, section.blocks)
 
-                    for resp in responsibilities[1:]:
-                        highlighted = highlight_quantitative_metrics(resp, "pdf", highlight_color)
-                        experience_content.append(Paragraph(f"• {highlighted}", self.styles["BulletPoint"]))
+        if section.key in ("projects", "education"):
+            heading_style, detail_style = ("SubCompetency", "CompetencyDetail") if section.key == "projects" else ("JobTitle", "Body")
+            entry_content = []
+            for idx, entry in enumerate(section.blocks):
+                entry_unit = [Paragraph(spans_to_pdf(entry.heading, colors), self.styles[heading_style])]
+                for detail in entry.details:
+                    entry_unit.append(Paragraph(spans_to_pdf(detail, colors), self.styles[detail_style]))
 
+                if idx == 0:
+                    entry_content.append(KeepTogether([header] + entry_unit))
                 else:
-                    # Few bullets: keep entire job together
-                    for resp in responsibilities:
-                        highlighted = highlight_quantitative_metrics(resp, "pdf", highlight_color)
-                        job_unit.append(Paragraph(f"• {highlighted}", self.styles["BulletPoint"]))
+                    entry_content.append(Spacer(1, self.SPACE_BETWEEN_JOB_COMPONENTS))
+                    entry_content.append(KeepTogether(entry_unit))
+            return entry_content
 
-                    if idx == 0:
-                        experience_content.append(KeepTogether([header] + job_unit))
-                    else:
-                        experience_content.append(KeepTogether(job_unit))
-
-                if job != experience[-1]:
-                    experience_content.append(Spacer(1, self.SPACE_BETWEEN_JOB_UNITS))
-
-            sections.append({"content": experience_content})
-
-        # --- KEY PROJECTS ---
-        projects = self.data.get("projects", [])
-        if projects:
-            project_content = []
-            header = Paragraph("KEY PROJECTS", self.styles["SectionHeader"])
-
-            for idx, project in enumerate(projects):
-                project_name = project.get("name", "")
-                dates = project.get("dates", "")
-                description = project.get("description", "")
-                technologies = project.get("technologies", [])
-                impact = project.get("impact", "")
-
-                project_unit = []
-                title_line = convert_markdown_links(project_name, "pdf")
-                if dates:
-                    title_line += f" ({dates})"
-                project_unit.append(Paragraph(title_line, self.styles["SubCompetency"]))
-
-                if description:
-                    medium_color = colors.get("MEDIUM_TEXT_COLOR", "#666666")
-                    about_text = f'<font color="{medium_color}"><b>About:</b></font> {description}'
-                    project_unit.append(Paragraph(about_text, self.styles["CompetencyDetail"]))
-
-                if technologies:
-                    tech_color = colors.get("COMPETENCY_HEADER_COLOR", "#2C3E50")
-                    tech_text = f'<font color="{tech_color}"><b>Technologies:</b></font> {", ".join(technologies)}'
-                    project_unit.append(Paragraph(tech_text, self.styles["CompetencyDetail"]))
-
-                if impact:
-                    accent_color = colors.get("ACCENT_COLOR", "#4682B4")
-                    impact_text = f'<font color="{accent_color}"><b>Impact:</b></font> {impact}'
-                    project_unit.append(Paragraph(impact_text, self.styles["CompetencyDetail"]))
+        paragraphs = [
+            Paragraph(spans_to_pdf(block.spans, colors), self.styles["CompetencyDetail" if block.style == DETAIL_TEXT else "Body"])
+            for block in section.blocks
+        ]
+        if header is not None:
+            # Keep header with first paragraph; rest can flow across pages
+            paragraphs = [KeepTogether([header, paragraphs[0]])] + paragraphs[1:]
+        return paragraphs
+    
+    def _experience_flowables(self, header, jobs) -> list:
+        """Experience flowables, keeping each job heading with at least its first bullet"""
+        colors = self.config if self.config else {}
+        experience_content = []
 
-                if idx == 0:
-                    project_content.append(KeepTogether([header] + project_unit))
-                else:
-                    project_content.append(Spacer(1, self.SPACE_BETWEEN_JOB_COMPONENTS))
-                    project_content.append(KeepTogether(project_unit))
-
-            sections.append({"content": project_content})
-
-        # --- EDUCATION ---
-        education = self.data.get("education", [])
-        if education:
-            education_content = []
-            header = Paragraph("EDUCATION", self.styles["SectionHeader"])
-
-            for idx, edu in enumerate(education):
-                edu_unit = []
-                title_line = edu.get("degree", "")
-                if edu.get("institution"):
-                    title_line += f" - {edu['institution']}"
-                if edu.get("location"):
-                    title_line += f" ({edu['location']})"
-                if edu.get("dates"):
-                    title_line += f" | {edu['dates']}"
-                edu_unit.append(Paragraph(title_line, self.styles["JobTitle"]))
-                if edu.get("gpa"):
-                    edu_unit.append(Paragraph(f"GPA: {edu['gpa']}", self.styles["Body"]))
-                if edu.get("honors"):
-                    edu_unit.append(Paragraph(f"Honors: {edu['honors']}", self.styles["Body"]))
+        for idx, job in enumerate(jobs):
+            job_unit = [Paragraph(spans_to_pdf(job.heading, colors), self.styles["Company"])]
 
-                if idx == 0:
-                    education_content.append(KeepTogether([header] + edu_unit))
-                else:
-                    education_content.append(Spacer(1, self.SPACE_BETWEEN_JOB_COMPONENTS))
-                    education_content.append(KeepTogether(edu_unit))
-
-            sections.append({"content": education_content})
-
-        # --- ADDITIONAL INFO (short resumes only) ---
-        if self.length_variant in ("short", "brief"):
-            additional_info = self.data.get("additional_info", "")
-            if additional_info:
-                linkedin_url = "https://www.linkedin.com/in/dheerajchand/"
-                personal_site_url = "https://www.dheerajchand.com"
-                info_text = f"For a more detailed, full description of my experience, please visit my LinkedIn ({linkedin_url}) and Personal Site ({personal_site_url})."
-                sections.append({"content": [Paragraph(info_text, self.styles["Body"])]})
-
-        # --- TECHNICAL SKILLS ---
-        competencies = self.data.get("competencies", {})
-        if competencies:
-            technical_skills_content = []
-            for main_category, sub_skills in competencies.items():
-                if isinstance(sub_skills, list):
-                    accent_color = colors.get("ACCENT_COLOR", "#4682B4")
-                    muted_color = colors.get("MEDIUM_TEXT_COLOR", "#666666")
-                    sub_content = []
-                    for skill_line in sub_skills:
-                        if ": " in skill_line:
-                            sub_category, details = skill_line.split(": ", 1)
-                            sub_content.append(f'<font color="{accent_color}"><i>{sub_category}</i></font> <font color="{muted_color}">({details})</font>')
-                        else:
-                            sub_content.append(f'<font color="{accent_color}">{skill_line}</font>')
-
-                    main_color = colors.get("COMPETENCY_HEADER_COLOR", "#2C3E50")
-                    skill_text = "; ".join(sub_content)
-                    full_text = f'<font color="{main_color}"><b>{main_category.upper()}</b></font> {skill_text}'
-                    technical_skills_content.append(Paragraph(full_text, self.styles["CompetencyDetail"]))
-
-            if technical_skills_content:
-                header = Paragraph("TECHNICAL SKILLS", self.styles["SectionHeader"])
-                # Keep header with first skill category; rest can flow across pages
-                first_skill = technical_skills_content[0]
-                remaining = technical_skills_content[1:]
-                sections.append({
-                    "content": [KeepTogether([header, first_skill])] + remaining
-                })
-
-        return sections
+            if job.subtitle:
+                job_unit.append(Spacer(1, self.SPACE_BETWEEN_JOB_COMPONENTS))
+                job_unit.append(Paragraph(job.subtitle, self.styles["SubCompetency"]))
+
+            bullets = [Paragraph(f"• {spans_to_pdf(bullet, colors)}", self.styles["BulletPoint"]) for bullet in job.bullets]
+
+            if len(bullets) > BULLETS_WITH_HEADER:
+                # Many bullets: keep header + first bullet together, rest can split
+                job_unit.extend(bullets[:1])
+                remaining = bullets[1:]
+            else:
+                # Few bullets: keep entire job together
+                job_unit.extend(bullets)
+                remaining = []
+
+            if idx == 0:
+                experience_content.append(KeepTogether([header] + job_unit))
+            else:
+                experience_content.append(KeepTogether(job_unit))
+            experience_content.extend(remaining)
+
+            if idx < len(jobs) - 1:
+                experience_content.append(Spacer(1, self.SPACE_BETWEEN_JOB_UNITS))
+
+        return experience_content
     
     def _create_horizontal_bar(self, color="#2C3E50", height=2):
         """Create a horizontal bar for section separation"""
@@ -662,17 +603,210 @@ class ResumeGenerator:
             'bottom_margin': bottom_margin
         }
 
-    def generate_pdf(self, filename: str) -> str:
-        """Generate PDF resume using systematic header/footer approach"""
+    def _body_frame_size(self) -> tuple:
+        """Usable (width, height) of the body frame on every PDF page, inside the frame padding"""
+        dimensions = self._calculate_header_footer_dimensions()
+        width = letter[0] - MARGIN_LEFT - MARGIN_RIGHT - 2 * FRAME_PADDING
+        height = letter[1] - dimensions['top_margin'] - dimensions['bottom_margin'] - 2 * FRAME_PADDING
+        return width, height
+
+    def estimate_pages(self) -> Dict[str, Any]:
+        """
+        Predict the PDF page count without building the document.
+
+        Lays out the same flowables generate_pdf builds, measuring each with
+        Paragraph.wrap/split (stringWidth line breaking, no canvas) and
+        following platypus's frame rules: space before is dropped at the top
+        of a page, a KeepTogether that does not fit starts a new page, and an
+        oversized paragraph splits across pages.
+
+        Returns:
+            Dictionary with the page count, the body frame height, the space
+            used on the last page, the blank space left at the bottom of every
+            other page and, per section, the height it occupies and the pages
+            it starts and ends on (all heights in points)
+        """
+        width, frame_height = self._body_frame_size()
+        state = {"page": 1, "used": 0.0}
+        page_whitespace = []
+        # Paragraph height depends only on the frame width, so measure each flowable once
+        heights = {}
+
+        def measure(flowable) -> float:
+            if id(flowable) not in heights:
+                heights[id(flowable)] = flowable.wrap(width, frame_height)[1]
+            return heights[id(flowable)]
+
+        def new_page():
+            page_whitespace.append(round(max(frame_height - state["used"], 0.0), 1))
+            state["page"] += 1
+            state["used"] = 0.0
+
+        def place(flowable) -> float:
+            """Place one flowable, starting pages as needed; returns the height consumed"""
+            consumed = 0.0
+            queue = [flowable]
+            while queue:
+                item = queue.pop(0)
+                at_top = state["used"] == 0
+                space_before = 0 if at_top else item.getSpaceBefore()
+                available = frame_height - state["used"] - space_before
+
+                if isinstance(item, KeepTogether):
+                    content = [f for f in item._content if f is not None]
+                    needed = sum(measure(f) + f.getSpaceBefore() + f.getSpaceAfter() for f in content)
+                    needed -= content[0].getSpaceBefore() + content[-1].getSpaceAfter() if content else 0
+                    if needed > frame_height - state["used"] and not at_top:
+                        new_page()
+                    queue[:0] = content
+                    continue
+
+                height = measure(item)
+                if height > available and not at_top:
+                    parts = item.split(width, available) if available > 0 else []
+                    if parts:
+                        queue[:0] = parts
+                    else:
+                        new_page()
+                        queue.insert(0, item)
+                    continue
+
+                # Fits, or is as good as it gets at the top of a page
+                step = space_before + height + item.getSpaceAfter()
+                state["used"] += step
+                consumed += step
+            return consumed
+
+        sections = []
+        for section in self._get_sections():
+            start_page = state["page"]
+            height = sum(place(flowable) for flowable in section["content"])
+            sections.append({
+                "key": section["key"],
+                "title": section["title"],
+                "height": round(height, 1),
+                "start_page": start_page,
+                "end_page": state["page"],
+            })
+
+        return {
+            "pages": state["page"],
+            "frame_height": round(frame_height, 1),
+            "last_page_used": round(min(state["used"], frame_height), 1),
+            "page_whitespace": page_whitespace,
+            "sections": sections,
+        }
+
+    def _auto_fit_candidates(self) -> List[tuple]:
+        """(font_scale, space_scale) layouts from largest to smallest: spacing shrinks first, then fonts"""
+        space_steps = int(round((1 - AUTO_FIT_MIN_SPACE_SCALE) / AUTO_FIT_SPACE_STEP))
+        font_steps = int(round((1 - AUTO_FIT_MIN_FONT_SCALE) / AUTO_FIT_FONT_STEP))
+        candidates = [(1.0, round(1 - step * AUTO_FIT_SPACE_STEP, 3)) for step in range(space_steps + 1)]
+        candidates += [(round(1 - step * AUTO_FIT_FONT_STEP, 3), AUTO_FIT_MIN_SPACE_SCALE) for step in range(1, font_steps + 1)]
+        return candidates
+
+    def fit_layout(self, target_pages: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Apply the largest layout whose PDF fits the page target.
+
+        Binary-searches the auto-fit candidates (see _auto_fit_candidates)
+        with estimate_pages, so each step costs a wrap-only measurement
+        rather than a build. When no layout meets the target, the largest
+        one with the fewest pages is used. If the chosen layout leaves more than
+        AUTO_FIT_MAX_PAGE_WHITESPACE blank at the bottom of a page, the next
+        few smaller layouts are tried for one that does not.
+
+        Args:
+            target_pages: Maximum page count (default: AUTO_FIT_PAGE_TARGETS for the length variant)
+
+        Returns:
+            Dictionary with the chosen font and space scales, the estimated
+            page count, the target, whether it was met and the number of
+            estimates made
+        """
+        target_pages = target_pages or AUTO_FIT_PAGE_TARGETS.get(self.length_variant, AUTO_FIT_PAGE_TARGETS['long'])
+        candidates = self._auto_fit_candidates()
+        estimates = {}
+
+        def estimate(index):
+            if index not in estimates:
+                self._apply_layout_scale(*candidates[index])
+                estimates[index] = self.estimate_pages()
+            return estimates[index]
+
+        page_limit = target_pages
+        if estimate(0)["pages"] > target_pages:
+            # When even the smallest layout misses the target, settle for its page count
+            page_limit = max(target_pages, estimate(len(candidates) - 1)["pages"])
+
+        def fits(index):
+            return estimate(index)["pages"] <= page_limit
+
+        if fits(0):
+            best = 0
+        else:
+            # fits(low) is False and fits(high) is True throughout
+            low, high = 0, len(candidates) - 1
+            while high - low > 1:
+                middle = (low + high) // 2
+                if fits(middle):
+                    high = middle
+                else:
+                    low = middle
+            best = high
+
+        def within_whitespace(index):
+            return max(estimate(index)["page_whitespace"], default=0) <= AUTO_FIT_MAX_PAGE_WHITESPACE
+
+        if fits(best) and not within_whitespace(best):
+            for index in range(best + 1, min(best + 1 + AUTO_FIT_WHITESPACE_RETRIES, len(candidates))):
+                if fits(index) and within_whitespace(index):
+                    best = index
+                    break
+
+        font_scale, space_scale = candidates[best]
+        self._apply_layout_scale(font_scale, space_scale)
+        return {
+            "font_scale": font_scale,
+            "space_scale": space_scale,
+            "pages": estimate(best)["pages"],
+            "target_pages": target_pages,
+            "fits": estimate(best)["pages"] <= target_pages,
+            "estimates": len(estimates),
+        }
+
+    def generate_pdf(self, filename: OutputTarget, auto_fit: bool = False, target_pages: Optional[int] = None,
+                     max_pages: Optional[int] = None, profile: Optional[str] = None) -> OutputTarget:
+        """
+        Generate PDF resume using systematic header/footer approach.
+
+        filename may be a path or a binary file-like object to write into.
+        With max_pages, layout stops once that many pages are complete and
+        the rest of the story is never laid out (used by previews).
+
+        profile names a PDF_PROFILES entry (compression and post-processing),
+        overriding the generator's pdf_profile for this call.
+
+        With auto_fit, fonts and spacing are first shrunk just enough to meet
+        target_pages (see fit_layout); the layout stays applied afterwards.
+        """
+        profile = profile or self.pdf_profile
+        profile_settings = pdf_profile_settings(profile)
+        if auto_fit:
+            self.fit_layout(target_pages)
+
         # SYSTEMATIC APPROACH: Calculate dimensions first
         dimensions = self._calculate_header_footer_dimensions()
         
-        doc = SimpleDocTemplate(filename, pagesize=letter, 
+        # Built in memory so an unchanged file on disk is left alone
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=letter, 
                               rightMargin=MARGIN_RIGHT, leftMargin=MARGIN_LEFT,
                               topMargin=dimensions['top_margin'], 
                               bottomMargin=dimensions['bottom_margin'],
                               # Optimized quality settings for maximum quality within size limits
-                              compress=1,  # Light compression for reasonable file size
+                              pageCompression=profile_settings["compress"],
+                              invariant=1 if self.reproducible else 0,  # Fixed creation date and document ID
                               creator="Resume Generator Pro",
                               title=f"Resume - {self.data.get('personal_info', {}).get('name', 'Professional')}",
                               author=self.data.get('personal_info', {}).get('name', 'Professional'),
@@ -682,7 +816,8 @@ class ResumeGenerator:
         story = []
         
         # Define sections in order
-        sections = self._get_sections()
+        with timing_span("sections", "pdf", self.color_scheme):
+            sections = self._get_sections()
         
         # No additional spacing needed - topMargin already accounts for proper spacing
         # The dimensions calculation ensures consistent spacing across all pages
@@ -694,9 +829,16 @@ class ResumeGenerator:
         
         
         
-        # Build with custom header and footer using systematic approach
-        def add_header(canvas, doc):
-            """Add header with dynamic bar positioning for all pages"""
+        # Header and footer are the same on every page, so they are drawn once
+        # per document into PDF form XObjects and each page only places them.
+        # Link annotations belong to pages, not forms, so their rectangles are
+        # collected while drawing and added per page with the page number.
+        personal_info = self.data.get("personal_info", {})
+        contact_info = self._get_contact_info(personal_info)
+        header_links = []
+        
+        def draw_header(canvas):
+            """Draw the header with dynamic bar positioning"""
             canvas.saveState()
             
             # High quality rendering settings
@@ -704,9 +846,6 @@ class ResumeGenerator:
             canvas.setLineJoin(1)  # Round line joins for smoother lines
             canvas.setLineWidth(1.0)  # Ensure consistent line width
             
-            personal_info = self.data.get("personal_info", {})
-            contact_info = self._get_contact_info(personal_info)
-            
             # Three-cell layout: Email/Phone (left) | Empty (middle) | Name (right)
             name = personal_info.get("name", "NAME")
             email = contact_info.get("email", "")
@@ -784,9 +923,9 @@ class ResumeGenerator:
                 canvas.setFillColor(HexColor(link_color))
                 github_text = github_url.replace('https://', '').replace('http://', '')
                 github_x = left_x + github_label_width
-                # Create clickable link
-                canvas.linkURL(github_url, 
-                             (github_x, austin_y - 2, github_x + canvas.stringWidth(github_text, "Helvetica", FONT_SIZE_9), austin_y + 10))
+                # Clickable link, added to each page
+                header_links.append((github_url,
+                                     (github_x, austin_y - 2, github_x + canvas.stringWidth(github_text, "Helvetica", FONT_SIZE_9), austin_y + 10)))
                 canvas.drawString(github_x, austin_y, github_text)
             
             # Austin, TX with coordinates (aligned with GitHub)
@@ -795,9 +934,9 @@ class ResumeGenerator:
             austin_text = personal_info.get("location_display", personal_info.get("location", ""))
             austin_width = canvas.stringWidth(austin_text, "Helvetica", FONT_SIZE_9)
             austin_x = PAGE_RIGHT_MARGIN - austin_width
-            # Create clickable link to OpenStreetMap
-            canvas.linkURL("https://www.openstreetmap.org/?mlat=30.2672&mlon=-97.7431&zoom=12", 
-                         (austin_x, austin_y - 2, PAGE_RIGHT_MARGIN, austin_y + 10))
+            # Clickable link to OpenStreetMap, added to each page
+            header_links.append(("https://www.openstreetmap.org/?mlat=30.2672&mlon=-97.7431&zoom=12",
+                                 (austin_x, austin_y - 2, PAGE_RIGHT_MARGIN, austin_y + 10)))
             canvas.drawRightString(PAGE_RIGHT_MARGIN, austin_y, austin_text)
             
             # Add horizontal bar separator - simple: one line height below lowest text
@@ -807,11 +946,9 @@ class ResumeGenerator:
             canvas.line(PAGE_LEFT_MARGIN, bar_y, PAGE_RIGHT_MARGIN, bar_y)
             
             canvas.restoreState()
-            add_footer(canvas, doc)
-        
         
-        def add_footer(canvas, doc):
-            """Add footer with two-cell structure and dynamic bar positioning"""
+        def draw_footer(canvas):
+            """Draw the footer's two-cell structure and bar; the page number is drawn per page"""
             canvas.saveState()
             
             # High quality rendering settings
@@ -819,9 +956,6 @@ class ResumeGenerator:
             canvas.setLineJoin(1)  # Round line joins for smoother lines
             canvas.setLineWidth(1.0)  # Ensure consistent line width
             
-            personal_info = self.data.get("personal_info", {})
-            contact_info = self._get_contact_info(personal_info)
-            
             canvas.setFont("Helvetica", FONT_SIZE_8)
             footer_y = FOOTER_Y
             
@@ -851,7 +985,7 @@ class ResumeGenerator:
                     
                     # Link in different color (use medium text color for contrast)
                     canvas.setFillColor(HexColor(self.config.get("MEDIUM_TEXT_COLOR", "#666666")))
-                    canvas.linkURL(website_url, (current_x, footer_y - FOOTER_LINK_OFFSET, current_x + len(website_url)*FOOTER_LINK_OFFSET, footer_y + FOOTER_LINK_OFFSET*2))
+                    header_links.append((website_url, (current_x, footer_y - FOOTER_LINK_OFFSET, current_x + len(website_url)*FOOTER_LINK_OFFSET, footer_y + FOOTER_LINK_OFFSET*2)))
                     canvas.drawString(current_x, footer_y, website_url)
                     current_x += canvas.stringWidth(website_url, "Helvetica", FONT_SIZE_8)
                 
@@ -869,583 +1003,215 @@ class ResumeGenerator:
                     
                     # Link in different color (use medium text color for contrast)
                     canvas.setFillColor(HexColor(self.config.get("MEDIUM_TEXT_COLOR", "#666666")))
-                    canvas.linkURL(linkedin_url, (current_x, footer_y - FOOTER_LINK_OFFSET, current_x + len(linkedin_url)*FOOTER_LINK_OFFSET, footer_y + FOOTER_LINK_OFFSET*2))
+                    header_links.append((linkedin_url, (current_x, footer_y - FOOTER_LINK_OFFSET, current_x + len(linkedin_url)*FOOTER_LINK_OFFSET, footer_y + FOOTER_LINK_OFFSET*2)))
                     canvas.drawString(current_x, footer_y, linkedin_url)
             
-            # Right cell: Page number
-            canvas.setFillColor(HexColor(self.config.get("ACCENT_COLOR", "#4682B4")))
-            page_num = canvas.getPageNumber()
-            canvas.drawRightString(PAGE_RIGHT_MARGIN, footer_y, f"Page {page_num}")
+            canvas.restoreState()
+        
+        page_number_color = HexColor(self.config.get("ACCENT_COLOR", "#4682B4"))
+        
+        def add_header(canvas, doc):
+            """Place the header and footer forms on a page, then its links and page number"""
+            if not canvas.hasForm("ResumeHeader"):
+                # First page: record both forms (and the links they need)
+                canvas.beginForm("ResumeHeader")
+                draw_header(canvas)
+                canvas.endForm()
+                canvas.beginForm("ResumeFooter")
+                draw_footer(canvas)
+                canvas.endForm()
+            canvas.doForm("ResumeHeader")
+            canvas.doForm("ResumeFooter")
             
+            for url, rect in header_links:
+                canvas.linkURL(url, rect)
+            
+            # Right cell of the footer: Page number
+            canvas.saveState()
+            canvas.setFont("Helvetica", FONT_SIZE_8)
+            canvas.setFillColor(page_number_color)
+            canvas.drawRightString(PAGE_RIGHT_MARGIN, FOOTER_Y, f"Page {canvas.getPageNumber()}")
             canvas.restoreState()
         
-        doc.build(story, onFirstPage=add_header, onLaterPages=add_header)
+        def timed_header(canvas, doc):
+            with timing_span("header", "pdf", self.color_scheme):
+                add_header(canvas, doc)
+        
+        if max_pages is not None:
+            def after_page():
+                # build consumes story in place, so emptying it ends the build after this page
+                if doc.page >= max_pages:
+                    del story[:]
+            doc.afterPage = after_page
+        
+        # Layout and writing the file both happen inside build
+        with timing_span("build", "pdf", self.color_scheme):
+            doc.build(story, onFirstPage=timed_header, onLaterPages=timed_header)
+        with timing_span("save", "pdf", self.color_scheme):
+            _write_output(filename, _apply_pdf_profile(buffer.getvalue(), profile))
         return filename
     
-    def _process_docx_highlights(self, doc, text):
-        """Process DOCX metric highlighting markers and apply formatting"""
-        if "**METRIC_HIGHLIGHT_START**" not in text:
-            return doc.add_paragraph(text)
-        
-        # Split text by highlighting markers
-        parts = text.split("**METRIC_HIGHLIGHT_START**")
-        p = doc.add_paragraph()
-        
-        # Add first part (before any highlights)
-        if parts[0]:
-            p.add_run(parts[0])
-        
-        # Process highlighted parts
-        for part in parts[1:]:
-            if "**METRIC_HIGHLIGHT_END**" in part:
-                highlight_text, remaining = part.split("**METRIC_HIGHLIGHT_END**", 1)
-                # Add highlighted text with bold formatting and color
-                highlight_run = p.add_run(highlight_text)
-                highlight_run.bold = True
-                try:
-                    # Try to set color (may not work in all DOCX viewers)
-                    from docx.shared import RGBColor
-                    highlight_run.font.color.rgb = RGBColor(44, 62, 80)  # #2C3E50
-                except:
-                    pass  # Color setting failed, just use bold
-                # Add remaining text
-                if remaining:
-                    p.add_run(remaining)
-            else:
-                p.add_run(part)
-        
-        return p
-
-    def generate_docx(self, filename: str) -> str:
-        """Generate DOCX resume with high quality settings"""
-        doc = Document()
+    def generate_docx(self, filename: OutputTarget) -> OutputTarget:
+        """Generate DOCX resume with high quality settings into a path or binary stream"""
+        # Copy of the process-wide base document (fixed properties set, heading styles resolved)
+        doc = new_document()
+        document = self._get_document()
+        colors = self.config if self.config else {}
         
-        # High quality DOCX settings
         doc.core_properties.title = f"Resume - {self.data.get('personal_info', {}).get('name', 'Professional')}"
         doc.core_properties.author = self.data.get('personal_info', {}).get('name', 'Professional')
-        doc.core_properties.creator = "Resume Generator Pro"
-        doc.core_properties.subject = "Professional Resume"
-        doc.core_properties.keywords = "resume, professional, career"
-        doc.core_properties.comments = "Generated by Resume Generator Pro"
-        
-        # Personal info
-        personal_info = self.data.get("personal_info", {})
-        contact_info = self._get_contact_info(personal_info)
         
         # Name
         name_para = doc.add_paragraph()
-        name_run = name_para.add_run(personal_info.get("name", "NAME"))
+        name_run = name_para.add_run(document.name)
         name_run.font.size = Inches(0.2)  # Keep this as it's a reasonable size for DOCX
         name_run.font.bold = True
         name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         # Contact info
-        contact_parts = []
-        if contact_info.get("phone"):
-            contact_parts.append(contact_info["phone"])
-        if contact_info.get("email"):
-            contact_parts.append(contact_info["email"])
-        if contact_info.get("website"):
-            contact_parts.append(contact_info["website"])
-        if contact_info.get("linkedin"):
-            contact_parts.append(contact_info["linkedin"])
-        if contact_info.get("location"):
-            contact_parts.append(contact_info["location"])
-        
+        contact_parts = [value for _, value in document.contact_items()]
         if contact_parts:
             contact_para = doc.add_paragraph(" | ".join(contact_parts))
             contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
-        # Summary
-        summary = self.data.get("summary", "")
-        if summary:
-            doc.add_heading("PROFESSIONAL SUMMARY", level=2)
-            doc.add_paragraph(summary)
-        
-        # CORE COMPETENCIES - Horizontal bullet format
-        competencies = self.data.get("competencies", {})
-        if competencies:
-            competency_categories = []
-            for main_category, sub_skills in competencies.items():
-                if isinstance(sub_skills, list):
-                    competency_categories.append(main_category)
+        for section in document.sections:
+            if section.title:
+                add_heading(doc, section.title.upper(), 2)
             
-            # Single line with bullet separators
-            competency_text = " • ".join(competency_categories)
-            doc.add_heading("CORE COMPETENCIES", level=2)
-            doc.add_paragraph(competency_text)
-        
-        # Experience
-        experience = self.data.get("experience", [])
-        if experience:
-            # Sort experience chronologically (most recent first)
-            experience = self._sort_experience_chronologically(experience)
-            doc.add_heading("PROFESSIONAL EXPERIENCE", level=2)
-            for job in experience:
-                job_title = job.get("title", "")
-                company = job.get("company", "")
-                location = job.get("location", "")
-                dates = job.get("dates", "")
-                
-                title_line = f"{job_title}"
-                if company:
-                    title_line += f" - {company}"
-                if location:
-                    title_line += f" ({location})"
-                if dates:
-                    title_line += f" | {dates}"
-                
-                doc.add_heading(title_line, level=3)
-                
-                if job.get("subtitle"):
-                    doc.add_paragraph(job["subtitle"])
-                
-                responsibilities = job.get("responsibilities", [])
-                for resp in responsibilities:
-                    highlighted_resp = highlight_quantitative_metrics(resp, "docx")
-                    self._process_docx_highlights(doc, f"• {highlighted_resp}")
-        
-        # Projects
-        projects = self.data.get("projects", [])
-        if projects:
-            doc.add_heading("KEY PROJECTS", level=2)
-            for project in projects:
-                project_name = project.get("name", "")
-                dates = project.get("dates", "")
-                description = project.get("description", "")
-                technologies = project.get("technologies", [])
-                impact = project.get("impact", "")
-                
-                title_line = project_name
-                if dates:
-                    title_line += f" ({dates})"
-                
-                doc.add_heading(title_line, level=3)
-                
-                if description:
-                    doc.add_paragraph(description)
-                
-                if technologies:
-                    doc.add_paragraph(f"Technologies: {', '.join(technologies)}")
-                
-                if impact:
-                    doc.add_paragraph(f"Impact: {impact}")
-        
-        # Education
-        education = self.data.get("education", [])
-        if education:
-            doc.add_heading("EDUCATION", level=2)
-            for edu in education:
-                degree = edu.get("degree", "")
-                institution = edu.get("institution", "")
-                location = edu.get("location", "")
-                dates = edu.get("dates", "")
-                gpa = edu.get("gpa", "")
-                honors = edu.get("honors", "")
-                
-                title_line = degree
-                if institution:
-                    title_line += f" - {institution}"
-                if location:
-                    title_line += f" ({location})"
-                if dates:
-                    title_line += f" | {dates}"
-                
-                doc.add_heading(title_line, level=3)
-                
-                if gpa:
-                    doc.add_paragraph(f"GPA: {gpa}")
-                
-                if honors:
-                    doc.add_paragraph(f"Honors: {honors}")
-        
-        # Achievements
-        achievements = self.data.get("achievements", {})
-        if achievements:
-            doc.add_heading("KEY ACHIEVEMENTS AND IMPACT", level=2)
-            for category, achievement_list in achievements.items():
-                if isinstance(achievement_list, list):
-                    doc.add_heading(category, level=3)
-                    for achievement in achievement_list:
-                        highlighted_achievement = highlight_quantitative_metrics(achievement, "docx")
-                        self._process_docx_highlights(doc, f"• {highlighted_achievement}")
-        
-        # Technical Skills (moved to end like Deepak)
-        competencies = self.data.get("competencies", {})
-        if competencies:
-            doc.add_heading("TECHNICAL SKILLS", level=2)
-            for main_category, sub_skills in competencies.items():
-                if isinstance(sub_skills, list):
-                    # Technical skills - format as Deepak does with specific technologies
-                    skill_text = "; ".join([skill.split(": ")[0] if ": " in skill else skill for skill in sub_skills])
-                    doc.add_paragraph(f"{main_category.upper()} {skill_text}")
-        
-        # Additional info for abbreviated versions
-        additional_info = self.data.get("additional_info", "")
-        if additional_info:
-            doc.add_paragraph(additional_info)
-        
-        doc.save(filename)
+            for block in section.blocks:
+                if block.kind == "text":
+                    add_docx_runs(doc.add_paragraph(), block.spans, colors)
+                elif block.kind == "list":
+                    if block.title:
+                        add_heading(doc, block.title, 3)
+                    for item in block.items:
+                        add_docx_runs(doc.add_paragraph(), [span("• ")] + item, colors)
+                else:
+                    add_heading(doc, plain_text(block.heading), 3)
+                    if block.subtitle:
+                        doc.add_paragraph(block.subtitle)
+                    for detail in block.details:
+                        add_docx_runs(doc.add_paragraph(), detail, colors)
+                    for bullet in block.bullets:
+                        add_docx_runs(doc.add_paragraph(), [span("• ")] + bullet, colors)
+        
+        if self.reproducible:
+            doc.core_properties.created = REPRODUCIBLE_TIMESTAMP
+            doc.core_properties.modified = REPRODUCIBLE_TIMESTAMP
+            doc.core_properties.revision = 1
+        
+        with timing_span("save", "docx", self.color_scheme):
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            # python-docx stamps every zip member with the current time
+            data = _normalize_zip(buffer.getvalue()) if self.reproducible else buffer.getvalue()
+            _write_output(filename, data)
         return filename
     
-    def generate_rtf(self, filename: str) -> str:
-        """Generate RTF resume"""
+    def generate_rtf(self, filename: OutputTarget) -> OutputTarget:
+        """Generate RTF resume into a path or binary stream"""
         # RTF is a text format, so we'll create a simple text version
         content = []
+        document = self._get_document()
         
         # Personal info
-        personal_info = self.data.get("personal_info", {})
-        contact_info = self._get_contact_info(personal_info)
-        content.append(f"\\b {personal_info.get('name', 'NAME')}\\b0")
+        content.append(f"\\b {document.name}\\b0")
         content.append("")
         
         # Contact info
-        contact_parts = []
-        if contact_info.get("phone"):
-            contact_parts.append(contact_info["phone"])
-        if contact_info.get("email"):
-            contact_parts.append(contact_info["email"])
-        if contact_info.get("website"):
-            contact_parts.append(contact_info["website"])
-        if contact_info.get("linkedin"):
-            contact_parts.append(contact_info["linkedin"])
-        if contact_info.get("location"):
-            contact_parts.append(contact_info["location"])
-        
+        contact_parts = [value for _, value in document.contact_items()]
         if contact_parts:
             content.append(" | ".join(contact_parts))
         
         content.append("")
         
-        # Summary
-        summary = self.data.get("summary", "")
-        if summary:
-            content.append("\\b PROFESSIONAL SUMMARY\\b0")
-            content.append(summary)
-            content.append("")
-        
-        # Achievements (moved to top)
-        achievements = self.data.get("achievements", {})
-        if achievements:
-            content.append("\\b KEY ACHIEVEMENTS AND IMPACT\\b0")
-            for category, achievement_list in achievements.items():
-                if isinstance(achievement_list, list):
-                    content.append(f"\\b {category}\\b0")
-                    for achievement in achievement_list:
-                        highlighted_achievement = highlight_quantitative_metrics(achievement, "rtf")
-                        content.append(f"• {highlighted_achievement}")
+        for section in document.sections:
+            if section.title:
+                content.append(f"\\b {section.title.upper()}\\b0")
+            
+            for block in section.blocks:
+                if block.kind == "text":
+                    content.append(spans_to_rtf(block.spans))
+                elif block.kind == "list":
+                    if block.title:
+                        content.append(f"\\b {block.title}\\b0")
+                    for item in block.items:
+                        content.append(f"• {spans_to_rtf(item)}")
+                else:
+                    content.append(f"\\b {plain_text(block.heading)}\\b0")
+                    if block.subtitle:
+                        content.append(block.subtitle)
+                    for detail in block.details:
+                        content.append(spans_to_rtf(detail))
+                    for bullet in block.bullets:
+                        content.append(f"• {spans_to_rtf(bullet)}")
                     content.append("")
-            content.append("")
-        
-        # Additional info for abbreviated versions
-        additional_info = self.data.get("additional_info", "")
-        if additional_info:
-            if isinstance(additional_info, list):
-                for info in additional_info:
-                    content.append(info)
-            else:
-                content.append(additional_info)
-            content.append("")
-        
-        # CORE COMPETENCIES - Space-efficient skills section
-        competencies = self.data.get("competencies", {})
-        if competencies:
-            content.append("\\b CORE COMPETENCIES\\b0")
-            for category, skills in competencies.items():
-                if isinstance(skills, list):
-                    content.append(f"• {category}")
-            content.append("")
             
-            content.append("\\b TECHNICAL SKILLS\\b0")
-            for category, skills in competencies.items():
-                if isinstance(skills, list):
-                    if category.upper() in ["CODE", "COMPUTE", "INTERACT", "MEASURE", "PLATFORMS", "TRACK"]:
-                        # Technical skills - format as Deepak does
-                        skill_text = "; ".join([str(skill).split(": ")[0] if ": " in str(skill) else str(skill) for skill in skills if isinstance(skill, str)])
-                        content.append(f"\\b {category.upper()}\\b0 {skill_text}")
-                    else:
-                        # Other skills - format as bullet points
-                        for skill in skills:
-                            if isinstance(skill, str):
-                                skill_name = skill.split(": ")[0] if ": " in skill else skill
-                                content.append(f"• {skill_name}")
             content.append("")
         
-        # Experience
-        experience = self.data.get("experience", [])
-        if experience:
-            # Sort experience chronologically (most recent first)
-            experience = self._sort_experience_chronologically(experience)
-            content.append("\\b PROFESSIONAL EXPERIENCE\\b0")
-            for job in experience:
-                job_title = job.get("title", "")
-                company = job.get("company", "")
-                location = job.get("location", "")
-                dates = job.get("dates", "")
-                
-                title_line = f"{job_title}"
-                if company:
-                    title_line += f" - {company}"
-                if location:
-                    title_line += f" ({location})"
-                if dates:
-                    title_line += f" | {dates}"
-                
-                content.append(f"\\b {title_line}\\b0")
-                
-                if job.get("subtitle"):
-                    content.append(job["subtitle"])
-                
-                responsibilities = job.get("responsibilities", [])
-                for resp in responsibilities:
-                    highlighted_resp = highlight_quantitative_metrics(resp, "rtf")
-                    content.append(f"• {highlighted_resp}")
-                
-                content.append("")
-        
-        # Projects
-        projects = self.data.get("projects", [])
-        if projects:
-            content.append("\\b KEY PROJECTS\\b0")
-            for project in projects:
-                project_name = project.get("name", "")
-                dates = project.get("dates", "")
-                description = project.get("description", "")
-                technologies = project.get("technologies", [])
-                impact = project.get("impact", "")
-                
-                title_line = project_name
-                if dates:
-                    title_line += f" ({dates})"
-                
-                content.append(f"\\b {title_line}\\b0")
-                
-                if description:
-                    content.append(description)
-                
-                if technologies:
-                    content.append(f"Technologies: {', '.join(technologies)}")
-                
-                if impact:
-                    content.append(f"Impact: {impact}")
-                
-                content.append("")
-        
-        # Education
-        education = self.data.get("education", [])
-        if education:
-            content.append("\\b EDUCATION\\b0")
-            for edu in education:
-                degree = edu.get("degree", "")
-                institution = edu.get("institution", "")
-                location = edu.get("location", "")
-                dates = edu.get("dates", "")
-                gpa = edu.get("gpa", "")
-                honors = edu.get("honors", "")
-                
-                title_line = degree
-                if institution:
-                    title_line += f" - {institution}"
-                if location:
-                    title_line += f" ({location})"
-                if dates:
-                    title_line += f" | {dates}"
-                
-                content.append(f"\\b {title_line}\\b0")
-                
-                if gpa:
-                    content.append(f"GPA: {gpa}")
-                
-                if honors:
-                    content.append(f"Honors: {honors}")
-                
-                content.append("")
-        
-        
         # Write RTF file
         rtf_content = "{\\rtf1\\ansi\\deff0\\par " + "\\par ".join(content) + "\\par }"
         
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(rtf_content)
+        with timing_span("save", "rtf", self.color_scheme):
+            _write_text(filename, rtf_content)
         
         return filename
     
-    def generate_markdown(self, filename: str) -> str:
-        """Generate Markdown resume"""
+    def generate_markdown(self, filename: OutputTarget) -> OutputTarget:
+        """Generate Markdown resume into a path or binary stream"""
         content = []
+        document = self._get_document()
         
         # Personal info
-        personal_info = self.data.get("personal_info", {})
-        contact_info = self._get_contact_info(personal_info)
-        content.append(f"# {personal_info.get('name', 'NAME')}")
+        content.append(f"# {document.name}")
         content.append("")
         
         # Contact information
-        contact_parts = []
-        if contact_info.get('phone'):
-            contact_parts.append(f"**Phone:** {contact_info['phone']}")
-        if contact_info.get('email'):
-            contact_parts.append(f"**Email:** {contact_info['email']}")
-        if contact_info.get('website'):
-            contact_parts.append(f"**Website:** {contact_info['website']}")
-        if contact_info.get('linkedin'):
-            contact_parts.append(f"**LinkedIn:** {contact_info['linkedin']}")
-        if contact_info.get('location'):
-            contact_parts.append(f"**Location:** {contact_info['location']}")
-        
+        labels = {"phone": "Phone", "email": "Email", "website": "Website", "linkedin": "LinkedIn", "location": "Location"}
+        contact_parts = [f"**{labels[key]}:** {value}" for key, value in document.contact_items()]
         if contact_parts:
             content.append(" | ".join(contact_parts))
             content.append("")
         
-        # Summary
-        summary = self.data.get("summary", "")
-        if summary:
-            content.append("## Professional Summary")
-            content.append("")
-            content.append(summary)
-            content.append("")
-        
-        # Achievements (moved to top)
-        achievements = self.data.get("achievements", {})
-        if achievements:
-            content.append("## Key Achievements and Impact")
-            content.append("")
-            for category, achievement_list in achievements.items():
-                content.append(f"### {category}")
-                if isinstance(achievement_list, list):
-                    for achievement in achievement_list:
-                        highlighted_achievement = highlight_quantitative_metrics(achievement, "md")
-                        content.append(f"- {highlighted_achievement}")
-                content.append("")
-        
-        # Additional info for abbreviated versions
-        additional_info = self.data.get("additional_info", "")
-        if additional_info:
-            if isinstance(additional_info, list):
-                for info in additional_info:
-                    content.append(info)
-            else:
-                content.append(additional_info)
-            content.append("")
-        
-        # CORE COMPETENCIES - Space-efficient skills section
-        competencies = self.data.get("competencies", {})
-        if competencies:
-            content.append("## Core Competencies")
-            content.append("")
-            for category, skills in competencies.items():
-                if isinstance(skills, list):
-                    content.append(f"• **{category}**")
-            content.append("")
-        
-        # Experience (enhanced formatting with visual hierarchy)
-        experience = self.data.get("experience", [])
-        if experience:
-            # Sort experience chronologically (most recent first)
-            experience = self._sort_experience_chronologically(experience)
-            content.append("## Professional Experience")
-            content.append("")
-            for job in experience:
-                # Job title: ### header (like primary color)
-                content.append(f"### {job.get('title', '')}")
-                
-                # Company info: **bold** (like accent color)
-                company_info = job.get('company', '')
-                if job.get('location'):
-                    company_info += f" | {job['location']}"
-                if job.get('dates'):
-                    company_info += f" | {job['dates']}"
-                content.append(f"**{company_info}**")
+        for section in document.sections:
+            if section.title:
+                content.append(f"## {section.title}")
                 content.append("")
-                
-                # Subtitle: *italics* (like muted color)
-                if job.get('subtitle'):
-                    content.append(f"*{job['subtitle']}*")
+            
+            for block in section.blocks:
+                if block.kind == "text":
+                    content.append(spans_to_markdown(block.spans))
                     content.append("")
-                
-                # Responsibilities - clean formatting without tech term highlighting
-                responsibilities = job.get('responsibilities', [])
-                if responsibilities:
-                    for resp in responsibilities:
-                        highlighted_resp = highlight_quantitative_metrics(resp, "md")
-                        content.append(f"- {highlighted_resp}")
-                content.append("")
-        
-        # Projects
-        projects = self.data.get("projects", [])
-        if projects:
-            content.append("## Key Projects")
-            content.append("")
-            for project in projects:
-                content.append(f"### {project.get('name', '')}")
-                if project.get('dates'):
-                    content.append(f"*{project['dates']}*")
+                elif block.kind == "list":
+                    if block.title:
+                        content.append(f"### {block.title}")
+                    for item in block.items:
+                        content.append(f"- {spans_to_markdown(item)}")
                     content.append("")
-                if project.get('description'):
-                    content.append(f"{project['description']}")
+                else:
+                    content.append(f"### {spans_to_markdown(block.heading)}")
+                    if block.subtitle:
+                        content.append(f"*{block.subtitle}*")
+                        content.append("")
+                    for detail in block.details:
+                        content.append(spans_to_markdown(detail))
+                    for bullet in block.bullets:
+                        content.append(f"- {spans_to_markdown(bullet)}")
                     content.append("")
-                if project.get('technologies'):
-                    content.append(f"**Technologies:** {', '.join(project['technologies'])}")
-                if project.get('impact'):
-                    content.append(f"**Impact:** {project['impact']}")
-                content.append("")
-        
-        # Education
-        education = self.data.get("education", [])
-        if education:
-            content.append("## Education")
-            content.append("")
-            for edu in education:
-                content.append(f"### {edu.get('degree', '')}")
-                institution_info = edu.get('institution', '')
-                if edu.get('location'):
-                    institution_info += f" | {edu['location']}"
-                if edu.get('dates'):
-                    institution_info += f" | {edu['dates']}"
-                content.append(f"**{institution_info}**")
-                if edu.get('gpa'):
-                    content.append(f"**GPA:** {edu['gpa']}")
-                if edu.get('honors'):
-                    content.append(f"**Honors:** {edu['honors']}")
-                content.append("")
-        
-        
-        # Technical Skills (moved here from after file write)
-        competencies = self.data.get("competencies", {})
-        if competencies:
-            content.append("## Technical Skills")
-            content.append("")
-            for category, skills in competencies.items():
-                if isinstance(skills, list):
-                    # Show detailed skills with descriptions for all categories
-                    for skill in skills:
-                        if isinstance(skill, str):
-                            content.append(f"• **{skill}**")
-            content.append("")
         
-        # Footer with contact information
+        # Footer with contact information, similar to the PDF footer
         content.append("---")
         content.append("")
         
-        # Add footer contact info similar to PDF footer
-        personal_info = self.data.get("personal_info", {})
-        contact_info = self._get_contact_info(personal_info)
-        footer_parts = []
-        
-        if contact_info.get("website"):
-            footer_parts.append(f"**Website:** {contact_info['website']}")
-        if contact_info.get("linkedin"):
-            footer_parts.append(f"**LinkedIn:** {contact_info['linkedin']}")
-            
+        footer_parts = [f"**{labels[key]}:** {value}" for key, value in document.contact_items(("website", "linkedin"))]
         if footer_parts:
             content.append(" | ".join(footer_parts))
         
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write("\n".join(content))
+        with timing_span("save", "md", self.color_scheme):
+            _write_text(filename, "\n".join(content))
         
         return filename
 
-
 class ResumeManager:
     """Manages resume generation with color schemes and formats"""
     
@@ -1481,15 +1247,8 @@ class ResumeManager:
         
         self.formats = ["pdf", "docx", "rtf", "md"]
     
-    def generate_single_resume(self, version: str, color_scheme: str, format_type: str, output_dir: str = "outputs", length_variant: str = "long", output_type: str = "ats") -> bool:
-        """Generate a single resume with specified parameters"""
-        if version not in self.versions:
-            return False
-        
-        if length_variant not in self.length_variants:
-            return False
-        
-        # Determine input directory based on length variant and output type
+    def _input_dir(self, version: str, length_variant: str, output_type: str) -> Path:
+        """Input directory for a version, based on length variant and output type"""
         input_basename = self.versions[version]
         if output_type == "human":
             input_basename += "_human"
@@ -1498,71 +1257,315 @@ class ResumeManager:
         elif length_variant == "brief":
             input_basename += "_brief"
         
-        input_dir = Path("inputs") / input_basename
+        return Path("inputs") / input_basename
+    
+    def _config_file(self, input_dir: Path, color_scheme: str) -> Optional[Path]:
+        """Config used for rendering: the shared color scheme file, else the input's config.json"""
+        color_scheme_file = Path("color_schemes") / f"{color_scheme}.json"
+        if color_scheme_file.exists():
+            return color_scheme_file
+        config_file = input_dir / "config.json"
+        return config_file if config_file.exists() else None
+    
+    def _create_generator(self, input_dir: Path, color_scheme: str, length_variant: str, output_type: str,
+                          pdf_profile: str = DEFAULT_PDF_PROFILE) -> ResumeGenerator:
+        """Create a reproducible generator for an input directory, preferring the shared color scheme file"""
+        data_file = input_dir / "resume_data.json"
+        config_file = self._config_file(input_dir, color_scheme)
+        # Batch outputs are committed and skipped when unchanged, so they must be byte-stable
+        return ResumeGenerator(str(data_file), str(config_file) if config_file else None, color_scheme, length_variant, output_type,
+                               reproducible=True, pdf_profile=pdf_profile)
+    
+    def _output_file(self, output_dir: str, version: str, length_variant: str, color_scheme: str, output_type: str, format_type: str) -> Path:
+        """Path of one artifact: output_type/version/length/color_scheme/format/filename"""
+        basename = f"dheeraj_chand_{version}_{length_variant}_{color_scheme}"
+        return Path(output_dir) / output_type / version / length_variant / color_scheme / format_type / f"{basename}.{format_type}"
+    
+    def generate_single_resume(self, version: str, color_scheme: str, format_type: str, output_dir: str = "outputs", length_variant: str = "long", output_type: str = "ats") -> bool:
+        """Generate a single resume with specified parameters"""
+        if format_type not in self.formats:
+            return False
+        
+        results = self.generate_resume_formats(version, color_scheme, [format_type], output_dir, length_variant, output_type)
+        return results[format_type]
+    
+    def generate_resume_formats(self, version: str, color_scheme: str, formats: List[str], output_dir: str = "outputs", length_variant: str = "long", output_type: str = "ats",
+                                profiles: Optional[Dict[str, Dict]] = None, timings: Optional[Dict[str, float]] = None,
+                                pdf_profile: str = DEFAULT_PDF_PROFILE) -> Dict[str, bool]:
+        """
+        Generate several formats of one resume from a single ResumeGenerator.
+        
+        With profiles, generator setup (data load and styles) is profiled as
+        "setup" and each format's render under its format name. With timings,
+        each rendered format's wall time is stored by format. PDFs are written
+        with the named pdf_profile (see PDF_PROFILES).
+        
+        Returns:
+            Dictionary mapping each requested format to whether it was generated
+        """
+        results = {format_type: False for format_type in formats}
+        
+        if version not in self.versions:
+            return results
+        
+        if length_variant not in self.length_variants:
+            return results
+        
+        input_dir = self._input_dir(version, length_variant, output_type)
         
         if not input_dir.exists():
-            return False
+            return results
         
-        data_file = input_dir / "resume_data.json"
-        config_file = input_dir / "config.json"
+        if not (input_dir / "resume_data.json").exists():
+            return results
         
-        if not data_file.exists():
-            return False
+        label = f"{version} {color_scheme} {'/'.join(formats)}"
         
         try:
-            # Load color scheme
-            color_scheme_file = Path("color_schemes") / f"{color_scheme}.json"
-            if color_scheme_file.exists():
-                generator = ResumeGenerator(str(data_file), str(color_scheme_file), color_scheme, length_variant, output_type)
+            if profiles is None:
+                generator = self._create_generator(input_dir, color_scheme, length_variant, output_type, pdf_profile)
             else:
-                generator = ResumeGenerator(str(data_file), str(config_file) if config_file.exists() else None, color_scheme, length_variant, output_type)
-            
-            # Create output directory using the correct structure: output_type/version/length/color_scheme/format
-            base_output_dir = Path(output_dir) / output_type
-            output_path = base_output_dir / version / length_variant / color_scheme / format_type
-            output_path.mkdir(parents=True, exist_ok=True)
+                generator, profiles["setup"] = profile_call(self._create_generator, input_dir, color_scheme, length_variant, output_type,
+                                                            pdf_profile)
             
-            # Generate file
-            filename = output_path / f"dheeraj_chand_{version}_{length_variant}_{color_scheme}.{format_type}"
+            # Output structure: output_type/version/length/color_scheme/format
+            output_file = self._output_file(output_dir, version, length_variant, color_scheme, output_type, formats[0])
+            output_path = output_file.parent.parent
             
-            if format_type == "pdf":
-                generator.generate_pdf(str(filename))
-            elif format_type == "docx":
-                generator.generate_docx(str(filename))
-            elif format_type == "rtf":
-                generator.generate_rtf(str(filename))
-            elif format_type == "md":
-                generator.generate_markdown(str(filename))
-            else:
-                return False
+            written = generator.generate_many(formats, str(output_path), output_file.stem, format_subdirs=True, profiles=profiles,
+                                              timings=timings)
+            for format_type in written:
+                results[format_type] = True
             
-            return True
+            return results
             
         except FileNotFoundError as e:
-            print(f"ERROR: Input file not found for {version} {color_scheme} {format_type}: {e}")
-            return False
+            print(f"ERROR: Input file not found for {label}: {e}")
+            return results
         except PermissionError as e:
-            print(f"ERROR: Permission denied for {version} {color_scheme} {format_type}: {e}")
-            return False
+            print(f"ERROR: Permission denied for {label}: {e}")
+            return results
         except ValueError as e:
-            print(f"ERROR: Invalid data for {version} {color_scheme} {format_type}: {e}")
-            return False
+            print(f"ERROR: Invalid data for {label}: {e}")
+            return results
         except Exception as e:
-            print(f"ERROR: Unexpected error generating {version} {color_scheme} {format_type}: {e}")
+            print(f"ERROR: Unexpected error generating {label}: {e}")
             print(f"ERROR: Exception type: {type(e).__name__}")
-            return False
+            return results
     
-    def generate_all_combinations(self, output_dir: str = "outputs", output_type: str = "ats") -> Dict[str, int]:
-        """Generate all combinations of versions, lengths, color schemes, and formats"""
-        results = {"success": 0, "failed": 0}
-        
-        for version in self.versions:
-            for length_variant in self.length_variants:
-                for color_scheme in self.color_schemes:
-                    for format_type in self.formats:
-                        if self.generate_single_resume(version, color_scheme, format_type, output_dir, length_variant, output_type):
-                            results["success"] += 1
-                        else:
-                            results["failed"] += 1
+    def estimate_pages(self, version: str, color_scheme: str, length_variant: str = "long", output_type: str = "ats") -> Dict[str, Any]:
+        """Predicted PDF page count and section heights for one resume (see ResumeGenerator.estimate_pages)"""
+        if version not in self.versions:
+            raise ValueError(f"Unknown version: {version}")
+        input_dir = self._input_dir(version, length_variant, output_type)
+        return self._create_generator(input_dir, color_scheme, length_variant, output_type).estimate_pages()
+    
+    def _combination_tasks(self, output_dir: str, output_type: str) -> List[tuple]:
+        """List every (version, length, scheme) render group in matrix order"""
+        return [
+            (version, length_variant, color_scheme, tuple(self.formats), output_dir, output_type)
+            for version in self.versions
+            for length_variant in self.length_variants
+            for color_scheme in self.color_schemes
+        ]
+
+    def _stale_formats(self, manifest: BuildManifest, task: tuple, force: bool = False, pdf_profile: str = DEFAULT_PDF_PROFILE,
+                       check_files: bool = True):
+        """
+        Find the formats of one render group whose recorded input hash no longer matches.
+        
+        A non-default pdf_profile is part of the inputs, so switching profiles
+        re-renders the group. With check_files off, an artifact missing from
+        disk still counts as current if the manifest records it (shard
+        planning must not depend on a node's local outputs).
+        
+        Returns:
+            Tuple of (formats to render, input hash), with a None hash when the
+            group's input data is missing
+        """
+        version, length_variant, color_scheme, formats, output_dir, output_type = task
+        input_dir = self._input_dir(version, length_variant, output_type)
+        data_file = input_dir / "resume_data.json"
         
+        if not data_file.exists():
+            # Leave missing inputs in the plan so they are reported as failures
+            return formats, None
+        
+        variant = f"pdf_profile={pdf_profile}" if pdf_profile != DEFAULT_PDF_PROFILE else ""
+        input_hash = manifest.input_hash(data_file, self._config_file(input_dir, color_scheme), variant)
+        is_current = manifest.is_current if check_files else manifest.is_recorded
+        stale = tuple(
+            format_type for format_type in formats
+            if force or not is_current(
+                self._output_file(output_dir, version, length_variant, color_scheme, output_type, format_type),
+                input_hash,
+            )
+        )
+        return stale, input_hash
+
+    def _plan_tasks(self, manifest: BuildManifest, output_dir: str, output_type: str, force: bool = False,
+                    groups: Optional[List[tuple]] = None, pdf_profile: str = DEFAULT_PDF_PROFILE):
+        """
+        Drop artifacts whose recorded input hash still matches from the render matrix.
+        
+        Args:
+            groups: Render groups to plan (default: the whole matrix)
+        
+        Returns:
+            Tuple of (tasks still to render, input hash per group, number of skipped artifacts)
+        """
+        tasks = []
+        input_hashes = {}
+        skipped = 0
+        
+        for task in groups if groups is not None else self._combination_tasks(output_dir, output_type):
+            stale, input_hash = self._stale_formats(manifest, task, force, pdf_profile)
+            if input_hash is not None:
+                input_hashes[task[:3]] = input_hash
+            skipped += len(task[3]) - len(stale)
+            if stale:
+                tasks.append(task[:3] + (stale,) + task[4:])
+        
+        return tasks, input_hashes, skipped
+
+    def generate_all_combinations(self, output_dir: str = "outputs", output_type: str = "ats", workers: int = 1,
+                                  on_result: Optional[Callable[[tuple, bool], None]] = None,
+                                  force: bool = False, profiler: Optional[RenderProfiler] = None,
+                                  shard: Optional[Tuple[int, int]] = None, pdf_profile: str = DEFAULT_PDF_PROFILE) -> Dict[str, Any]:
+        """Generate all combinations of versions, lengths, color schemes, and formats
+
+        Each (version, length, scheme) group renders every format from one
+        ResumeGenerator, so data loading and style creation happen once per group.
+        Artifacts whose inputs are unchanged since the last run (according to
+        output_dir/.manifest.json) are skipped unless force is set.
+
+        With shard=(i, n) only the i-th of n cost-balanced slices of the
+        matrix is rendered (see sharding.py) and recorded into that shard's
+        partial manifest instead of the main one; merge_shard_manifests
+        combines the partials once every shard has run.
+
+        Args:
+            output_dir: Root directory for generated files
+            output_type: "ats" or "human"
+            workers: Number of worker processes (1 renders in-process, 0 uses every core)
+            on_result: Optional callback receiving (task, success) for each rendered file, in matrix order
+            force: Rebuild every artifact regardless of the manifest
+            profiler: If given, every render is profiled and aggregated into it
+            shard: (index, count) with a 1-based index, to render one shard of the matrix
+            pdf_profile: Named PDF_PROFILES entry every PDF is written with
+
+        Returns:
+            Dictionary with success/failed/skipped counts and the failed tasks in
+            matrix order, identical regardless of the number of workers
+        """
+        pdf_profile_settings(pdf_profile)
+        manifest = BuildManifest.for_output_dir(output_dir)
+        groups = None
+        record_manifest = manifest
+        if shard is not None:
+            index, count = shard
+            groups = plan_shards(self, manifest, self._combination_tasks(output_dir, output_type), count,
+                                 force, pdf_profile=pdf_profile)[index - 1]["groups"]
+            record_manifest = BuildManifest.for_shard(output_dir, index, count)
+            # Artifacts this shard skips stay listed in its manifest
+            for version, length_variant, color_scheme, formats, _, _ in groups:
+                for format_type in formats:
+                    record_manifest.copy_entry(manifest, self._output_file(output_dir, version, length_variant, color_scheme, output_type, format_type))
+        tasks, input_hashes, skipped = self._plan_tasks(manifest, output_dir, output_type, force, groups, pdf_profile)
+        workers = workers or os.cpu_count() or 1
+
+        profile = profiler is not None
+        
+        if workers > 1 and len(tasks) > 1:
+            with render_pool(workers) as pool:
+                # imap() yields in submission order, keeping results deterministic
+                reports = pool.imap(partial(_pool_render_group, profile=profile, pdf_profile=pdf_profile), tasks)
+                outcomes = (absorb_worker_report(report, profiler) for report in reports)
+                results = self._collect_results(tasks, outcomes, on_result, record_manifest, input_hashes)
+        else:
+            def render(task):
+                profiles = {} if profile else None
+                timings = {}
+                group_results = _render_group(task, self, profiles, timings, pdf_profile)
+                if profile:
+                    profiler.add_all(profiles)
+                return group_results, timings
+            
+            outcomes = (render(task) for task in tasks)
+            results = self._collect_results(tasks, outcomes, on_result, record_manifest, input_hashes)
+
+        results["skipped"] = skipped
+        record_manifest.save()
         return results
+
+    def _collect_results(self, tasks: List[tuple], outcomes, on_result, manifest: Optional[BuildManifest] = None,
+                         input_hashes: Optional[Dict[tuple, str]] = None) -> Dict[str, Any]:
+        """Tally per-format (results, timings) render outcomes in task order, recording successes in the manifest"""
+        results = {"success": 0, "failed": 0, "failures": []}
+
+        for group, (group_results, timings) in zip(tasks, outcomes):
+            version, length_variant, color_scheme, formats, output_dir, output_type = group
+            for format_type in formats:
+                task = (version, length_variant, color_scheme, format_type, output_dir, output_type)
+                success = group_results[format_type]
+                if success:
+                    results["success"] += 1
+                    if manifest is not None and group[:3] in input_hashes:
+                        output_file = self._output_file(output_dir, version, length_variant, color_scheme, output_type, format_type)
+                        manifest.record(output_file, input_hashes[group[:3]], timings.get(format_type))
+                else:
+                    results["failed"] += 1
+                    results["failures"].append(task[:4])
+                if on_result:
+                    on_result(task, success)
+
+        return results
+
+
+def render_pool(workers: int):
+    """
+    Process pool for render groups, each worker replaced after WORKER_MAX_TASKS groups.
+
+    multiprocessing.Pool rather than ProcessPoolExecutor, whose
+    max_tasks_per_child deadlocks on Python 3.11 once workers exit with
+    work still queued.
+    """
+    return multiprocessing.Pool(processes=workers, initializer=prewarm_stylesheets, maxtasksperchild=WORKER_MAX_TASKS)
+
+
+def _render_group(task: tuple, manager: Optional[ResumeManager] = None,
+                  profiles: Optional[Dict[str, Dict]] = None, timings: Optional[Dict[str, float]] = None,
+                  pdf_profile: str = DEFAULT_PDF_PROFILE) -> Dict[str, bool]:
+    """Render every format of one matrix group; module-level so process pools can pickle it"""
+    version, length_variant, color_scheme, formats, output_dir, output_type = task
+    manager = manager or ResumeManager()
+    return manager.generate_resume_formats(version, color_scheme, list(formats), output_dir, length_variant, output_type,
+                                           profiles=profiles, timings=timings, pdf_profile=pdf_profile)
+
+
+def _pool_render_group(task: tuple, profile: bool = False, pdf_profile: str = DEFAULT_PDF_PROFILE) -> tuple:
+    """
+    Worker-process entry point: render one group and report back what the parent aggregates.
+
+    Returns:
+        (results, render seconds by format, {label: raw cProfile stats} or None,
+        span metrics recorded by this task)
+    """
+    profiles = {} if profile else None
+    timings = {}
+    results = _render_group(task, profiles=profiles, timings=timings, pdf_profile=pdf_profile)
+    return results, timings, profiles, metrics_registry.drain()
+
+
+def absorb_worker_report(report: tuple, profiler: Optional[RenderProfiler] = None) -> Tuple[Dict[str, bool], Dict[str, float]]:
+    """
+    Merge a _pool_render_group report into this process's metrics (and profiler).
+
+    Returns:
+        (render results, render seconds by format)
+    """
+    results, timings, profiles, metrics_state = report
+    metrics_registry.merge(metrics_state)
+    if profiler is not None and profiles is not None:
+        profiler.add_all(profiles)
+    return results, timings
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Format-Neutral Resume Document Model
+
+ResumeGenerator compiles its resume data once into a ResumeDocument:
+header details plus an ordered list of sections, each holding blocks of
+styled spans. The PDF, DOCX, RTF and Markdown writers are thin backends
+over this model, so sorting, line composition and metric highlighting are
+done once per resume instead of once per format.
+
+A span is a (text, role, url) tuple. The role says what the text is
+(a metric, a link, a label...) and ROLE_STYLES says how it looks; each
+writer turns roles into its own markup.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Any
+
+
+# Span roles
+PLAIN = "plain"
+METRIC = "metric"
+LINK = "link"
+CATEGORY = "category"
+LABEL = "label"
+LABEL_MUTED = "label_muted"
+LABEL_ACCENT = "label_accent"
+SUBCATEGORY = "subcategory"
+SKILL = "skill"
+DETAIL = "detail"
+
+# Role -> (config color key, default color, bold, italic); links are styled by each writer
+ROLE_STYLES = {
+    PLAIN: (None, None, False, False),
+    LINK: (None, None, False, False),
+    METRIC: ("COMPETENCY_HEADER_COLOR", "#2C3E50", True, False),
+    CATEGORY: ("COMPETENCY_HEADER_COLOR", "#2C3E50", True, False),
+    LABEL: ("COMPETENCY_HEADER_COLOR", "#2C3E50", True, False),
+    LABEL_MUTED: ("MEDIUM_TEXT_COLOR", "#666666", True, False),
+    LABEL_ACCENT: ("ACCENT_COLOR", "#4682B4", True, False),
+    SUBCATEGORY: ("ACCENT_COLOR", "#4682B4", False, True),
+    SKILL: ("ACCENT_COLOR", "#4682B4", False, False),
+    DETAIL: ("MEDIUM_TEXT_COLOR", "#666666", False, False),
+}
+
+# Block text styles
+BODY = "body"
+DETAIL_TEXT = "detail"
+
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Order matters - more specific patterns first
+METRIC_PATTERN = re.compile(r'(\$[\d,]+(?:\.\d+)?[KMB]?|±[\d,]+(?:\.\d+)?%|[\d,]+(?:\.\d+)?%|\b\d{1,3}(?:,\d{3})+\b|\b\d+(?:\.\d+)?[KMB]\b|[\d,]+(?:\.\d+)?x)')
+
+# Texts whose spans are kept per process; a full matrix run repeats the same
+# few thousand bullets for every color scheme
+TOKEN_CACHE_SIZE = 4096
+
+# Shown on short and brief resumes in place of the full history
+ADDITIONAL_INFO_TEXT = (
+    "For a more detailed, full description of my experience, please visit my LinkedIn "
+    "(https://www.linkedin.com/in/dheerajchand/) and Personal Site (https://www.dheerajchand.com)."
+)
+
+
+def span(text: str, role: str = PLAIN, url: Optional[str] = None) -> tuple:
+    """Build one span"""
+    return (text, role, url)
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _link_tokens(text: str) -> tuple:
+    spans = []
+    position = 0
+    for match in LINK_PATTERN.finditer(text):
+        if match.start() > position:
+            spans.append(span(text[position:match.start()]))
+        spans.append(span(match.group(1), LINK, match.group(2)))
+        position = match.end()
+    if position < len(text):
+        spans.append(span(text[position:]))
+    return tuple(spans)
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _metric_tokens(text: str) -> tuple:
+    spans = []
+    for text_span in _link_tokens(text):
+        if text_span[1] == LINK:
+            spans.append(text_span)
+            continue
+        # split() with one group alternates plain text and metric matches
+        for index, part in enumerate(METRIC_PATTERN.split(text_span[0])):
+            if part:
+                spans.append(span(part, METRIC if index % 2 else PLAIN))
+    return tuple(spans)
+
+
+def link_spans(text: str) -> List[tuple]:
+    """Split text into plain and link spans on markdown-style [text](url) links"""
+    return list(_link_tokens(text))
+
+
+def metric_spans(text: str) -> List[tuple]:
+    """Split text into link, metric and plain spans"""
+    return list(_metric_tokens(text))
+
+
+def token_cache_info():
+    """Hit/miss statistics of the metric tokenizer cache"""
+    return _metric_tokens.cache_info()
+
+
+def join_spans(span_lists: List[List[tuple]], separator: str) -> List[tuple]:
+    """Concatenate span lists with a plain separator between them"""
+    joined = []
+    for index, spans in enumerate(span_lists):
+        if index:
+            joined.append(span(separator))
+        joined.extend(spans)
+    return joined
+
+
+def plain_text(spans: List[tuple]) -> str:
+    """Span text without any styling"""
+    return "".join(text for text, _, _ in spans)
+
+
+class TextBlock:
+    """A paragraph of spans"""
+
+    kind = "text"
+
+    def __init__(self, spans: List[tuple], style: str = BODY):
+        self.spans = spans
+        self.style = style
+
+
+class ListBlock:
+    """A bulleted list, optionally under its own title"""
+
+    kind = "list"
+
+    def __init__(self, items: List[List[tuple]], title: Optional[str] = None):
+        self.items = items
+        self.title = title
+
+
+class EntryBlock:
+    """A job, project or degree: heading, optional subtitle, detail lines and bullets"""
+
+    kind = "entry"
+
+    def __init__(self, heading: List[tuple], subtitle: str = "", details: Optional[List[List[tuple]]] = None,
+                 bullets: Optional[List[List[tuple]]] = None):
+        self.heading = heading
+        self.subtitle = subtitle
+        self.details = details or []
+        self.bullets = bullets or []
+
+
+class Section:
+    """A titled group of blocks; key identifies the section for layout decisions"""
+
+    def __init__(self, key: str, title: Optional[str], blocks: list):
+        self.key = key
+        self.title = title
+        self.blocks = blocks
+
+
+class ResumeDocument:
+    """Header details and ordered sections of one resume"""
+
+    def __init__(self, name: str, contact: Dict[str, str], sections: List[Section]):
+        self.name = name
+        self.contact = contact
+        self.sections = sections
+
+    def contact_items(self, keys=("phone", "email", "website", "linkedin", "location")) -> List[tuple]:
+        """(key, value) pairs for the contact details that are present, in display order"""
+        return [(key, self.contact[key]) for key in keys if self.contact.get(key)]
+
+
+def _experience_section(experience: list) -> Optional[Section]:
+    if not experience:
+        return None
+    blocks = []
+    for job in experience:
+        company_line = job.get("company", "")
+        if job.get("title"):
+            company_line += f" | {job['title']}"
+        if job.get("location"):
+            company_line += f" - {job['location']}"
+        if job.get("dates"):
+            company_line += f" {job['dates']}"
+        bullets = [metric_spans(resp) for resp in job.get("responsibilities", [])]
+        blocks.append(EntryBlock([span(company_line)], job.get("subtitle", ""), bullets=bullets))
+    return Section("experience", "Professional Experience", blocks)
+
+
+def _projects_section(projects: list) -> Optional[Section]:
+    if not projects:
+        return None
+    blocks = []
+    for project in projects:
+        heading = link_spans(project.get("name", ""))
+        if project.get("dates"):
+            heading.append(span(f" ({project['dates']})"))
+        details = []
+        if project.get("description"):
+            details.append([span("About:", LABEL_MUTED), span(f" {project['description']}")])
+        if project.get("technologies"):
+            details.append([span("Technologies:", LABEL), span(f" {', '.join(project['technologies'])}")])
+        if project.get("impact"):
+            details.append([span("Impact:", LABEL_ACCENT), span(f" {project['impact']}")])
+        blocks.append(EntryBlock(heading, details=details))
+    return Section("projects", "Key Projects", blocks)
+
+
+def _education_section(education: list) -> Optional[Section]:
+    if not education:
+        return None
+    blocks = []
+    for edu in education:
+        title_line = edu.get("degree", "")
+        if edu.get("institution"):
+            title_line += f" - {edu['institution']}"
+        if edu.get("location"):
+            title_line += f" ({edu['location']})"
+        if edu.get("dates"):
+            title_line += f" | {edu['dates']}"
+        details = []
+        if edu.get("gpa"):
+            details.append([span(f"GPA: {edu['gpa']}")])
+        if edu.get("honors"):
+            details.append([span(f"Honors: {edu['honors']}")])
+        blocks.append(EntryBlock([span(title_line)], details=details))
+    return Section("education", "Education", blocks)
+
+
+def _skills_section(competencies: dict) -> Optional[Section]:
+    blocks = []
+    for main_category, sub_skills in competencies.items():
+        if not isinstance(sub_skills, list):
+            continue
+        skill_spans = []
+        for skill_line in sub_skills:
+            skill_spans.append([])
+            if ": " in skill_line:
+                sub_category, details = skill_line.split(": ", 1)
+                skill_spans[-1] += [span(sub_category, SUBCATEGORY), span(" "), span(f"({details})", DETAIL)]
+            else:
+                skill_spans[-1].append(span(skill_line, SKILL))
+        spans = [span(main_category.upper(), CATEGORY), span(" ")] + join_spans(skill_spans, "; ")
+        blocks.append(TextBlock(spans, DETAIL_TEXT))
+    return Section("skills", "Technical Skills", blocks) if blocks else None
+
+
+def build_document(data: Dict[str, Any], contact: Dict[str, str], experience: list,
+                   length_variant: str = "long") -> ResumeDocument:
+    """
+    Compile resume data into a ResumeDocument.
+
+    Args:
+        data: Resume data as loaded from resume_data.json
+        contact: Contact details, already resolved from nested or flat personal info
+        experience: Experience entries in display order
+        length_variant: "long", "short" or "brief"
+
+    Returns:
+        ResumeDocument with sections in display order
+    """
+    sections = []
+
+    summary = data.get("summary", "")
+    if summary:
+        sections.append(Section("summary", "Professional Summary", [TextBlock([span(summary)])]))
+
+    achievements = [
+        ListBlock([metric_spans(achievement) for achievement in achievement_list], category)
+        for category, achievement_list in data.get("achievements", {}).items()
+        if isinstance(achievement_list, list) and achievement_list
+    ]
+    if achievements:
+        sections.append(Section("achievements", "Key Achievements and Impact", achievements))
+
+    competencies = data.get("competencies", {})
+    if competencies:
+        competency_text = " • ".join(competencies.keys())
+        sections.append(Section("competencies", "Core Competencies", [TextBlock([span(competency_text)], DETAIL_TEXT)]))
+
+    for section in (_experience_section(experience),
+                    _projects_section(data.get("projects", [])),
+                    _education_section(data.get("education", []))):
+        if section:
+            sections.append(section)
+
+    if length_variant in ("short", "brief") and data.get("additional_info"):
+        sections.append(Section("additional_info", None, [TextBlock([span(ADDITIONAL_INFO_TEXT)])]))
+
+    skills = _skills_section(competencies)
+    if skills:
+        sections.append(skills)
+
+    return ResumeDocument(data.get("personal_info", {}).get("name", "NAME"), contact, sections)
+
+
+def role_color(role: str, config: Dict[str, Any]) -> Optional[str]:
+    """Configured color for a role, or None when the role is uncolored"""
+    color_key, default_color, _, _ = ROLE_STYLES[role]
+    return config.get(color_key, default_color) if color_key else None
+
+
+def spans_to_pdf(spans: List[tuple], config: Dict[str, Any]) -> str:
+    """ReportLab paragraph markup for spans"""
+    parts = []
+    for text, role, url in spans:
+        if role == LINK:
+            parts.append(f'<a href="{url}" color="blue">{text}</a>')
+            continue
+        _, _, bold, italic = ROLE_STYLES[role]
+        if italic:
+            text = f"<i>{text}</i>"
+        if bold:
+            text = f"<b>{text}</b>"
+        color = role_color(role, config)
+        parts.append(f'<font color="{color}">{text}</font>' if color else text)
+    return "".join(parts)
+
+
+def spans_to_markdown(spans: List[tuple]) -> str:
+    """Markdown for spans; colors are dropped"""
+    parts = []
+    for text, role, url in spans:
+        if role == LINK:
+            parts.append(f"[{text}]({url})")
+            continue
+        _, _, bold, italic = ROLE_STYLES[role]
+        if italic:
+            text = f"*{text}*"
+        if bold:
+            text = f"**{text}**"
+        parts.append(text)
+    return "".join(parts)
+
+
+def spans_to_rtf(spans: List[tuple]) -> str:
+    """RTF control words for spans; colors and link targets are dropped"""
+    parts = []
+    for text, role, _ in spans:
+        _, _, bold, italic = ROLE_STYLES[role]
+        if italic:
+            text = f"\\i {text}\\i0"
+        if bold:
+            text = f"\\b {text}\\b0"
+        parts.append(text)
+    return "".join(parts)
+
+
+def add_docx_runs(paragraph, spans: List[tuple], config: Dict[str, Any]):
+    """Append spans to a python-docx paragraph as styled runs"""
+    from docx.shared import RGBColor
+
+    for text, role, _ in spans:
+        run = paragraph.add_run(text)
+        _, _, bold, italic = ROLE_STYLES[role]
+        if bold:
+            run.bold = True
+        if italic:
+            run.italic = True
+        color = role_color(role, config)
+        if color and color.startswith("#") and len(color) == 7:
+            run.font.color.rgb = RGBColor.from_string(color[1:].upper())
+    return paragraph
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Process-Wide Base DOCX Template
+
+generate_docx used to start every render with Document(), which unzips and
+parses python-docx's default template package, and add_heading resolved its
+style by name, scanning every style in styles.xml once per heading. The
+base document is now built once per process with the generator's fixed
+core properties set and the heading style IDs resolved, and each render
+starts from an in-memory deep copy of it. Headings are added by style ID,
+so no render searches the stylesheet.
+
+The base document is never modified after it is built; renders only touch
+their own copy.
+"""
+
+import copy
+import threading
+from typing import Dict, Optional
+
+from docx import Document
+from docx.document import Document as DocxDocument
+from docx.text.paragraph import Paragraph
+
+
+# Core properties every generated DOCX carries; title and author are set per resume
+BASE_PROPERTIES = {
+    "subject": "Professional Resume",
+    "keywords": "resume, professional, career",
+    "comments": "Generated by Resume Generator Pro",
+}
+HEADING_LEVELS = (2, 3)
+
+_base: Optional[DocxDocument] = None
+_heading_styles: Dict[int, str] = {}
+_base_lock = threading.Lock()
+
+
+def _build_base() -> DocxDocument:
+    """Default template with the fixed core properties set and heading style IDs resolved"""
+    doc = Document()
+    for name, value in BASE_PROPERTIES.items():
+        setattr(doc.core_properties, name, value)
+    _heading_styles.update({level: doc.styles[f"Heading {level}"].style_id for level in HEADING_LEVELS})
+    return doc
+
+
+def new_document() -> DocxDocument:
+    """A fresh, independent copy of the base document"""
+    global _base
+    with _base_lock:
+        if _base is None:
+            _base = _build_base()
+    return copy.deepcopy(_base)
+
+
+def add_heading(doc: DocxDocument, text: str, level: int) -> Paragraph:
+    """Append a heading paragraph, like doc.add_heading but with the style ID resolved once per process"""
+    paragraph = doc.add_paragraph()
+    paragraph._p.style = _heading_styles[level]
+    paragraph.add_run(text)
+    return paragraph
+
+
+def clear_docx_template():
+    """Drop the cached base document, so the next render builds it again"""
+    global _base
+    with _base_lock:
+        _base = None
+        _heading_styles.clear()
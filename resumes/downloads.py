@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+File Download Responses
+
+Serves rendered files without reading them into memory: full downloads
+stream through FileResponse, single byte ranges stream in fixed chunks,
+and with FILE_GENERATION['DOWNLOAD_OFFLOAD'] set the web server sends the
+file itself (X-Sendfile for Apache/lighttpd, X-Accel-Redirect for nginx).
+
+Every response carries the format's MIME type, an ETag (the blob's SHA-256
+for stored renders) and Last-Modified, so If-None-Match/If-Modified-Since
+revalidations get a 304 without touching the file.
+
+Bundles of several files stream as a ZIP built on the fly: the archive
+is written to an in-memory sink that is drained after every chunk, so no
+temporary file is staged and memory stays at one chunk however many
+files it holds.
+"""
+
+import mimetypes
+import re
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "rtf": "application/rtf",
+    "md": "text/markdown; charset=utf-8",
+    "zip": "application/zip",
+}
+CHUNK_SIZE = 64 * 1024
+# Formats that are compressed already; bundles store them as-is instead of deflating again
+STORED_FORMATS = {"pdf", "docx"}
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def content_type_for(format_type: str, filename: str = "") -> str:
+    return CONTENT_TYPES.get(format_type) or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header into inclusive (start, end) offsets.
+
+    Returns:
+        The range, None when the header should be ignored (malformed or
+        multiple ranges, which are answered with the whole file)
+
+    Raises:
+        ValueError: If the range cannot be satisfied for a file of this size
+    """
+    match = _RANGE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or (last and int(last) < start):
+            raise ValueError(header)
+    else:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        start, end = max(size - length, 0), size - 1
+    return start, end
+
+
+def _read_range(path: Path, start: int, length: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def _offload(response: HttpResponse, path: Path) -> bool:
+    """Hand the file to the web server if an offload mode is configured; True if it was"""
+    mode = settings.FILE_GENERATION.get("DOWNLOAD_OFFLOAD")
+    if mode == "x-sendfile":
+        response["X-Sendfile"] = str(path.resolve())
+    elif mode == "x-accel-redirect":
+        # nginx maps an internal location onto the directory holding the files
+        root = Path(settings.FILE_GENERATION.get("ACCEL_REDIRECT_ROOT") or settings.MEDIA_ROOT).resolve()
+        if not path.resolve().is_relative_to(root):
+            # nginx can't reach it (e.g. a legacy per-format path); stream it ourselves
+            return False
+        prefix = settings.FILE_GENERATION.get("ACCEL_REDIRECT_PREFIX", "/protected/").rstrip("/")
+        response["X-Accel-Redirect"] = f"{prefix}/{path.resolve().relative_to(root).as_posix()}"
+    else:
+        return False
+    return True
+
+
+def file_download_response(request, path, filename: str, format_type: str, etag: Optional[str] = None):
+    """
+    Serve a file as an attachment with caching headers, conditional GET and Range support.
+
+    Args:
+        request: The GET/HEAD request
+        path: File to send
+        filename: Name the browser saves it as
+        format_type: File format, which picks the MIME type
+        etag: Strong validator for the content (e.g. its SHA-256); derived
+            from size and modification time when omitted
+    """
+    path = Path(path)
+    stat = path.stat()
+    etag = quote_etag(etag) if etag else f'W/"{stat.st_size:x}-{int(stat.st_mtime):x}"'
+    last_modified = int(stat.st_mtime)
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": content_disposition_header(True, filename),
+    }
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        for header in ("ETag", "Last-Modified"):
+            not_modified[header] = headers[header]
+        return not_modified
+
+    content_type = content_type_for(format_type, filename)
+    response = HttpResponse(content_type=content_type, headers=headers)
+    if _offload(response, path):
+        # The web server handles ranges and the body
+        return response
+
+    byte_range = None
+    range_header = request.headers.get("Range")
+    if range_header and _if_range_matches(request.headers.get("If-Range"), etag, last_modified):
+        try:
+            byte_range = parse_range(range_header, stat.st_size)
+        except ValueError:
+            response = HttpResponse(status=416, headers={**headers, "Content-Range": f"bytes */{stat.st_size}"})
+            del response["Content-Disposition"]
+            return response
+
+    if byte_range is None:
+        response = FileResponse(
+            open(path, "rb"), as_attachment=True, filename=filename, content_type=content_type, headers=headers
+        )
+        response.block_size = CHUNK_SIZE
+        return response
+
+    start, end = byte_range
+    length = end - start + 1
+    response = StreamingHttpResponse(_read_range(path, start, length), status=206, content_type=content_type, headers=headers)
+    response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+    response["Content-Length"] = str(length)
+    return response
+
+
+def _if_range_matches(if_range: Optional[str], etag: str, last_modified: int) -> bool:
+    """Whether a Range request's If-Range validator (if any) still matches, so the range applies"""
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/"')):
+        # Only strong validators may match If-Range
+        return not etag.startswith("W/") and if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+class _ZipSink:
+    """Write-only, unseekable file object for ZipFile; drained after every write so it holds at most one chunk"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.position = 0
+
+    def write(self, data) -> int:
+        self.buffer += data
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def zip_stream(entries: Iterable[Tuple[str, Path, str]]) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive of entries as it is written.
+
+    Without a seekable target ZipFile writes each member's sizes and CRC
+    in a data descriptor after its data, so nothing is read twice.
+
+    Args:
+        entries: (archive name, path, format) per file; STORED_FORMATS are
+            stored, everything else deflated
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w") as archive:
+        for arcname, path, format_type in entries:
+            info = zipfile.ZipInfo.from_file(path, arcname)
+            info.compress_type = zipfile.ZIP_STORED if format_type in STORED_FORMATS else zipfile.ZIP_DEFLATED
+            with open(path, "rb") as source, archive.open(info, "w") as target:
+                while chunk := source.read(CHUNK_SIZE):
+                    target.write(chunk)
+                    if sink.buffer:
+                        yield sink.drain()
+            if sink.buffer:
+                yield sink.drain()
+    yield sink.drain()
+
+
+def zip_download_response(filename: str, entries: Iterable[Tuple[str, Path, str]]) -> StreamingHttpResponse:
+    """Stream entries (see zip_stream) as a ZIP attachment"""
+    return StreamingHttpResponse(
+        zip_stream(entries),
+        content_type=CONTENT_TYPES["zip"],
+        headers={"Content-Disposition": content_disposition_header(True, filename)},
+    )
@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+"""
+Database-Backed Generation Worker
+
+Executes queued ResumeGenerationJob rows with no broker: the jobs table is
+the queue. A worker claims the oldest queued job with a conditional UPDATE
+(status='queued' -> 'processing'), which the database applies atomically,
+so however many workers poll the same SQLite file or Postgres database,
+each job is claimed exactly once.
+
+Renders run in a process pool and never touch the database; the worker
+process claims, loads the job's content and color scheme, and records the
+outcome (started_at, completed_at, result_files, error_message). Renders
+are moved into the content-addressed artifact store, and a format whose
+render key the store already knows is attached without rendering at all.
+
+While a job renders, its worker refreshes the job's heartbeat_at every
+heartbeat interval. A processing job whose heartbeat is older than
+stale_after is assumed orphaned by a dead worker and requeued, so a long
+but healthy render is never claimed a second time.
+
+Submissions are coalesced by render key, a hash of the content, color
+scheme, formats, length and output type. A submission whose key matches a
+queued, processing or completed render attaches to that canonical job
+instead of queueing another render. Workers never claim attached jobs; they
+follow the canonical job's status and receive its result_files.
+
+    python manage.py run_generation_worker --pool-size 4
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .artifact_store import ArtifactStore
+from .core_services import DEFAULT_PDF_PROFILE, ResumeGenerator, pdf_profile_settings
+from .metrics import registry as metrics_registry
+from .models import ColorScheme, Resume, ResumeGenerationJob, UserResumeData
+from .style_registry import prewarm_stylesheets
+
+
+DEFAULT_COLOR_SCHEME = "default_professional"
+DEFAULT_POLL_INTERVAL = 1.0
+# A processing job whose worker hasn't reported it alive for this long is assumed orphaned by a dead worker
+DEFAULT_STALE_AFTER = timedelta(minutes=15)
+# Seconds between heartbeat_at refreshes on the jobs a worker is rendering
+DEFAULT_HEARTBEAT_INTERVAL = 30.0
+# Statuses whose render a new submission can share
+COALESCABLE_STATUSES = ('queued', 'processing', 'completed')
+RENDERED_FORMATS = ('pdf', 'docx', 'rtf', 'md')
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_job(worker_id: str) -> Optional[ResumeGenerationJob]:
+    """
+    Claim the oldest queued job for this worker.
+
+    Returns:
+        The claimed job, or None when the queue is empty
+    """
+    while True:
+        candidate = (
+            ResumeGenerationJob.objects.filter(status='queued', canonical_job__isnull=True)
+            .order_by('created_at', 'id').values_list('id', flat=True).first()
+        )
+        if candidate is None:
+            return None
+        started_at = timezone.now()
+        claimed = ResumeGenerationJob.objects.filter(id=candidate, status='queued').update(
+            status='processing', started_at=started_at, heartbeat_at=started_at, worker_id=worker_id, error_message=''
+        )
+        if claimed:
+            ResumeGenerationJob.objects.filter(canonical_job_id=candidate, status='queued').update(
+                status='processing', started_at=started_at
+            )
+            return ResumeGenerationJob.objects.select_related('resume_data', 'color_scheme').get(id=candidate)
+        # Another worker claimed it between the SELECT and the UPDATE; try the next one
+
+
+def heartbeat(worker_id: str, job_ids: Iterable[int]) -> int:
+    """Report the jobs this worker is rendering as alive"""
+    return ResumeGenerationJob.objects.filter(
+        id__in=list(job_ids), status='processing', worker_id=worker_id
+    ).update(heartbeat_at=timezone.now())
+
+
+def requeue_stale_jobs(stale_after: timedelta = DEFAULT_STALE_AFTER) -> int:
+    """
+    Return jobs whose worker stopped reporting them alive more than stale_after ago to the queue.
+
+    Jobs attached to a requeued job go back with it; jobs claimed before
+    heartbeats were recorded fall back to their claim time.
+
+    Returns:
+        Number of renders requeued
+    """
+    cutoff = timezone.now() - stale_after
+    stale = ResumeGenerationJob.objects.filter(status='processing', canonical_job__isnull=True).filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff)
+    )
+    stale_ids = list(stale.values_list('id', flat=True))
+    if not stale_ids:
+        return 0
+    # Re-check staleness in the UPDATE, in case a heartbeat landed since the SELECT
+    requeued = stale.filter(id__in=stale_ids).update(status='queued', started_at=None, heartbeat_at=None, worker_id='')
+    ResumeGenerationJob.objects.filter(canonical_job_id__in=stale_ids, status='processing').update(
+        status='queued', started_at=None
+    )
+    return requeued
+
+
+def scheme_config(scheme: Optional[ColorScheme]) -> Tuple[str, Dict[str, Any]]:
+    """Color scheme name and config: the shipped scheme file, else the scheme's stored settings"""
+    name = scheme.name if scheme else DEFAULT_COLOR_SCHEME
+    scheme_file = Path(settings.BASE_DIR) / "color_schemes" / f"{name}.json"
+    if scheme_file.exists():
+        with open(scheme_file, "r", encoding="utf-8") as f:
+            return name, json.load(f)
+    return name, {**scheme.colors, **scheme.typography, **scheme.layout}
+
+
+def job_output_dir(job: ResumeGenerationJob) -> Path:
+    """Directory a job's files are written to"""
+    return Path(settings.FILE_GENERATION['OUTPUT_DIR']) / f"user_{job.user_id}" / job.job_id
+
+
+def job_payload(job: ResumeGenerationJob) -> Dict[str, Any]:
+    """Everything a render needs, as plain picklable data"""
+    if job.resume_data is None:
+        raise ValueError("Job has no resume data to render")
+    name, config = scheme_config(job.color_scheme)
+    resume_data = job.resume_data
+    return {
+        "data": resume_data.to_resume_data(),
+        "config": config,
+        "color_scheme": name,
+        "length_variant": resume_data.length_variant,
+        "output_type": job.output_type,
+        "pdf_profile": job.pdf_profile,
+        "formats": list(job.formats or settings.RESUME_GENERATOR['DEFAULT_FORMATS']),
+        "output_dir": str(job_output_dir(job)),
+        "basename": f"{resume_data.resume_type}_{resume_data.length_variant}_{name}",
+    }
+
+
+def render_job(payload: Dict[str, Any]) -> Tuple[Dict[str, str], str, list]:
+    """
+    Render one job's formats; module-level so process pools can pickle it.
+
+    Returns:
+        (paths written by format, error message or "", span metrics recorded by this render)
+    """
+    try:
+        generator = ResumeGenerator.from_data(
+            payload["data"], payload["config"], payload["color_scheme"], payload["length_variant"], payload["output_type"],
+            pdf_profile=payload.get("pdf_profile", DEFAULT_PDF_PROFILE)
+        )
+        result_files = generator.generate_many(payload["formats"], payload["output_dir"], payload["basename"])
+        error = ""
+    except Exception as e:
+        result_files, error = {}, f"{type(e).__name__}: {e}"
+    return result_files, error, metrics_registry.drain()
+
+
+def finish_job(job: ResumeGenerationJob, result_files: Dict[str, str], error: str):
+    """Record a job's outcome, on the job and every job attached to it"""
+    completed_at = timezone.now()
+    ResumeGenerationJob.objects.filter(id=job.id).update(
+        status='failed' if error else 'completed',
+        result_files=result_files,
+        error_message=error,
+        completed_at=completed_at,
+    )
+    _propagate(job.id)
+    if not error:
+        UserResumeData.objects.filter(id=job.resume_data_id).update(last_generated=completed_at)
+
+
+def _propagate(canonical_id: int):
+    """Copy a finished canonical job's outcome to the jobs still waiting on it"""
+    canonical = ResumeGenerationJob.objects.get(id=canonical_id)
+    if canonical.status not in ('completed', 'failed'):
+        return
+    waiting = ResumeGenerationJob.objects.filter(canonical_job_id=canonical_id, status__in=('queued', 'processing'))
+    if canonical.status == 'completed':
+        # Attached jobs hold their own references to the shared files
+        store = ArtifactStore()
+        blobs = store.files(job=canonical)
+        for attached in waiting.select_related('resume'):
+            for format_type, blob in blobs.items():
+                store.attach(blob, format_type, job=attached)
+                if attached.resume is not None:
+                    store.attach(blob, format_type, resume=attached.resume)
+    waiting.filter(started_at__isnull=True).update(started_at=canonical.started_at)
+    waiting.update(
+        status=canonical.status,
+        result_files=canonical.result_files,
+        error_message=canonical.error_message,
+        completed_at=canonical.completed_at,
+    )
+
+
+def render_key(data: Dict[str, Any], color_scheme: str, config: Dict[str, Any], formats: Iterable[str],
+               length_variant: str, output_type: str, pdf_profile: str = DEFAULT_PDF_PROFILE) -> str:
+    """
+    Hex SHA-256 identifying a render: equal keys produce identical files.
+
+    The PDF profile only counts when a PDF is rendered with a non-default
+    one, so keys of default renders (and of other formats) are unchanged.
+    """
+    formats = sorted(set(formats))
+    key = {
+        "data": data,
+        "color_scheme": color_scheme,
+        "config": config,
+        "formats": formats,
+        "length_variant": length_variant,
+        "output_type": output_type,
+    }
+    if "pdf" in formats and pdf_profile != DEFAULT_PDF_PROFILE:
+        key["pdf_profile"] = pdf_profile
+    canonical = json.dumps(key, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def format_render_key(payload: Dict[str, Any], format_type: str) -> str:
+    """Render key of one format of a job payload, under which the artifact store keeps its file"""
+    return render_key(payload["data"], payload["color_scheme"], payload["config"], [format_type],
+                      payload["length_variant"], payload["output_type"], payload.get("pdf_profile", DEFAULT_PDF_PROFILE))
+
+
+def stored_renders(resume_data: UserResumeData, formats: Optional[Iterable[str]] = None,
+                   color_schemes: Optional[Iterable[str]] = None, length_variants: Optional[Iterable[str]] = None,
+                   output_type: str = 'ats', store: Optional[ArtifactStore] = None) -> List[Tuple[str, Path, str]]:
+    """
+    Stored files of a resume across lengths, color schemes and formats.
+
+    Lengths are the owner's resume data rows of the same resume type; each
+    combination is found by its render key, so any worker render of
+    identical content counts. Combinations never rendered are skipped.
+
+    Args:
+        formats: Formats to include (default: every rendered format)
+        color_schemes: Color scheme names (default: the default scheme and every active scheme)
+        length_variants: Lengths to include (default: all)
+
+    Returns:
+        (archive name, blob path, format) per file, named like job outputs
+
+    Raises:
+        ValueError: If a color scheme is unknown
+    """
+    store = store or ArtifactStore()
+    formats = sorted(set(formats or RENDERED_FORMATS))
+    if color_schemes is None:
+        color_schemes = [DEFAULT_COLOR_SCHEME] + list(
+            ColorScheme.objects.filter(is_active=True).exclude(name=DEFAULT_COLOR_SCHEME).order_by('name')
+            .values_list('name', flat=True)
+        )
+    schemes = []
+    for name in dict.fromkeys(color_schemes):
+        scheme = ColorScheme.objects.filter(name=name).first()
+        if scheme is None and name != DEFAULT_COLOR_SCHEME:
+            raise ValueError(f"Unknown color scheme: {name}")
+        schemes.append(scheme_config(scheme))
+
+    rows = UserResumeData.objects.filter(user_id=resume_data.user_id, resume_type=resume_data.resume_type)
+    if length_variants is not None:
+        rows = rows.filter(length_variant__in=list(length_variants))
+
+    entries = []
+    for row in rows.order_by('length_variant'):
+        data = row.to_resume_data()
+        for name, config in schemes:
+            for format_type in formats:
+                blob = store.lookup(render_key(data, name, config, [format_type], row.length_variant, output_type))
+                if blob is not None:
+                    basename = f"{row.resume_type}_{row.length_variant}_{name}"
+                    entries.append((f"{basename}.{format_type}", store.blob_path(blob), format_type))
+    return entries
+
+
+def _files_exist(job: ResumeGenerationJob) -> bool:
+    return bool(job.result_files) and all(Path(path).exists() for path in job.result_files.values())
+
+
+def submit_job(user, resume_data: UserResumeData, formats: Iterable[str], color_scheme: Optional[ColorScheme] = None,
+               output_type: str = 'ats', job_prefix: str = 'job',
+               pdf_profile: str = DEFAULT_PDF_PROFILE, resume: Optional[Resume] = None) -> Tuple[ResumeGenerationJob, str]:
+    """
+    Queue a render of resume_data, sharing an identical render where one exists.
+
+    The job_id is derived from the user, the resume and the render key, so
+    submitting the same thing twice returns the first job (a failed one is
+    retried) and a changed resume gets a new job.
+
+    Args:
+        pdf_profile: Named PDF output profile (see core_services.PDF_PROFILES)
+        resume: Resume the rendered files are attached to, so its downloads
+            resolve through the artifact store
+
+    Returns:
+        (job, outcome) where outcome is "queued" (new render), "attached"
+        (shares an in-flight or completed render) or "existing" (this
+        user's job for the same render)
+
+    Raises:
+        ValueError: If pdf_profile is unknown
+    """
+    pdf_profile_settings(pdf_profile)
+    formats = sorted(set(formats))
+    name, config = scheme_config(color_scheme)
+    key = render_key(resume_data.to_resume_data(), name, config, formats, resume_data.length_variant, output_type, pdf_profile)
+    job_id = f"{job_prefix}_{user.id}_{resume_data.resume_type}_{resume_data.length_variant}_{key[:16]}"
+
+    existing = ResumeGenerationJob.objects.filter(job_id=job_id).first()
+    if existing is not None and existing.status != 'failed':
+        if resume is not None and existing.resume_id != resume.id:
+            existing.resume = resume
+            existing.save(update_fields=['resume'])
+            if existing.status == 'completed':
+                store = ArtifactStore()
+                for format_type, blob in store.files(job=existing).items():
+                    store.attach(blob, format_type, resume=resume)
+        return existing, "existing"
+
+    canonical = (
+        ResumeGenerationJob.objects.filter(render_key=key, canonical_job__isnull=True, status__in=COALESCABLE_STATUSES)
+        .exclude(job_id=job_id).order_by('-created_at').first()
+    )
+    if canonical is not None and canonical.status == 'completed' and not _files_exist(canonical):
+        canonical = None
+
+    fields = {
+        "user": user, "resume": resume, "resume_data": resume_data, "formats": formats, "color_scheme": color_scheme,
+        "output_type": output_type, "pdf_profile": pdf_profile, "render_key": key, "canonical_job": canonical,
+        "status": 'queued', "result_files": {}, "error_message": '', "worker_id": '',
+        "started_at": None, "completed_at": None,
+    }
+    if canonical is not None and canonical.status == 'processing':
+        fields.update(status='processing', started_at=canonical.started_at)
+
+    if existing is not None:
+        for field, value in fields.items():
+            setattr(existing, field, value)
+        existing.save()
+        job = existing
+    else:
+        try:
+            with transaction.atomic():
+                job = ResumeGenerationJob.objects.create(job_id=job_id, **fields)
+        except IntegrityError:
+            # The same submission raced this one in
+            return ResumeGenerationJob.objects.get(job_id=job_id), "existing"
+
+    if canonical is None:
+        return job, "queued"
+    # Completed renders (and any that finished since the lookup) are copied over now
+    _propagate(canonical.id)
+    job.refresh_from_db()
+    return job, "attached"
+
+
+class GenerationWorker:
+    """Claims queued jobs and renders up to pool_size of them at a time"""
+
+    def __init__(self, pool_size: int = 1, worker_id: Optional[str] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, stale_after: timedelta = DEFAULT_STALE_AFTER,
+                 on_finish=None, store: Optional[ArtifactStore] = None,
+                 heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL):
+        """
+        Args:
+            pool_size: Render processes (1 renders in this process, 0 uses every core)
+            worker_id: Recorded on claimed jobs (default: host:pid)
+            poll_interval: Seconds to wait for new jobs when the queue is empty
+            stale_after: Requeue jobs whose worker stopped reporting them alive this long ago
+            on_finish: Optional callback receiving each finished job and its error ("" on success)
+            store: Artifact store renders are kept in (default: FILE_GENERATION['BLOB_DIR'])
+            heartbeat_interval: Seconds between heartbeat_at refreshes on running jobs
+                (keep well under stale_after)
+        """
+        self.pool_size = pool_size or os.cpu_count() or 1
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.on_finish = on_finish
+        self.store = store or ArtifactStore()
+        self.heartbeat_interval = heartbeat_interval
+        self.processed = 0
+        self._stored: Dict[int, Dict[str, Any]] = {}
+
+    def _prepare(self, job: ResumeGenerationJob) -> Optional[Dict[str, Any]]:
+        """
+        Payload rendering a claimed job's formats that are not in the store yet.
+
+        Formats already stored are attached without rendering; a job that
+        needs no render, or cannot be prepared, is finished here and None
+        returned.
+        """
+        try:
+            payload = job_payload(job)
+        except Exception as e:
+            self._finish(job, None, ({}, f"{type(e).__name__}: {e}", []))
+            return None
+
+        stored = {}
+        for format_type in payload["formats"]:
+            blob = self.store.lookup(format_render_key(payload, format_type))
+            if blob is not None:
+                stored[format_type] = blob
+        self._stored[job.id] = stored
+        payload["formats"] = [format_type for format_type in payload["formats"] if format_type not in stored]
+        if not payload["formats"]:
+            self._finish(job, payload, ({}, "", []))
+            return None
+        return payload
+
+    def _finish(self, job: ResumeGenerationJob, payload: Optional[Dict[str, Any]], outcome: tuple):
+        """Store a job's new renders, attach every format to it and record the outcome"""
+        written, error, metrics_state = outcome
+        metrics_registry.merge(metrics_state)
+        stored = self._stored.pop(job.id, {})
+        result_files = {}
+        if not error:
+            for format_type, path in written.items():
+                blob = self.store.ingest(path, format_type, move=True)
+                self.store.remember(format_render_key(payload, format_type), blob)
+                stored[format_type] = blob
+            for format_type, blob in stored.items():
+                self.store.attach(blob, format_type, job=job)
+                if job.resume_id:
+                    self.store.attach(blob, format_type, resume=job.resume)
+                result_files[format_type] = str(self.store.blob_path(blob))
+        if payload is not None:
+            # Renders now live in the store; drop the scratch directory (and anything a failure left)
+            shutil.rmtree(payload["output_dir"], ignore_errors=True)
+        finish_job(job, result_files, error)
+        self.processed += 1
+        if self.on_finish:
+            self.on_finish(job, error)
+
+    def run(self, drain: bool = False, max_jobs: Optional[int] = None) -> int:
+        """
+        Process jobs until stopped (or, with drain, until the queue is empty).
+
+        Args:
+            drain: Exit once no job is queued or running
+            max_jobs: Exit after claiming this many jobs
+
+        Returns:
+            Number of jobs processed
+        """
+        requeue_stale_jobs(self.stale_after)
+        if self.pool_size == 1:
+            return self._run_in_process(drain, max_jobs)
+
+        claimed = 0
+        running = {}
+        last_beat = time.monotonic()
+        pool = self._render_pool()
+        try:
+            while True:
+                # Keep every render process busy while jobs are queued
+                while len(running) < self.pool_size and (max_jobs is None or claimed < max_jobs):
+                    job = claim_job(self.worker_id)
+                    if job is None:
+                        break
+                    claimed += 1
+                    payload = self._prepare(job)
+                    if payload is None:
+                        continue
+                    try:
+                        future = pool.submit(render_job, payload)
+                    except BrokenProcessPool:
+                        pool = self._replace_pool(pool, running)
+                        future = pool.submit(render_job, payload)
+                    running[future] = (job, payload)
+
+                if not running:
+                    if drain or (max_jobs is not None and claimed >= max_jobs):
+                        return self.processed
+                    time.sleep(self.poll_interval)
+                    requeue_stale_jobs(self.stale_after)
+                    continue
+
+                done, _ = wait(running, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, payload = running.pop(future)
+                    self._finish(job, payload, self._outcome(future))
+
+                if any(isinstance(future.exception(), BrokenProcessPool) for future in done):
+                    pool = self._replace_pool(pool, running)
+
+                if running and time.monotonic() - last_beat >= self.heartbeat_interval:
+                    heartbeat(self.worker_id, (job.id for job, _ in running.values()))
+                    last_beat = time.monotonic()
+        finally:
+            pool.shutdown()
+
+    def _render_pool(self) -> ProcessPoolExecutor:
+        # Children fork without the parent's database connections; only this process uses the database
+        connections.close_all()
+        return ProcessPoolExecutor(max_workers=self.pool_size, initializer=prewarm_stylesheets)
+
+    def _replace_pool(self, pool: ProcessPoolExecutor, running: Dict[Future, tuple]) -> ProcessPoolExecutor:
+        """
+        A fresh pool for one a dying render process broke.
+
+        Every render still in the broken pool fails with it, so those jobs
+        are finished as failed first.
+        """
+        for future in list(running):
+            job, payload = running.pop(future)
+            self._finish(job, payload, self._outcome(future))
+        pool.shutdown(wait=False, cancel_futures=True)
+        return self._render_pool()
+
+    @staticmethod
+    def _outcome(future: Future) -> tuple:
+        """A pooled render's outcome; a render that raised, or whose process died, fails its job"""
+        try:
+            return future.result()
+        except Exception as e:
+            return {}, f"{type(e).__name__}: {e}", []
+
+    def _run_in_process(self, drain: bool, max_jobs: Optional[int]) -> int:
+        claimed = 0
+        while max_jobs is None or claimed < max_jobs:
+            job = claim_job(self.worker_id)
+            if job is None:
+                if drain:
+                    break
+                time.sleep(self.poll_interval)
+                requeue_stale_jobs(self.stale_after)
+                continue
+            claimed += 1
+            payload = self._prepare(job)
+            if payload is not None:
+                with self._beating(job):
+                    outcome = render_job(payload)
+                self._finish(job, payload, outcome)
+        return self.processed
+
+    @contextmanager
+    def _beating(self, job: ResumeGenerationJob):
+        """Refresh job's heartbeat from a background thread while this process renders it"""
+        stop = threading.Event()
+
+        def beat():
+            try:
+                while not stop.wait(self.heartbeat_interval):
+                    heartbeat(self.worker_id, [job.id])
+            finally:
+                # The thread's own database connection
+                connections.close_all()
+
+        thread = threading.Thread(target=beat, name=f"heartbeat-{job.job_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
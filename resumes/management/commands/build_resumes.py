@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Django management command to rebuild everything downstream of the master achievements
+"""
+
+from django.core.management.base import BaseCommand
+from resumes.build_graph import build_pipeline
+from resumes.metrics import registry as metrics_registry
+import os
+
+
+class Command(BaseCommand):
+    help = 'Specialize and render every resume, redoing only what changed since the last build'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output-dir',
+            type=str,
+            default='outputs',
+            help='Output directory for generated resumes'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-specialize and re-render everything, ignoring the manifests'
+        )
+        parser.add_argument(
+            '--jobs', '-j',
+            type=int,
+            default=1,
+            help='Number of worker processes to build with (0 = one per CPU core)'
+        )
+        parser.add_argument(
+            '--metrics-json',
+            default=None,
+            metavar='PATH',
+            help='Also write the render span latencies (p50/p95 per span, format and scheme) to PATH as JSON'
+        )
+
+    def handle(self, *args, **options):
+        output_dir = options['output_dir']
+        jobs = options['jobs']
+
+        self.stdout.write(
+            self.style.SUCCESS('🏗️  Building resumes from comprehensive_master_achievements.json')
+        )
+        self.stdout.write(f'🚀 Using {jobs or os.cpu_count()} worker(s)...')
+        self.stdout.write('=' * 60)
+
+        results = build_pipeline(output_dir, workers=jobs, force=options['force'])
+
+        specialized = results["specialized"]
+        self.stdout.write(
+            f'🧬 Specialize steps: {specialized["built"]} run, '
+            f'{specialized["skipped"]} up to date, {specialized["failed"]} failed'
+        )
+        self.stdout.write(f'📝 Input files changed: {results["inputs_changed"]}')
+        self.stdout.write(f'✅ Rendered: {results["success"]} files')
+        self.stdout.write(f'⏭️  Skipped (inputs unchanged): {results["skipped"]} files')
+        self.stdout.write(f'❌ Failed: {results["failed"]} files')
+
+        for version, length_variant, color_scheme, format_type in results["failures"][:20]:
+            self.stdout.write(f'   ✗ {version} {length_variant} {color_scheme} {format_type}')
+        if len(results["failures"]) > 20:
+            self.stdout.write(f'   ... and {len(results["failures"]) - 20} more')
+
+        if results["success"]:
+            self.stdout.write('')
+            self.stdout.write('⏱️  Render latency by span:')
+            for line in metrics_registry.summary_lines():
+                self.stdout.write(f'   {line}')
+        if options['metrics_json']:
+            metrics_registry.dump(options['metrics_json'])
+            self.stdout.write(f'   📄 {options["metrics_json"]}')
+
+        self.stdout.write('')
+        self.stdout.write(f'📁 Outputs are in the {output_dir}/ directory')
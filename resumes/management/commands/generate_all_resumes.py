@@ -3,9 +3,13 @@
 Django management command to generate all resume combinations
 """
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from resumes.core_services import ResumeManager
+from resumes.core_services import DEFAULT_PDF_PROFILE, PDF_PROFILES, ResumeManager
+from resumes.manifest import merge_shard_manifests
+from resumes.metrics import registry as metrics_registry
+from resumes.profiling import RenderProfiler
+from resumes.sharding import parse_shard
 import os
 
 
@@ -27,12 +31,62 @@ class Command(BaseCommand):
         parser.add_argument(
             '--force',
             action='store_true',
-            help='Force generation without confirmation (same as --confirm)'
+            help='Rebuild every file, ignoring the output manifest (implies --confirm)'
+        )
+        parser.add_argument(
+            '--jobs', '-j',
+            type=int,
+            default=1,
+            help='Number of worker processes to render with (0 = one per CPU core)'
+        )
+        parser.add_argument(
+            '--profile',
+            nargs='?',
+            const='profiles',
+            default=None,
+            metavar='DIR',
+            help='Profile every render and write per-format pstats, a speedscope flamegraph and a stage breakdown to DIR (default: profiles)'
+        )
+        parser.add_argument(
+            '--metrics-json',
+            default=None,
+            metavar='PATH',
+            help='Also write the render span latencies (p50/p95 per span, format and scheme) to PATH as JSON'
+        )
+        parser.add_argument(
+            '--shard',
+            default=None,
+            metavar='I/N',
+            help='Render only shard I of N cost-balanced slices of the matrix, recording a partial manifest'
+        )
+        parser.add_argument(
+            '--pdf-profile',
+            choices=list(PDF_PROFILES),
+            default=DEFAULT_PDF_PROFILE,
+            help='PDF output profile: preview (fastest, uncompressed), standard, web (fast web view) or archive (smallest)'
+        )
+        parser.add_argument(
+            '--merge-shards',
+            action='store_true',
+            help='Merge the partial shard manifests in the output directory into the main manifest, then exit'
         )
 
     def handle(self, *args, **options):
         output_dir = options['output_dir']
-        confirm = options['confirm'] or options['force']
+        force = options['force']
+        confirm = options['confirm'] or force
+        jobs = options['jobs']
+        profiler = RenderProfiler() if options['profile'] else None
+        
+        if options['merge_shards']:
+            merged = merge_shard_manifests(output_dir)
+            self.stdout.write(self.style.SUCCESS(f'🧩 Merged {len(merged)} shard manifest(s) into {output_dir}/.manifest.json'))
+            return
+        
+        try:
+            shard = parse_shard(options['shard']) if options['shard'] else None
+        except ValueError as e:
+            raise CommandError(str(e))
         
         # Calculate total combinations
         manager = ResumeManager()
@@ -56,6 +110,8 @@ class Command(BaseCommand):
             f'{len(output_types)} output types (ATS + human)'
         )
         self.stdout.write(f'🎯 Total files to generate: {total_combinations}')
+        if shard:
+            self.stdout.write(f'🧩 Shard {shard[0]}/{shard[1]}: rendering this node\'s cost-balanced slice only')
         self.stdout.write('')
         self.stdout.write('⏰ This will take several minutes...')
         self.stdout.write('☕ Perfect time for a coffee break!')
@@ -67,30 +123,50 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING('Operation cancelled.'))
                 return
         
-        self.stdout.write('🚀 Launching nuclear generation sequence...')
+        self.stdout.write(f'🚀 Launching nuclear generation sequence with {jobs or os.cpu_count()} worker(s)...')
         self.stdout.write('=' * 60)
         
         # Generate all combinations for both ATS and human versions
-        results = {"success": 0, "failed": 0}
+        results = {"success": 0, "failed": 0, "skipped": 0}
         
         for output_type in output_types:
             self.stdout.write(f'🎯 Generating {output_type.upper()} versions...')
-            type_results = manager.generate_all_combinations(output_dir, output_type)
+            type_results = manager.generate_all_combinations(output_dir, output_type, workers=jobs, force=force, profiler=profiler,
+                                                         shard=shard, pdf_profile=options['pdf_profile'])
             results["success"] += type_results["success"]
             results["failed"] += type_results["failed"]
+            results["skipped"] += type_results["skipped"]
         
         self.stdout.write('')
         self.stdout.write('☢️  NUCLEAR GENERATION COMPLETE!')
         self.stdout.write('=' * 60)
         self.stdout.write(f'✅ Successfully generated: {results["success"]} files')
+        self.stdout.write(f'⏭️  Skipped (inputs unchanged): {results["skipped"]} files')
         self.stdout.write(f'❌ Failed: {results["failed"]} files')
         
         if results["failed"] == 0:
             success_rate = 100.0
         else:
-            success_rate = (results["success"] / total_combinations) * 100
+            attempted = results["success"] + results["skipped"] + results["failed"]
+            success_rate = ((results["success"] + results["skipped"]) / attempted) * 100
         
         self.stdout.write(f'📊 Success rate: {success_rate:.1f}%')
+        
+        if results["success"]:
+            self.stdout.write('')
+            self.stdout.write('⏱️  Render latency by span:')
+            for line in metrics_registry.summary_lines():
+                self.stdout.write(f'   {line}')
+        if options['metrics_json']:
+            metrics_registry.dump(options['metrics_json'])
+            self.stdout.write(f'   📄 {options["metrics_json"]}')
+        if profiler is not None:
+            self.stdout.write('')
+            self.stdout.write('🔬 Time by stage (profiled, all renders):')
+            for line in profiler.summary_lines():
+                self.stdout.write(f'   {line}')
+            for path in profiler.write(options['profile']):
+                self.stdout.write(f'   📄 {path}')
         self.stdout.write('')
         self.stdout.write(f'📁 Find your nuclear arsenal in the {output_dir}/ directory!')
         self.stdout.write('   Organized by: outputs/[version]/[color_scheme]/[format]/')
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Django management command to execute queued resume generation jobs
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from resumes.generation_worker import DEFAULT_HEARTBEAT_INTERVAL, DEFAULT_POLL_INTERVAL, DEFAULT_STALE_AFTER, GenerationWorker
+from resumes.metrics import registry as metrics_registry
+import os
+
+
+class Command(BaseCommand):
+    help = 'Process queued ResumeGenerationJob rows (run as many workers as you like; each job is claimed once)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pool-size', '-j',
+            type=int,
+            default=1,
+            help='Number of render processes (0 = one per CPU core)'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=DEFAULT_POLL_INTERVAL,
+            help='Seconds between queue polls when idle'
+        )
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=int(DEFAULT_STALE_AFTER.total_seconds()),
+            help='Requeue jobs whose worker has not reported them alive for this many seconds'
+        )
+        parser.add_argument(
+            '--heartbeat-interval',
+            type=float,
+            default=DEFAULT_HEARTBEAT_INTERVAL,
+            help='Seconds between heartbeats on the jobs being rendered (keep well under --stale-after)'
+        )
+        parser.add_argument(
+            '--drain',
+            action='store_true',
+            help='Exit once the queue is empty instead of waiting for new jobs'
+        )
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=None,
+            help='Exit after this many jobs'
+        )
+
+    def handle(self, *args, **options):
+        def report(job, error):
+            if error:
+                self.stdout.write(self.style.ERROR(f'✗ {job.job_id}: {error}'))
+            else:
+                self.stdout.write(f'✓ {job.job_id}: {", ".join(job.formats)}')
+
+        worker = GenerationWorker(
+            pool_size=options['pool_size'],
+            poll_interval=options['poll_interval'],
+            stale_after=timedelta(seconds=options['stale_after']),
+            heartbeat_interval=options['heartbeat_interval'],
+            on_finish=report,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f'👷 Worker {worker.worker_id} rendering with {options["pool_size"] or os.cpu_count()} process(es)')
+        )
+
+        try:
+            processed = worker.run(drain=options['drain'], max_jobs=options['max_jobs'])
+        except KeyboardInterrupt:
+            processed = worker.processed
+            self.stdout.write(self.style.WARNING('Interrupted; unfinished jobs are requeued once they go stale'))
+
+        self.stdout.write(f'📊 Processed {processed} job(s)')
+        if processed:
+            for line in metrics_registry.summary_lines():
+                self.stdout.write(f'   {line}')
@@ -9,6 +9,7 @@ from pathlib import Path
 import json
 import shutil
 
+from resumes.artifact_store import ArtifactStore
 from resumes.models import ColorScheme, UserColorScheme, ResumeTemplate
 from resumes.services import ResumeGenerationService
 
@@ -86,6 +87,10 @@ class Command(BaseCommand):
             temp_file.unlink(missing_ok=True)
             self.stdout.write(f"   Removed: {temp_file}")
         
+        # Remove rendered files no resume or job references any more
+        removed_blobs = ArtifactStore().collect_garbage()
+        self.stdout.write(f"   Removed {removed_blobs} unreferenced rendered file(s)")
+        
         # Clean up old migration files (keep the latest)
         # This is a placeholder - implement if needed
         
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Build Manifest for Incremental Resume Generation
+
+Records, for every generated artifact, a hash of the inputs it was rendered
+from: the resume data file, the color scheme file, the design constants and
+the generator source. Artifacts whose inputs are unchanged are skipped on
+the next run.
+
+Sharded runs (see sharding.py) each record into a partial manifest next to
+the main one; merge_shard_manifests folds the partials back in.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from resume_generator_django.resume_generator import constants
+
+
+MANIFEST_FILENAME = ".manifest.json"
+SHARD_MANIFEST_PATTERN = ".manifest.shard-{index}-of-{count}.json"
+MANIFEST_VERSION = 1
+
+# Modules whose source determines rendered output; editing any of them
+# invalidates every artifact
+RENDERER_MODULES = ("core_services.py", "document_model.py", "style_registry.py", "section_cache.py", "docx_template.py")
+
+
+def file_sha256(path) -> str:
+    """Return the hex SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def generator_code_version() -> str:
+    """Hash of the renderer source files, used as the generator code version"""
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).resolve().parent
+    for module in RENDERER_MODULES:
+        digest.update(module.encode("utf-8"))
+        digest.update(file_sha256(package_dir / module).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Per-artifact input hashes stored as JSON under the output directory"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.root = self.path.parent
+        self.artifacts: Dict[str, Dict[str, Any]] = {}
+        self._file_hashes: Dict[str, str] = {}
+        self._shared_hash: Optional[str] = None
+        self._load()
+
+    @classmethod
+    def for_output_dir(cls, output_dir: str) -> "BuildManifest":
+        """Open (or start) the manifest for an output directory"""
+        return cls(Path(output_dir) / MANIFEST_FILENAME)
+
+    @classmethod
+    def for_shard(cls, output_dir: str, index: int, count: int) -> "BuildManifest":
+        """Open (or start) the partial manifest shard index (1-based) of count records into"""
+        return cls(Path(output_dir) / SHARD_MANIFEST_PATTERN.format(index=index, count=count))
+
+    def _load(self):
+        """Load an existing manifest; unreadable or outdated manifests start empty"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.artifacts = data.get("artifacts", {})
+
+    def _hash_file(self, path: Path) -> str:
+        """Hash a file once per manifest instance"""
+        key = str(path)
+        if key not in self._file_hashes:
+            self._file_hashes[key] = file_sha256(path)
+        return self._file_hashes[key]
+
+    def _shared_inputs_hash(self) -> str:
+        """Hash of the inputs every artifact depends on (constants and generator code)"""
+        if self._shared_hash is None:
+            digest = hashlib.sha256()
+            digest.update(self._hash_file(Path(constants.__file__)).encode("utf-8"))
+            digest.update(generator_code_version().encode("utf-8"))
+            self._shared_hash = digest.hexdigest()
+        return self._shared_hash
+
+    def files_hash(self, paths) -> str:
+        """Hash the contents of a fixed list of files"""
+        digest = hashlib.sha256()
+        for path in paths:
+            digest.update(self._hash_file(Path(path)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def input_hash(self, data_file: Path, config_file: Optional[Path], variant: str = "") -> str:
+        """
+        Hash everything an artifact is rendered from.
+
+        Args:
+            data_file: The resume_data.json the artifact is rendered from
+            config_file: The color scheme (or input config) file, if any
+            variant: Render options that change the output (e.g. a PDF
+                profile); empty for the defaults
+
+        Returns:
+            Hex digest that changes whenever any input changes
+        """
+        digest = hashlib.sha256()
+        digest.update(self._hash_file(data_file).encode("utf-8"))
+        digest.update(self._hash_file(config_file).encode("utf-8") if config_file else b"-")
+        digest.update(self._shared_inputs_hash().encode("utf-8"))
+        if variant:
+            digest.update(variant.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _key(self, artifact_path) -> str:
+        """Manifest key: artifact path relative to the output directory"""
+        return Path(artifact_path).relative_to(self.root).as_posix()
+
+    def is_recorded(self, artifact_path, input_hash: str) -> bool:
+        """True if the manifest lists the artifact as rendered from the same inputs, whether or not it is on disk"""
+        entry = self.artifacts.get(self._key(artifact_path))
+        return bool(entry) and entry.get("inputs") == input_hash
+
+    def is_current(self, artifact_path, input_hash: str) -> bool:
+        """True if the artifact exists and was rendered from the same inputs"""
+        return self.is_recorded(artifact_path, input_hash) and Path(artifact_path).exists()
+
+    def record(self, artifact_path, input_hash: str, seconds: Optional[float] = None):
+        """Record a freshly rendered artifact, with its render time when known (used to balance shards)"""
+        entry = {
+            "inputs": input_hash,
+            "sha256": file_sha256(artifact_path),
+        }
+        if seconds is not None:
+            entry["seconds"] = round(seconds, 4)
+        self.artifacts[self._key(artifact_path)] = entry
+
+    def render_seconds(self, artifact_path) -> Optional[float]:
+        """Render time recorded for an artifact, if any"""
+        entry = self.artifacts.get(self._key(artifact_path))
+        return entry.get("seconds") if entry else None
+
+    def copy_entry(self, source: "BuildManifest", artifact_path):
+        """Carry an artifact's entry over from another manifest over the same output directory"""
+        key = self._key(artifact_path)
+        if key in source.artifacts:
+            self.artifacts[key] = dict(source.artifacts[key])
+
+    def save(self):
+        """Write the manifest atomically with stable key order"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "artifacts": self.artifacts}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+
+
+def merge_shard_manifests(output_dir: str) -> List[Path]:
+    """
+    Fold every partial shard manifest under output_dir into the main manifest.
+
+    Partials are applied in name order (shards are disjoint, so order only
+    matters for leftovers of an older split) and deleted once the main
+    manifest is saved.
+
+    Returns:
+        The partial manifests merged
+    """
+    manifest = BuildManifest.for_output_dir(output_dir)
+    partials = sorted(Path(output_dir).glob(SHARD_MANIFEST_PATTERN.format(index="*", count="*")))
+    for partial_path in partials:
+        manifest.artifacts.update(BuildManifest(partial_path).artifacts)
+    manifest.save()
+    for partial_path in partials:
+        partial_path.unlink()
+    return partials
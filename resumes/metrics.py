@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Process-Local Render Metrics
+
+Timing spans around the render hot paths (load, styles, document model,
+sections, build, save, per-page header) record into a registry of
+histograms keyed by span name, format and color scheme, so production
+renders report p50/p95 latency without an external profiler.
+
+Histograms use fixed logarithmic buckets, so memory stays constant however
+many renders are observed and histograms from worker processes merge by
+adding counts. Percentiles are interpolated within their bucket, which is
+about 19% wide.
+
+    with span("build", format="pdf", scheme="corporate_blue"):
+        doc.build(story)
+
+    registry.snapshot()   # {"spans": [{"name": "build", "p50": ..., "p95": ...}]}
+"""
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Bucket upper bounds in seconds: 10µs to ~100s, each 2**(1/4) (~19%) wider than the last
+BUCKET_BOUNDS = tuple(0.00001 * 2 ** (i / 4) for i in range(93))
+
+# Span names in report order
+SPAN_ORDER = ("load", "styles", "model", "sections", "build", "save", "header", "render")
+
+
+class Histogram:
+    """Latency histogram over BUCKET_BOUNDS (the last count is the overflow bucket)"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def merge(self, state: Dict[str, Any]):
+        """Add another histogram's exported state"""
+        for index, bucket_count in enumerate(state["counts"]):
+            self.counts[index] += bucket_count
+        self.count += state["count"]
+        self.total += state["total"]
+        for bound, pick in (("min", min), ("max", max)):
+            if state[bound] is not None:
+                current = getattr(self, bound)
+                setattr(self, bound, state[bound] if current is None else pick(current, state[bound]))
+
+    def export(self) -> Dict[str, Any]:
+        return {"counts": list(self.counts), "count": self.count, "total": self.total, "min": self.min, "max": self.max}
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated q-quantile (0..1) in seconds, interpolated within its bucket"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = BUCKET_BOUNDS[index - 1] if index else 0.0
+                upper = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                estimate = lower + (upper - lower) * (rank - cumulative) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            cumulative += bucket_count
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class MetricsRegistry:
+    """Span histograms keyed by (name, format, scheme), safe to record into from several threads"""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, Optional[str], Optional[str]], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, format: Optional[str] = None, scheme: Optional[str] = None):
+        """Record one span duration"""
+        key = (name, format, scheme)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def export(self) -> List[Tuple[tuple, Dict[str, Any]]]:
+        """Raw, picklable histogram state for merging into another registry"""
+        with self._lock:
+            return [(key, histogram.export()) for key, histogram in self._histograms.items()]
+
+    def drain(self) -> List[Tuple[tuple, Dict[str, Any]]]:
+        """Export and clear; worker processes ship their spans to the parent this way"""
+        with self._lock:
+            state = [(key, histogram.export()) for key, histogram in self._histograms.items()]
+            self._histograms.clear()
+        return state
+
+    def merge(self, state: List[Tuple[tuple, Dict[str, Any]]]):
+        """Add histograms exported by another registry"""
+        with self._lock:
+            for key, histogram_state in state:
+                key = tuple(key)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram()
+                histogram.merge(histogram_state)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summary of every histogram (seconds), ordered by span, format and scheme"""
+        with self._lock:
+            items = [(key, histogram.summary()) for key, histogram in self._histograms.items()]
+
+        def order(item):
+            (name, format, scheme), _ = item
+            return (SPAN_ORDER.index(name) if name in SPAN_ORDER else len(SPAN_ORDER), name, format or "", scheme or "")
+
+        return {"spans": [
+            {"name": name, "format": format, "scheme": scheme, **summary}
+            for (name, format, scheme), summary in sorted(items, key=order)
+        ]}
+
+    def summary_lines(self, by_scheme: bool = False) -> List[str]:
+        """
+        Latency table for the console, in milliseconds.
+
+        Args:
+            by_scheme: One row per color scheme instead of merging schemes per span and format
+        """
+        if by_scheme:
+            rows = self.snapshot()["spans"]
+        else:
+            merged = MetricsRegistry()
+            merged.merge([((name, format, None), state) for (name, format, _), state in self.export()])
+            rows = merged.snapshot()["spans"]
+
+        lines = [f"{'span':8} {'format':6} {'scheme':26} {'count':>7} {'p50':>9} {'p95':>9} {'max':>9}"]
+        for row in rows:
+            lines.append(
+                f"{row['name']:8} {row['format'] or '-':6} {row['scheme'] or '*':26} {row['count']:7d} "
+                f"{row['p50'] * 1000:7.2f}ms {row['p95'] * 1000:7.2f}ms {row['max'] * 1000:7.2f}ms"
+            )
+        return lines
+
+    def dump(self, path):
+        """Write the snapshot as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+            f.write("\n")
+
+
+# The registry every span in this process records into
+registry = MetricsRegistry()
+
+
+@contextmanager
+def span(name: str, format: Optional[str] = None, scheme: Optional[str] = None):
+    """Time the enclosed block into the process registry"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(name, time.perf_counter() - start, format, scheme)
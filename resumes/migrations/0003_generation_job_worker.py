@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0002_add_user_color_scheme'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumegenerationjob',
+            name='resume_data',
+            field=models.ForeignKey(blank=True, help_text='Resume content the job renders', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='generation_jobs', to='resumes.userresumedata'),
+        ),
+        migrations.AddField(
+            model_name='resumegenerationjob',
+            name='worker_id',
+            field=models.CharField(blank=True, help_text='Worker that claimed the job', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='resumegenerationjob',
+            name='resume',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='generation_jobs', to='resumes.resume'),
+        ),
+        migrations.AddIndex(
+            model_name='resumegenerationjob',
+            index=models.Index(fields=['status', 'created_at'], name='resumes_job_status_created'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0003_generation_job_worker'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumegenerationjob',
+            name='canonical_job',
+            field=models.ForeignKey(blank=True, help_text='Job whose render this job reuses', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='attached_jobs', to='resumes.resumegenerationjob'),
+        ),
+        migrations.AddField(
+            model_name='resumegenerationjob',
+            name='output_type',
+            field=models.CharField(choices=[('ats', 'ATS'), ('human', 'Human')], default='ats', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='resumegenerationjob',
+            name='render_key',
+            field=models.CharField(blank=True, db_index=True, help_text='Hash of content, color scheme, formats, length and output type', max_length=64),
+        ),
+    ]
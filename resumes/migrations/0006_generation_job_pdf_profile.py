@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0005_artifact_store'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumegenerationjob',
+            name='pdf_profile',
+            field=models.CharField(choices=[('preview', 'Preview (fastest, uncompressed)'), ('standard', 'Standard'), ('web', 'Web (fast web view)'), ('archive', 'Archive (smallest)')], default='standard', help_text='Named PDF output profile (see core_services.PDF_PROFILES)', max_length=10),
+        ),
+    ]
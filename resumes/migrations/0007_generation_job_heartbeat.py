@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0006_generation_job_pdf_profile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumegenerationjob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, help_text='Last time the claiming worker reported the job alive', null=True),
+        ),
+    ]
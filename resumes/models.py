@@ -173,6 +173,20 @@ class UserResumeData(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.resume_type} ({self.length_variant})"
     
+    def to_resume_data(self):
+        """Resume content in the resume_data.json layout the generators read"""
+        return {
+            'personal_info': self.personal_info,
+            'summary': self.summary,
+            'competencies': self.competencies,
+            'experience': self.experience,
+            'achievements': self.achievements,
+            'education': self.education,
+            'projects': self.projects,
+            'certifications': self.certifications,
+            'additional_info': self.additional_info,
+        }
+    
     def get_file_paths(self):
         """Get all generated file paths for this resume"""
         import os
@@ -593,7 +607,11 @@ class ResumeGenerationJob(models.Model):
     """Track resume generation jobs"""
     
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='generation_jobs')
-    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='generation_jobs')
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='generation_jobs', null=True, blank=True)
+    resume_data = models.ForeignKey(
+        UserResumeData, on_delete=models.CASCADE, related_name='generation_jobs', null=True, blank=True,
+        help_text="Resume content the job renders"
+    )
     
     job_id = models.CharField(max_length=100, unique=True)
     status = models.CharField(
@@ -610,18 +628,101 @@ class ResumeGenerationJob(models.Model):
     # Job parameters
     formats = models.JSONField(default=list, help_text="List of formats to generate")
     color_scheme = models.ForeignKey(ColorScheme, on_delete=models.SET_NULL, null=True, blank=True)
+    output_type = models.CharField(
+        max_length=10,
+        choices=[
+            ('ats', 'ATS'),
+            ('human', 'Human'),
+        ],
+        default='ats'
+    )
+    pdf_profile = models.CharField(
+        max_length=10,
+        choices=[
+            ('preview', 'Preview (fastest, uncompressed)'),
+            ('standard', 'Standard'),
+            ('web', 'Web (fast web view)'),
+            ('archive', 'Archive (smallest)'),
+        ],
+        default='standard',
+        help_text="Named PDF output profile (see core_services.PDF_PROFILES)"
+    )
+    
+    # Coalescing: jobs with the same render key share one render
+    render_key = models.CharField(max_length=64, blank=True, db_index=True,
+                                  help_text="Hash of content, color scheme, formats, length and output type")
+    canonical_job = models.ForeignKey(
+        'self', on_delete=models.SET_NULL, null=True, blank=True, related_name='attached_jobs',
+        help_text="Job whose render this job reuses"
+    )
     
     # Results
     result_files = models.JSONField(default=dict, help_text="Generated file paths")
     error_message = models.TextField(blank=True)
+    worker_id = models.CharField(max_length=100, blank=True, help_text="Worker that claimed the job")
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True, help_text="Last time the claiming worker reported the job alive")
     completed_at = models.DateTimeField(null=True, blank=True)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Workers claim the oldest queued job
+            models.Index(fields=['status', 'created_at'], name='resumes_job_status_created'),
+        ]
+    
+    def __str__(self):
+        target = self.resume.title if self.resume else self.resume_data
+        return f"Job {self.job_id} - {target}"
+
+
+class RenderBlob(models.Model):
+    """A rendered file stored once by content hash, however many resumes and jobs produced it"""
+    
+    sha256 = models.CharField(max_length=64, unique=True)
+    format = models.CharField(max_length=10)
+    size = models.PositiveBigIntegerField()
+    ref_count = models.IntegerField(default=0, help_text="Number of StoredFile references")
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.sha256[:12]}.{self.format} ({self.ref_count} refs)"
+
+
+class RenderArtifact(models.Model):
+    """Render key of one format -> the blob it produced, so a repeat render is a lookup"""
+    
+    render_key = models.CharField(max_length=64, unique=True)
+    blob = models.ForeignKey(RenderBlob, on_delete=models.CASCADE, related_name='artifacts')
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.render_key[:12]} -> {self.blob}"
+
+
+class StoredFile(models.Model):
+    """One format of a resume or generation job, resolved through the blob store"""
+    
+    blob = models.ForeignKey(RenderBlob, on_delete=models.PROTECT, related_name='references')
+    format = models.CharField(max_length=10)
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, null=True, blank=True, related_name='stored_files')
+    job = models.ForeignKey(ResumeGenerationJob, on_delete=models.CASCADE, null=True, blank=True, related_name='stored_files')
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['resume', 'format'], condition=models.Q(resume__isnull=False),
+                                    name='resumes_storedfile_resume_format'),
+            models.UniqueConstraint(fields=['job', 'format'], condition=models.Q(job__isnull=False),
+                                    name='resumes_storedfile_job_format'),
+        ]
     
     def __str__(self):
-        return f"Job {self.job_id} - {self.resume.title}"
\ No newline at end of file
+        owner = f"resume {self.resume_id}" if self.resume_id else f"job {self.job_id}"
+        return f"{owner} {self.format} -> {self.blob.sha256[:12]}"
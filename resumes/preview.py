@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Live Preview Rendering
+
+Renders the first page of a resume as a PNG for interactive editing: only
+page 1 is laid out to PDF (see generate_pdf's max_pages), in memory and
+uncompressed (the "preview" PDF profile), and PyMuPDF rasterizes it.
+Previews are cached in Django's cache under a hash of the content, color
+scheme and resolution, so toggling back to an earlier state, or another user
+previewing identical content, costs nothing.
+
+Rapid edits are debounced per channel (one user's resume) on the trailing
+edge, without holding the request: an uncached request takes the channel's
+next sequence number (an atomic cache increment) and gets PreviewDeferred
+with it at once. The client retries with that ticket after the window; the
+retry renders only if no newer request has taken a ticket since and the
+window has passed, so a burst of edits renders just its final state, once.
+Retries for overtaken tickets raise PreviewSuperseded. With several server
+processes this needs a shared cache backend (settings_production uses
+Redis); the default local-memory cache debounces within one process.
+"""
+
+import io
+import math
+import time
+from typing import Any, Dict, Optional
+
+import pymupdf
+from django.conf import settings
+from django.core.cache import cache
+
+from .core_services import ResumeGenerator
+from .generation_worker import render_key
+from .metrics import span as timing_span
+
+
+PREVIEW_DPI = 96
+PREVIEW_CACHE_SECONDS = 60 * 60
+DEFAULT_DEBOUNCE_SECONDS = 0.3
+# Sequence counters and arrival times only need to outlive a burst of edits
+SEQUENCE_TIMEOUT = 10 * 60
+
+
+class PreviewDeferred(Exception):
+    """The preview will render once its channel has been quiet for the debounce window; retry with ticket"""
+
+    def __init__(self, channel: str, ticket: int, retry_after: int):
+        super().__init__(channel)
+        self.ticket = ticket
+        self.retry_after = retry_after
+
+
+class PreviewSuperseded(Exception):
+    """A newer preview request for the same channel took a ticket after this one"""
+
+
+def preview_key(data: Dict[str, Any], color_scheme: str, config: Dict[str, Any], length_variant: str,
+                output_type: str = 'ats', dpi: int = PREVIEW_DPI) -> str:
+    """Cache key of a preview: the render key of its content plus the image resolution"""
+    return "preview:" + render_key(data, color_scheme, config, [f"png@{dpi}"], length_variant, output_type)
+
+
+def render_preview(data: Dict[str, Any], color_scheme: str, config: Dict[str, Any], length_variant: str,
+                   output_type: str = 'ats', dpi: int = PREVIEW_DPI) -> bytes:
+    """First page of the resume as PNG bytes, uncached"""
+    with timing_span("preview", "png", color_scheme):
+        generator = ResumeGenerator.from_data(data, config, color_scheme, length_variant, output_type)
+        buffer = io.BytesIO()
+        generator.generate_pdf(buffer, max_pages=1, profile="preview")
+        with pymupdf.open(stream=buffer.getvalue(), filetype="pdf") as pdf:
+            return pdf[0].get_pixmap(dpi=dpi).tobytes("png")
+
+
+def _retry_after(seconds: float) -> int:
+    """Whole seconds to wait, rounded up (Retry-After takes no fractions)"""
+    return max(1, math.ceil(seconds))
+
+
+def take_ticket(channel: str) -> int:
+    """Atomically take the next sequence number on channel and record when it arrived"""
+    counter = f"preview-seq:{channel}"
+    cache.add(counter, 0, timeout=SEQUENCE_TIMEOUT)
+    try:
+        ticket = cache.incr(counter)
+    except ValueError:
+        # The counter expired between add and incr
+        cache.add(counter, 0, timeout=SEQUENCE_TIMEOUT)
+        ticket = cache.incr(counter)
+    cache.touch(counter, SEQUENCE_TIMEOUT)
+    cache.set(f"preview-arrival:{channel}:{ticket}", time.time(), timeout=SEQUENCE_TIMEOUT)
+    return ticket
+
+
+def settled(channel: str, ticket: int, window: float) -> float:
+    """
+    Seconds left before ticket may render, 0 once the window has passed.
+
+    Raises:
+        PreviewSuperseded: If a newer ticket was taken on channel, or ticket is unknown
+    """
+    arrived = cache.get(f"preview-arrival:{channel}:{ticket}")
+    if arrived is None or cache.get(f"preview-seq:{channel}") != ticket:
+        raise PreviewSuperseded(channel)
+    return max(0.0, window - (time.time() - arrived))
+
+
+def preview_png(data: Dict[str, Any], color_scheme: str, config: Dict[str, Any], length_variant: str,
+                output_type: str = 'ats', channel: Optional[str] = None, ticket: Optional[int] = None,
+                dpi: int = PREVIEW_DPI) -> bytes:
+    """
+    Cached first-page PNG, rendering on a miss once the channel has settled.
+
+    Args:
+        channel: Debounce channel, e.g. "<user id>:<resume data id>"; None
+            renders without debouncing
+        ticket: Sequence number from an earlier PreviewDeferred, when retrying
+
+    Raises:
+        PreviewDeferred: If the preview isn't cached and the channel hasn't
+            been quiet for the debounce window; retry with its ticket
+        PreviewSuperseded: If a newer request on channel took a ticket after ticket
+    """
+    key = preview_key(data, color_scheme, config, length_variant, output_type, dpi)
+    png = cache.get(key)
+    if png is not None:
+        return png
+
+    window = settings.RESUME_GENERATOR.get('PREVIEW_DEBOUNCE_SECONDS', DEFAULT_DEBOUNCE_SECONDS)
+    if channel is not None and window > 0:
+        if ticket is None:
+            raise PreviewDeferred(channel, take_ticket(channel), _retry_after(window))
+        remaining = settled(channel, ticket, window)
+        if remaining > 0:
+            raise PreviewDeferred(channel, ticket, _retry_after(remaining))
+
+    png = render_preview(data, color_scheme, config, length_variant, output_type, dpi)
+    cache.set(key, png, PREVIEW_CACHE_SECONDS)
+    return png
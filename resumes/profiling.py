@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Render Profiling for Batch Generation
+
+Profiles every render with cProfile and aggregates the profiles per format
+(plus "setup" for loading data and creating styles, which each render group
+does once). Worker processes return raw cProfile stats, which pickle, so
+pooled runs aggregate the same way as in-process ones.
+
+For each label the profiler writes a pstats file (open with `python -m
+pstats` or snakeviz) and adds a profile to one speedscope JSON file (open at
+https://www.speedscope.app). It also splits time into the renderer's stages
+so it is obvious where a slow batch spends it.
+"""
+
+import cProfile
+import json
+import pstats
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+
+# Stage name -> (source file suffix, function name) of the function whose
+# cumulative time is the stage. The header callback draws the footer too.
+STAGES = {
+    "data_load": ("core_services.py", "_load_json"),
+    "create_styles": ("core_services.py", "_create_styles"),
+    "get_sections": ("core_services.py", "_get_sections"),
+    "doc_build": ("doctemplate.py", "build"),
+    "header_footer": ("core_services.py", "add_header"),
+}
+
+# Render labels in report order; formats outside this list follow alphabetically
+LABEL_ORDER = ("setup", "pdf", "docx", "rtf", "md")
+
+# Call paths worth less than this share of a profile are folded into their parent
+FLAMEGRAPH_MIN_SHARE = 0.0005
+FLAMEGRAPH_MAX_DEPTH = 128
+
+
+def profile_call(function: Callable, *args, **kwargs) -> Tuple[Any, Dict]:
+    """Run function under cProfile; returns its result and the raw (picklable) stats"""
+    profile = cProfile.Profile()
+    try:
+        result = profile.runcall(function, *args, **kwargs)
+    finally:
+        profile.create_stats()
+    return result, profile.stats
+
+
+def _stats_from_raw(raw: Dict) -> pstats.Stats:
+    stats = pstats.Stats()
+    stats.stats = raw
+    stats.get_top_level_stats()
+    return stats
+
+
+def _function_time(raw: Dict, file_suffix: str, name: str) -> float:
+    """Cumulative time of a function; the largest match wins when several share the name (e.g. overridden build)"""
+    return max(
+        (entry[3] for (filename, _, function_name), entry in raw.items()
+         if function_name == name and filename.endswith(file_suffix)),
+        default=0.0,
+    )
+
+
+def stage_times(raw: Dict) -> Dict[str, float]:
+    """
+    Split a profile's time into renderer stages.
+
+    doc_build excludes the header/footer callbacks it runs; "other" is
+    whatever the named stages do not cover.
+    """
+    times = {stage: _function_time(raw, *function) for stage, function in STAGES.items()}
+    times["doc_build"] = max(times["doc_build"] - times["header_footer"], 0.0)
+    total = sum(entry[2] for entry in raw.values())
+    times["other"] = max(total - sum(times.values()), 0.0)
+    times["total"] = total
+    return times
+
+
+def _flamegraph_samples(raw: Dict) -> Tuple[List[List[tuple]], List[float]]:
+    """
+    Approximate call-stack samples from cProfile's caller/callee edges.
+
+    cProfile keeps call edges, not stacks, so each function's time under a
+    given parent is apportioned by the parent's share of that function's
+    cumulative time. Recursion is cut where a function reappears on a path.
+    """
+    callees: Dict[tuple, Dict[tuple, float]] = {}
+    for function, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[function] = edge[3] if isinstance(edge, tuple) else 0.0
+
+    total = sum(entry[2] for entry in raw.values())
+    min_weight = total * FLAMEGRAPH_MIN_SHARE
+    samples: List[List[tuple]] = []
+    weights: List[float] = []
+
+    roots = [function for function, entry in raw.items() if not entry[4] and entry[3] > 0]
+    stack = [([root], raw[root][3]) for root in roots]
+    while stack:
+        path, time = stack.pop()
+        function = path[-1]
+        function_total = raw[function][3] if function in raw else 0.0
+        children = []
+        if len(path) < FLAMEGRAPH_MAX_DEPTH and function_total:
+            for callee, edge_time in callees.get(function, {}).items():
+                child_time = edge_time * time / function_total
+                if callee not in path and child_time >= min_weight:
+                    children.append((callee, child_time))
+        child_total = sum(child_time for _, child_time in children)
+        if child_total > time:
+            children = [(callee, child_time * time / child_total) for callee, child_time in children]
+            child_total = time
+        if time - child_total > 0:
+            samples.append(path)
+            weights.append(time - child_total)
+        stack.extend((path + [callee], child_time) for callee, child_time in children)
+    return samples, weights
+
+
+def to_speedscope(profiles: Dict[str, Dict], name: str = "resume rendering") -> Dict[str, Any]:
+    """Speedscope file (sampled profiles, seconds) with one profile per label"""
+    frames: List[Dict[str, Any]] = []
+    frame_index: Dict[tuple, int] = {}
+
+    def frame(function: tuple) -> int:
+        if function not in frame_index:
+            filename, line, function_name = function
+            entry = {"name": function_name}
+            if filename != "~":
+                entry.update(file=filename, line=line)
+            frame_index[function] = len(frames)
+            frames.append(entry)
+        return frame_index[function]
+
+    speedscope_profiles = []
+    for label, raw in profiles.items():
+        samples, weights = _flamegraph_samples(raw)
+        speedscope_profiles.append({
+            "type": "sampled",
+            "name": label,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": [[frame(function) for function in path] for path in samples],
+            "weights": weights,
+        })
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "resume_generator profiling",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": speedscope_profiles,
+    }
+
+
+class RenderProfiler:
+    """Aggregates per-render profiles by label ("setup" or a format)"""
+
+    def __init__(self):
+        self.stats: Dict[str, pstats.Stats] = {}
+        self.renders: Dict[str, int] = {}
+
+    def add(self, label: str, raw: Dict):
+        """Fold one render's raw stats into its label's aggregate"""
+        if label in self.stats:
+            self.stats[label].add(_stats_from_raw(raw))
+        else:
+            self.stats[label] = _stats_from_raw(raw)
+        self.renders[label] = self.renders.get(label, 0) + 1
+
+    def add_all(self, profiles: Dict[str, Dict]):
+        """Fold in every labelled profile of one render group"""
+        for label, raw in profiles.items():
+            self.add(label, raw)
+
+    def labels(self) -> List[str]:
+        return sorted(self.stats, key=lambda label: (LABEL_ORDER.index(label) if label in LABEL_ORDER else len(LABEL_ORDER), label))
+
+    def stage_report(self) -> Dict[str, Dict[str, float]]:
+        """Stage times in seconds per label, aggregated over every render"""
+        return {label: stage_times(self.stats[label].stats) for label in self.labels()}
+
+    def summary_lines(self) -> List[str]:
+        """Stage table for the console, one row per label"""
+        columns = list(STAGES) + ["other", "total"]
+        lines = [f"{'':8} {'renders':>7} " + " ".join(f"{column:>13}" for column in columns)]
+        for label, times in self.stage_report().items():
+            cells = " ".join(f"{times[column]:12.2f}s" for column in columns)
+            lines.append(f"{label:8} {self.renders[label]:7d} {cells}")
+        return lines
+
+    def write(self, output_dir) -> List[Path]:
+        """
+        Write <label>.pstats for each label, speedscope.json and stages.json.
+
+        Returns:
+            Paths written
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        for label in self.labels():
+            path = output_dir / f"{label}.pstats"
+            self.stats[label].dump_stats(path)
+            written.append(path)
+
+        speedscope = to_speedscope({label: self.stats[label].stats for label in self.labels()})
+        path = output_dir / "speedscope.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(speedscope, f)
+        written.append(path)
+
+        path = output_dir / "stages.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"renders": self.renders, "stages": self.stage_report()}, f, indent=2)
+            f.write("\n")
+        written.append(path)
+        return written
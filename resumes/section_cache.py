@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Process-Wide Section Flowable Cache
+
+Building a section's ReportLab flowables parses the markup of every
+paragraph in it, and _get_sections used to do that for the whole resume on
+every render. Flowables are now cached per section, keyed by a hash of the
+section's compiled content (its document-model blocks) and the style key
+(color scheme, config hash and layout scale). After an edit to one bullet
+only the experience section misses; the summary, projects, education and
+skills flowables are reused.
+
+Layout mutates flowables (wrap records sizes, KeepTogether remembers its
+height), so every hit returns fresh shallow copies: the parsed paragraph
+fragments are shared, the layout state is not. Entries are evicted least
+recently used first.
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+from reportlab.platypus import KeepTogether
+
+from .document_model import Section
+
+
+# Sections kept per process: a few schemes x lengths x sections of the resumes being edited,
+# plus the scaled variants auto-fit tries
+SECTION_CACHE_SIZE = 512
+
+_sections: "OrderedDict[tuple, List]" = OrderedDict()
+_sections_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def section_hash(section: Section) -> str:
+    """Stable hash of a section's compiled content"""
+    blocks = [(block.kind, sorted(vars(block).items())) for block in section.blocks]
+    return hashlib.sha256(repr((section.key, section.title, blocks)).encode("utf-8")).hexdigest()
+
+
+def _fresh(flowable):
+    """Copy of a cached flowable with its own layout state"""
+    if isinstance(flowable, KeepTogether):
+        return KeepTogether([_fresh(item) for item in flowable._content if item is not None], flowable._maxHeight)
+    return copy.copy(flowable)
+
+
+def cached_section(section: Section, style_key: tuple, build: Callable[[Section], List]) -> List:
+    """
+    Flowables of a section, built with build(section) on a miss.
+
+    Args:
+        section: Compiled document-model section
+        style_key: Everything besides the content that the flowables depend on
+        build: Builds the section's flowables
+    """
+    key = (section_hash(section), style_key)
+    with _sections_lock:
+        flowables = _sections.get(key)
+        if flowables is not None:
+            _sections.move_to_end(key)
+            _stats["hits"] += 1
+    if flowables is None:
+        flowables = build(section)
+        with _sections_lock:
+            _stats["misses"] += 1
+            _sections[key] = flowables
+            while len(_sections) > SECTION_CACHE_SIZE:
+                _sections.popitem(last=False)
+    return [_fresh(flowable) for flowable in flowables]
+
+
+def section_cache_info() -> Dict[str, int]:
+    """Hit/miss statistics and current size of the section cache"""
+    with _sections_lock:
+        return {**_stats, "size": len(_sections)}
+
+
+def clear_section_cache():
+    """Drop every cached section and reset the statistics"""
+    with _sections_lock:
+        _sections.clear()
+        _stats.update(hits=0, misses=0)
@@ -119,8 +119,8 @@ class ResumeGenerationJobSerializer(serializers.ModelSerializer):
     class Meta:
         model = ResumeGenerationJob
         fields = [
-            'id', 'job_id', 'resume', 'resume_title', 'status',
-            'formats', 'color_scheme', 'color_scheme_name',
+            'id', 'job_id', 'resume', 'resume_data', 'resume_title', 'status',
+            'formats', 'color_scheme', 'color_scheme_name', 'output_type', 'pdf_profile', 'canonical_job',
             'result_files', 'error_message', 'created_at',
             'started_at', 'completed_at'
         ]
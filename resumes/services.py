@@ -74,6 +74,26 @@ class ResumeGenerationService:
                 "results": {"success": 0, "failed": 0}
             }
     
+    def estimate_pages(self, version: str, color_scheme: str, length_variant: str = "long", output_type: str = "ats") -> Dict[str, Any]:
+        """Predict the PDF page count of a resume without rendering it"""
+        try:
+            estimate = self.manager.estimate_pages(version, color_scheme, length_variant, output_type)
+            return {
+                "success": True,
+                "version": version,
+                "color_scheme": color_scheme,
+                "length": length_variant,
+                "output_type": output_type,
+                **estimate
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Error estimating pages: {str(e)}",
+                "version": version,
+                "color_scheme": color_scheme
+            }
+    
     def get_available_versions(self) -> List[str]:
         """Get list of available resume versions"""
         return list(self.manager.versions.keys())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Static Sharding of the Render Matrix
+
+Splits the (version, length, scheme) render groups of the matrix into n
+shards of roughly equal cost so several build nodes can share one run:
+
+    python generate_all_resumes.py --shard 1/3      # on each node, 1/3 .. 3/3
+    python generate_all_resumes.py --merge-shards   # once the outputs are gathered
+
+A group's cost is the render time recorded in the main manifest for each of
+its stale formats, or an estimate from the size of its resume data where
+there is no history; formats the manifest records as rendered from the
+current inputs will be skipped, so they cost nothing. Whether the files
+are on a node's disk plays no part in the split; each shard drops the
+artifacts it already has after assignment, as a full run does. Groups are dealt longest first to the least-loaded shard, so the
+split depends only on the inputs and the main manifest: every node that
+sees the same checkout computes the same split without coordinating.
+
+Each shard writes only its own groups' files, and records them in its own
+partial manifest (.manifest.shard-<i>-of-<n>.json) next to the main one.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+
+# Estimated seconds to render one format: (fixed, per KiB of resume_data.json),
+# fitted to single-process renders of the shipped inputs
+ESTIMATED_RENDER_SECONDS = {
+    "pdf": (0.040, 0.005),
+    "docx": (0.045, 0.005),
+    "rtf": (0.0003, 0.00002),
+    "md": (0.0002, 0.00001),
+}
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """
+    Parse "i/n" into (i, n), with i counted from 1.
+
+    Raises:
+        ValueError: If text is not of that form or i is outside 1..n
+    """
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/n (e.g. 2/4), got {text!r}") from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and the shard count, got {text!r}")
+    return index, count
+
+
+def group_cost(manager, manifest, group: tuple, force: bool = False, **stale_options) -> float:
+    """
+    Expected seconds to render one group's stale formats: recorded render
+    times, else estimates from its input size. Staleness comes from the
+    manifest's input hashes alone, never from files on disk.
+
+    Args:
+        force: Count every format, as a forced build renders them all
+        stale_options: Passed on to manager._stale_formats (e.g. pdf_profile)
+    """
+    version, length_variant, color_scheme, formats, output_dir, output_type = group
+    data_file = manager._input_dir(version, length_variant, output_type) / "resume_data.json"
+    try:
+        size_kib = data_file.stat().st_size / 1024
+    except FileNotFoundError:
+        # Reported as failures without rendering
+        return 0.0
+
+    stale, _ = manager._stale_formats(manifest, group, force, check_files=False, **stale_options)
+    cost = 0.0
+    for format_type in stale:
+        seconds = manifest.render_seconds(
+            manager._output_file(output_dir, version, length_variant, color_scheme, output_type, format_type)
+        )
+        if seconds is None:
+            fixed, per_kib = ESTIMATED_RENDER_SECONDS.get(format_type, ESTIMATED_RENDER_SECONDS["pdf"])
+            seconds = fixed + per_kib * size_kib
+        cost += seconds
+    return cost
+
+
+def plan_shards(manager, manifest, groups: List[tuple], count: int, force: bool = False,
+                **stale_options) -> List[Dict[str, Any]]:
+    """
+    Split render groups into count shards of similar total cost.
+
+    Groups are assigned longest first to the shard with the least cost so
+    far (ties go to the lower shard, then the earlier group), which is
+    deterministic and within one group's cost of the best split. Current
+    groups cost nothing, so they never weigh a shard down; they still go to
+    a shard, which keeps their entries in its partial manifest.
+
+    Args:
+        force, stale_options: As for group_cost
+
+    Returns:
+        One {"groups": [...], "cost": seconds} per shard, groups in matrix order
+    """
+    costs = [group_cost(manager, manifest, group, force, **stale_options) for group in groups]
+    loads = [0.0] * count
+    assignment = [0] * len(groups)
+    for position in sorted(range(len(groups)), key=lambda position: (-costs[position], position)):
+        shard = min(range(count), key=lambda shard: (loads[shard], shard))
+        assignment[position] = shard
+        loads[shard] += costs[position]
+
+    return [
+        {"groups": [group for group, assigned in zip(groups, assignment) if assigned == shard], "cost": loads[shard]}
+        for shard in range(count)
+    ]
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Process-Wide Paragraph Style Registry
+
+Every ResumeGenerator used to rebuild the full ReportLab stylesheet, even
+though only a handful of color schemes exist. Stylesheets are now built once
+per process for each (color scheme, config hash) pair and shared by every
+generator. They are read-only mappings; the ParagraphStyle objects in them
+must not be modified, since other generators use the same instances.
+
+Auto-fit layouts ask for scaled variants (smaller fonts or tighter spacing);
+those are derived from the base stylesheet and cached under the scales too.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Any
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+from resume_generator_django.resume_generator.constants import (
+    SPACE_MULTIPLIER_MINIMAL, SPACE_MULTIPLIER_SMALL, SPACE_MULTIPLIER_MEDIUM, SPACE_MULTIPLIER_LARGE,
+    get_spacing_constant, get_font_size, get_theme_font
+)
+
+
+_stylesheets: Dict[tuple, Mapping[str, ParagraphStyle]] = {}
+_stylesheets_lock = threading.Lock()
+
+
+def config_hash(config: Optional[Dict[str, Any]]) -> str:
+    """Stable hash of a color scheme config"""
+    return hashlib.sha256(json.dumps(config or {}, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build_stylesheet(color_scheme: str, config: Optional[Dict[str, Any]]) -> Mapping[str, ParagraphStyle]:
+    """Create paragraph styles based on config with theme-specific fonts"""
+    styles = getSampleStyleSheet()
+    
+    # Color schemes have colors directly, not wrapped in "colors"
+    colors = config or {}
+    
+    # Helper function to get theme-specific font with proper bold/italic handling
+    def get_font(role, bold=False, italic=False):
+        base_font = get_theme_font(color_scheme, role)
+        
+        # If the theme already specifies bold/italic, use it directly
+        if '-Bold' in base_font or '-Oblique' in base_font:
+            return base_font
+        
+        # Handle font variations for ReportLab
+        if bold and italic:
+            return f"{base_font}-BoldOblique"
+        elif bold:
+            return f"{base_font}-Bold"
+        elif italic:
+            return f"{base_font}-Oblique"
+        else:
+            return base_font
+    
+    custom_styles = {
+        "Name": ParagraphStyle(
+            "CustomName",
+            parent=styles["Heading1"],
+            fontSize=28,  # Bigger name - keep as special case, consistent across all themes
+            textColor=HexColor(colors.get("NAME_COLOR", "#2C3E50")),
+            alignment=TA_RIGHT,
+            spaceAfter=get_spacing_constant('base') * 1,
+            fontName=get_font('name', bold=True),
+        ),
+        "Title": ParagraphStyle(
+            "CustomTitle",
+            parent=styles["Heading2"],
+            fontSize=get_font_size('section_header'),
+            textColor=HexColor(colors.get("TITLE_COLOR", "#34495E")),
+            alignment=TA_CENTER,
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_LARGE,
+            fontName=get_font('primary', bold=True),
+        ),
+        "Subtitle": ParagraphStyle(
+            "CustomSubtitle",
+            parent=styles["Normal"],
+            fontSize=get_font_size('bullet_point'),
+            textColor=HexColor(colors.get("TITLE_COLOR", "#7F8C8D")),
+            alignment=TA_CENTER,
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_LARGE,
+            fontName=get_font('secondary'),
+        ),
+        # DESIGN SYSTEM: Consistent spacing scale (0.25, 0.5, 1, 2, 4 units)
+        # Typography hierarchy: 8, 9, 10, 11, 12, 14pt
+        # Color hierarchy: primary, secondary, accent, muted
+        
+        "SectionHeader": ParagraphStyle(
+            "CustomSectionHeader",
+            parent=styles["Heading2"],
+            fontSize=get_font_size('section_header'),
+            textColor=HexColor(colors.get("SECTION_HEADER_COLOR", "#2C3E50")),
+            spaceAfter=get_spacing_constant('header_to_content'),  # Minimal gap to content
+            spaceBefore=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,     # Medium units spacing - reduced whitespace between main sections
+            fontName=get_font('primary', bold=True),
+        ),
+        "JobTitle": ParagraphStyle(
+            "CustomJobTitle",
+            parent=styles["Normal"],
+            fontSize=get_font_size('job_title'),
+            textColor=HexColor(colors.get("JOB_TITLE_COLOR", "#666666")),  # Muted color
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_SMALL,   # Small spacing - increased gap between job title and subtitle
+            spaceBefore=get_spacing_constant('base') * SPACE_MULTIPLIER_SMALL,  # Small spacing
+            fontName=get_font('accent'),
+        ),
+        "Company": ParagraphStyle(
+            "CustomCompany",
+            parent=styles["Heading3"],
+            fontSize=get_font_size('company'),
+            textColor=HexColor(colors.get("COMPANY_COLOR", "#2C3E50")),  # Primary color
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MINIMAL,    # Minimal spacing after company
+            spaceBefore=get_spacing_constant('base') * SPACE_MULTIPLIER_MINIMAL,   # Minimal spacing before company
+            fontName=get_font('primary', bold=True),
+        ),
+        "Body": ParagraphStyle(
+            "CustomBody",
+            parent=styles["Normal"],
+            fontSize=get_font_size('body'),
+            textColor=HexColor(colors.get("DARK_TEXT_COLOR", "#2C3E50")),
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,      # Medium unit spacing
+            fontName=get_font('secondary'),
+        ),
+        "BulletPoint": ParagraphStyle(
+            "CustomBulletPoint",
+            parent=styles["Normal"],
+            fontSize=get_font_size('bullet_point'),
+            textColor=HexColor(colors.get("MEDIUM_TEXT_COLOR", "#666666")),
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_SMALL,    # Small unit spacing - tighter bullet spacing
+            leftIndent=12,
+            fontName=get_font('secondary'),
+        ),
+        "MainCompetency": ParagraphStyle(
+            "CustomMainCompetency",
+            parent=styles["Normal"],
+            fontSize=get_font_size('main_competency'),
+            textColor=HexColor(colors.get("COMPETENCY_HEADER_COLOR", "#2C3E50")),
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MINIMAL,    # Minimal unit spacing - minimal gap to bullets
+            spaceBefore=get_spacing_constant('base') * SPACE_MULTIPLIER_MINIMAL,   # Minimal unit spacing - minimal gap from previous
+            fontName=get_font('primary', bold=True),
+        ),
+        "SubCompetency": ParagraphStyle(
+            "CustomSubCompetency",
+            parent=styles["Normal"],
+            fontSize=get_font_size('sub_competency'),
+            textColor=HexColor(colors.get("ACCENT_COLOR", "#4682B4")),
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,    # Medium unit spacing
+            leftIndent=12,
+            fontName=get_font('accent', bold=True),
+        ),
+        "CompetencyDetail": ParagraphStyle(
+            "CustomCompetencyDetail",
+            parent=styles["Normal"],
+            fontSize=get_font_size('competency_detail'),
+            textColor=HexColor(colors.get("DARK_TEXT_COLOR", "#2C3E50")),
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,    # Medium unit spacing
+            leftIndent=0,
+            fontName=get_font('secondary'),
+            allowWidows=1,
+            allowOrphans=1,
+        ),
+        "Contact": ParagraphStyle(
+            "CustomContact",
+            parent=styles["Normal"],
+            fontSize=get_font_size('body'),
+            textColor=HexColor(colors.get("ACCENT_COLOR", "#4682B4")),  # Use accent color for header contact
+            alignment=TA_RIGHT,
+            spaceAfter=get_spacing_constant('base') * 1,
+            fontName=get_font('secondary'),
+        ),
+        "ContactStacked": ParagraphStyle(
+            "CustomContactStacked",
+            parent=styles["Normal"],
+            fontSize=get_font_size('body'),
+            textColor=HexColor(colors.get("ACCENT_COLOR", "#4682B4")),
+            alignment=TA_RIGHT,
+            spaceAfter=get_spacing_constant('base') * SPACE_MULTIPLIER_MEDIUM,
+            fontName=get_font('secondary'),
+        ),
+    }
+    
+    return MappingProxyType(custom_styles)
+
+
+def scale_stylesheet(stylesheet: Mapping[str, ParagraphStyle], font_scale: float,
+                     space_scale: float) -> Mapping[str, ParagraphStyle]:
+    """Derive a stylesheet with font sizes and leading multiplied by font_scale and paragraph spacing by space_scale"""
+    return MappingProxyType({
+        name: ParagraphStyle(
+            style.name,
+            parent=style,
+            fontSize=style.fontSize * font_scale,
+            leading=style.leading * font_scale,
+            spaceBefore=style.spaceBefore * space_scale,
+            spaceAfter=style.spaceAfter * space_scale,
+        )
+        for name, style in stylesheet.items()
+    })
+
+
+def get_stylesheet(color_scheme: str, config: Optional[Dict[str, Any]],
+                   font_scale: float = 1.0, space_scale: float = 1.0) -> Mapping[str, ParagraphStyle]:
+    """
+    Shared stylesheet for a color scheme and config, built on first use.
+    
+    Args:
+        color_scheme: Color scheme name, which selects the font theme
+        config: Color scheme config (the loaded color scheme JSON), if any
+        font_scale: Multiplier for font sizes and leading (auto-fit layouts)
+        space_scale: Multiplier for paragraph spacing (auto-fit layouts)
+        
+    Returns:
+        Read-only mapping of style name to ParagraphStyle
+    """
+    font_scale, space_scale = round(font_scale, 3), round(space_scale, 3)
+    key = (color_scheme, config_hash(config), font_scale, space_scale)
+    stylesheet = _stylesheets.get(key)
+    if stylesheet is None:
+        base = None if (font_scale, space_scale) == (1.0, 1.0) else get_stylesheet(color_scheme, config)
+        with _stylesheets_lock:
+            stylesheet = _stylesheets.get(key)
+            if stylesheet is None:
+                if base is None:
+                    stylesheet = build_stylesheet(color_scheme, config)
+                else:
+                    stylesheet = scale_stylesheet(base, font_scale, space_scale)
+                _stylesheets[key] = stylesheet
+    return stylesheet
+
+
+def prewarm_stylesheets(color_schemes: Optional[Iterable[str]] = None, color_schemes_dir="color_schemes") -> int:
+    """
+    Build the stylesheets of the shipped color schemes ahead of the first render.
+    
+    Args:
+        color_schemes: Scheme names to build (default: every file in color_schemes_dir)
+        color_schemes_dir: Directory holding <scheme>.json files
+        
+    Returns:
+        Number of stylesheets built or already cached
+    """
+    schemes_dir = Path(color_schemes_dir)
+    if color_schemes is None:
+        color_schemes = sorted(path.stem for path in schemes_dir.glob("*.json"))
+    
+    warmed = 0
+    for color_scheme in color_schemes:
+        scheme_file = schemes_dir / f"{color_scheme}.json"
+        try:
+            with open(scheme_file, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        get_stylesheet(color_scheme, config)
+        warmed += 1
+    return warmed
+
+
+def clear_stylesheet_cache():
+    """Drop every cached stylesheet"""
+    with _stylesheets_lock:
+        _stylesheets.clear()
@@ -2,15 +2,47 @@
 Test suite for Resume Generator Services
 """
 
+import io
 import json
+import os
+import pikepdf
+import pymupdf
+from docx import Document
+import shutil
 import tempfile
+import time
+import zipfile
 from pathlib import Path
-from django.test import TestCase
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import ProtectedError
+from django.test import TestCase, override_settings
+from django.utils import timezone
 from unittest.mock import patch, MagicMock
 
 from .services import ResumeGenerationService, ContentManagementService
-from .core_services import ResumeGenerator, highlight_quantitative_metrics
-from .models import CustomUser
+from .core_services import PDF_PROFILES, ResumeGenerator, ResumeManager, highlight_quantitative_metrics, render_pool
+from .artifact_store import ArtifactStore
+from .build_graph import BuildGraph, build_pipeline
+from .metrics import Histogram, registry as metrics_registry
+from .preview import render_preview, take_ticket
+from .manifest import BuildManifest, file_sha256, merge_shard_manifests
+from .profiling import RenderProfiler, profile_call, stage_times, to_speedscope
+from .sharding import parse_shard, plan_shards
+from . import docx_template
+from .docx_template import clear_docx_template, new_document
+from .section_cache import clear_section_cache, section_cache_info
+from .style_registry import clear_stylesheet_cache, get_stylesheet, prewarm_stylesheets
+from .document_model import LINK, METRIC, PLAIN, build_document, metric_spans, spans_to_markdown, token_cache_info
+from .generation_worker import (
+    GenerationWorker, claim_job, heartbeat, job_payload, render_job, render_key, requeue_stale_jobs, scheme_config,
+    submit_job
+)
+from .models import (
+    ColorScheme, CustomUser, RenderArtifact, RenderBlob, Resume, ResumeGenerationJob, ResumeTemplate, StoredFile,
+    UserResumeData,
+)
 
 
 class ResumeGenerationServiceTests(TestCase):
@@ -45,6 +77,15 @@ class ResumeGenerationServiceTests(TestCase):
         self.assertIn('docx', formats)
         self.assertIn('rtf', formats)
         self.assertIn('md', formats)
+    
+    def test_estimate_pages(self):
+        """Test page estimates for a shipped resume and for an unknown version"""
+        estimate = self.service.estimate_pages('comprehensive', 'default_professional')
+        self.assertTrue(estimate['success'])
+        self.assertGreaterEqual(estimate['pages'], 1)
+        self.assertEqual(estimate['sections'][0]['key'], 'summary')
+        
+        self.assertFalse(self.service.estimate_pages('nonexistent', 'default_professional')['success'])
 
 
 class ResumeGeneratorCoreTests(TestCase):
@@ -203,6 +244,202 @@ class ResumeGeneratorCoreTests(TestCase):
         self.assertEqual(sorted_experience[0]["title"], "Job 2")  # 2020 - Present
         self.assertEqual(sorted_experience[1]["title"], "Job 3")  # 2018 - 2020
         self.assertEqual(sorted_experience[2]["title"], "Job 1")  # 2015 - 2017
+    
+    def test_generate_many_shares_one_generator(self):
+        """Test rendering several formats from one generator instance"""
+        generator = ResumeGenerator(self.temp_file.name, self.config_file.name)
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir, True)
+        
+        with patch.object(generator, '_create_styles') as create_styles:
+            outputs = generator.generate_many(['pdf', 'docx', 'rtf', 'md'], output_dir, 'test_resume', format_subdirs=True)
+            create_styles.assert_not_called()
+        
+        self.assertEqual(set(outputs), {'pdf', 'docx', 'rtf', 'md'})
+        for format_type, path in outputs.items():
+            self.assertEqual(Path(path), Path(output_dir) / format_type / f"test_resume.{format_type}")
+            self.assertTrue(Path(path).exists())
+    
+    def test_document_model_is_built_once_for_all_formats(self):
+        """Test that every writer renders from one compiled document"""
+        generator = ResumeGenerator(self.temp_file.name, self.config_file.name)
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir, True)
+        
+        with patch('resumes.core_services.build_document', wraps=build_document) as build:
+            generator.generate_many(['pdf', 'docx', 'rtf', 'md'], output_dir, 'test_resume')
+            self.assertEqual(build.call_count, 1)
+        
+        markdown = (Path(output_dir) / 'test_resume.md').read_text(encoding='utf-8')
+        self.assertIn('## Professional Experience', markdown)
+        self.assertIn('### Test Company | Senior Developer - Austin, TX 2020 - Present', markdown)
+        # Most recent job first in every format
+        self.assertLess(markdown.index('Senior Developer'), markdown.index('Junior Developer'))
+    
+    def _multi_page_data(self, jobs=12):
+        """Test data with enough experience to run past one page"""
+        return dict(self.test_data, experience=[
+            dict(job, responsibilities=[f"Delivered {n}% faster releases across many teams and systems" for n in range(8)])
+            for job in (self.test_data["experience"] * jobs)[:jobs]
+        ])
+    
+    def test_estimate_pages_matches_rendered_pdf(self):
+        """Test that the page estimate agrees with a real build, including a multi-page resume"""
+        long_data = self._multi_page_data()
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir, True)
+        
+        for data in (self.test_data, long_data):
+            generator = ResumeGenerator.from_data(data, self.test_config)
+            estimate = generator.estimate_pages()
+            pdf_file = generator.generate_pdf(os.path.join(output_dir, 'test_resume.pdf'))
+            with pymupdf.open(pdf_file) as pdf:
+                self.assertEqual(estimate["pages"], pdf.page_count)
+        
+        self.assertGreater(estimate["pages"], 1)
+        sections = {section["key"]: section for section in estimate["sections"]}
+        self.assertEqual(sections["summary"]["start_page"], 1)
+        self.assertEqual(sections["experience"]["end_page"], estimate["pages"])
+        self.assertGreater(sections["experience"]["height"], estimate["frame_height"])
+    
+    def test_writers_accept_file_like_targets(self):
+        """Test that every writer renders into a binary stream, and render_bytes matches the file output"""
+        generator = ResumeGenerator.from_data(self.test_data, self.test_config)
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir, True)
+        
+        for format_type in ('rtf', 'md'):
+            path = generator.generate(format_type, os.path.join(output_dir, f'resume.{format_type}'))
+            with open(path, 'rb') as f:
+                self.assertEqual(generator.render_bytes(format_type), f.read())
+        
+        with pymupdf.open(stream=generator.render_bytes('pdf'), filetype='pdf') as pdf:
+            self.assertIn(self.test_data['personal_info']['name'], pdf[0].get_text())
+        buffer = io.BytesIO()
+        self.assertIs(generator.generate_docx(buffer), buffer)
+        self.assertIn(self.test_data['personal_info']['name'], Document(io.BytesIO(buffer.getvalue())).paragraphs[0].text)
+    
+    def test_header_and_footer_are_shared_forms(self):
+        """Test that every page places the same header/footer XObjects and still gets its own links and page number"""
+        generator = ResumeGenerator.from_data(self._multi_page_data(), self.test_config)
+        with pymupdf.open(stream=generator.render_bytes('pdf'), filetype='pdf') as pdf:
+            self.assertGreater(pdf.page_count, 1)
+            forms = [sorted((xref, name) for xref, name, *_ in page.get_xobjects()) for page in pdf]
+            links = [[link['uri'] for link in page.get_links() if link.get('uri', '').startswith('https://www.openstreetmap')] for page in pdf]
+            for number, page in enumerate(pdf, 1):
+                self.assertIn(f"Page {number}", page.get_text())
+        
+        self.assertEqual(len(forms[0]), 2)
+        self.assertTrue(all(page_forms == forms[0] for page_forms in forms))
+        self.assertTrue(all(len(page_links) == 1 for page_links in links))
+    
+    def test_reproducible_outputs_are_byte_identical(self):
+        """Test that PDF and DOCX carry fixed timestamps and IDs, so renders of equal inputs match byte for byte"""
+        renders = [ResumeGenerator.from_data(self.test_data, self.test_config, reproducible=True) for _ in range(2)]
+        for format_type in ('pdf', 'docx', 'rtf', 'md'):
+            self.assertEqual(renders[0].render_bytes(format_type), renders[1].render_bytes(format_type), format_type)
+        
+        pdf = renders[0].render_bytes('pdf')
+        self.assertIn(b'/CreationDate (D:20000101', pdf)
+        with zipfile.ZipFile(io.BytesIO(renders[0].render_bytes('docx'))) as docx:
+            self.assertEqual({info.date_time for info in docx.infolist()}, {(2000, 1, 1, 0, 0, 0)})
+        live = ResumeGenerator.from_data(self.test_data, self.test_config).render_bytes('pdf')
+        self.assertNotIn(b'/CreationDate (D:20000101', live)
+    
+    def test_only_batch_builds_are_reproducible_by_default(self):
+        """Test that request-time generators keep real timestamps while the batch manager's are fixed"""
+        manager = ResumeManager()
+        batch = manager._create_generator(manager._input_dir("comprehensive", "long", "ats"), "default_professional", "long", "ats")
+        
+        self.assertTrue(batch.reproducible)
+        self.assertFalse(ResumeGenerator.from_data(self.test_data, self.test_config).reproducible)
+    
+    def test_unchanged_outputs_are_not_rewritten(self):
+        """Test that re-rendering identical bytes leaves the file and its mtime alone"""
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir, True)
+        generator = ResumeGenerator.from_data(self.test_data, self.test_config, reproducible=True)
+        paths = generator.generate_many(['pdf', 'docx', 'md'], output_dir)
+        for path in paths.values():
+            os.utime(path, (1_000_000_000, 1_000_000_000))
+        
+        ResumeGenerator.from_data(self.test_data, self.test_config, reproducible=True).generate_many(['pdf', 'docx', 'md'], output_dir)
+        self.assertEqual({os.stat(path).st_mtime for path in paths.values()}, {1_000_000_000})
+        
+        edited = dict(self.test_data, summary='A different summary')
+        ResumeGenerator.from_data(edited, self.test_config).generate('md', paths['md'])
+        self.assertNotEqual(os.stat(paths['md']).st_mtime, 1_000_000_000)
+    
+    def test_pdf_profiles_change_size_not_content(self):
+        """Test that each PDF profile writes the same pages and text at its own size, reproducibly, and web is linearized"""
+        generator = ResumeGenerator.from_data(self._multi_page_data(), self.test_config, reproducible=True)
+        pdfs = {}
+        for profile in PDF_PROFILES:
+            buffer = io.BytesIO()
+            generator.generate_pdf(buffer, profile=profile)
+            pdfs[profile] = buffer.getvalue()
+        
+        self.assertEqual(pdfs['standard'], generator.render_bytes('pdf'))
+        self.assertGreater(len(pdfs['preview']), len(pdfs['standard']))
+        self.assertLess(len(pdfs['archive']), len(pdfs['standard']))
+        self.assertLess(len(pdfs['web']), len(pdfs['standard']))
+        texts = set()
+        for pdf_bytes in pdfs.values():
+            with pymupdf.open(stream=pdf_bytes, filetype='pdf') as pdf:
+                texts.add(tuple(page.get_text() for page in pdf))
+        self.assertEqual(len(texts), 1)
+        for profile, pdf_bytes in pdfs.items():
+            with pikepdf.open(io.BytesIO(pdf_bytes)) as pdf:
+                self.assertEqual(pdf.is_linearized, profile == 'web', profile)
+        self.assertIn(b'/Linearized', pdfs['web'][:1024])
+        
+        archive = ResumeGenerator.from_data(self._multi_page_data(), self.test_config, reproducible=True, pdf_profile='archive')
+        self.assertEqual(archive.render_bytes('pdf'), pdfs['archive'])
+        with self.assertRaises(ValueError):
+            ResumeGenerator.from_data(self.test_data, self.test_config, pdf_profile='tiny')
+    
+    def test_max_pages_stops_layout_early(self):
+        """Test that generate_pdf with max_pages writes only that many pages of a longer resume"""
+        generator = ResumeGenerator.from_data(self._multi_page_data(), self.test_config)
+        buffer = io.BytesIO()
+        generator.generate_pdf(buffer, max_pages=1)
+        with pymupdf.open(stream=buffer.getvalue(), filetype='pdf') as pdf:
+            self.assertEqual(pdf.page_count, 1)
+    
+    def test_auto_fit_shrinks_to_page_target(self):
+        """Test that auto-fit finds a smaller layout that meets the target in a real build"""
+        generator = ResumeGenerator.from_data(self._multi_page_data(3), self.test_config)
+        natural_pages = generator.estimate_pages()["pages"]
+        self.assertEqual(natural_pages, 2)
+        
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir, True)
+        pdf_file = generator.generate_pdf(os.path.join(output_dir, 'test_resume.pdf'), auto_fit=True, target_pages=1)
+        with pymupdf.open(pdf_file) as pdf:
+            self.assertEqual(pdf.page_count, 1)
+        font_scale, space_scale = generator.layout_scale
+        self.assertLess(font_scale * space_scale, 1.0)
+    
+    def test_auto_fit_keeps_designed_layout_when_it_fits(self):
+        """Test that a resume already within its target is not shrunk and costs one estimate"""
+        generator = ResumeGenerator.from_data(self.test_data, self.test_config, length_variant='brief')
+        result = generator.fit_layout()
+        self.assertEqual((result["font_scale"], result["space_scale"]), (1.0, 1.0))
+        self.assertEqual(result["target_pages"], 1)
+        self.assertEqual(result["estimates"], 1)
+        self.assertTrue(result["fits"])
+    
+    def test_from_data_matches_file_generator(self):
+        """Test that a generator built from in-memory data lays out like one loaded from files"""
+        from_file = ResumeGenerator(self.temp_file.name, self.config_file.name)
+        from_data = ResumeGenerator.from_data(self.test_data, self.test_config)
+        self.assertEqual(from_file.estimate_pages(), from_data.estimate_pages())
+    
+    def test_generate_many_rejects_unknown_format(self):
+        """Test that unsupported formats raise ValueError"""
+        generator = ResumeGenerator(self.temp_file.name)
+        with self.assertRaises(ValueError):
+            generator.generate_many(['pdf', 'odt'], tempfile.gettempdir())
 
 
 class QuantitativeMetricsHighlightingTests(TestCase):
@@ -247,6 +484,1160 @@ class QuantitativeMetricsHighlightingTests(TestCase):
         self.assertIn("**METRIC_HIGHLIGHT_START**87%**METRIC_HIGHLIGHT_END**", result)
 
 
+class StyleRegistryTests(TestCase):
+    """Test the process-wide stylesheet cache"""
+    
+    def setUp(self):
+        clear_stylesheet_cache()
+        self.addCleanup(clear_stylesheet_cache)
+        with open("color_schemes/corporate_blue.json", "r", encoding="utf-8") as f:
+            self.config = json.load(f)
+    
+    def test_stylesheet_is_shared_per_scheme_and_config(self):
+        """Test that equal keys share one stylesheet and different configs do not"""
+        stylesheet = get_stylesheet("corporate_blue", self.config)
+        self.assertIs(get_stylesheet("corporate_blue", dict(self.config)), stylesheet)
+        self.assertIsNot(get_stylesheet("corporate_blue", {}), stylesheet)
+        self.assertIsNot(get_stylesheet("modern_tech", self.config), stylesheet)
+    
+    def test_stylesheet_is_read_only(self):
+        """Test that the shared mapping cannot be modified"""
+        stylesheet = get_stylesheet("corporate_blue", self.config)
+        with self.assertRaises(TypeError):
+            stylesheet["Body"] = stylesheet["Name"]
+    
+    def test_scaled_stylesheets_derive_from_base(self):
+        """Test that auto-fit scales are applied to fonts and spacing and cached separately"""
+        base = get_stylesheet("corporate_blue", self.config)
+        scaled = get_stylesheet("corporate_blue", self.config, font_scale=0.9, space_scale=0.5)
+        self.assertIs(get_stylesheet("corporate_blue", self.config, 0.9, 0.5), scaled)
+        self.assertAlmostEqual(scaled["Body"].fontSize, base["Body"].fontSize * 0.9)
+        self.assertAlmostEqual(scaled["Body"].leading, base["Body"].leading * 0.9)
+        self.assertAlmostEqual(scaled["SectionHeader"].spaceBefore, base["SectionHeader"].spaceBefore * 0.5)
+        self.assertEqual(scaled["Body"].textColor, base["Body"].textColor)
+    
+    def test_prewarm_builds_shipped_schemes(self):
+        """Test that pre-warming fills the cache used by generators"""
+        self.assertEqual(prewarm_stylesheets(["corporate_blue", "missing_scheme"]), 1)
+        with patch("resumes.style_registry.build_stylesheet") as build:
+            get_stylesheet("corporate_blue", self.config)
+            build.assert_not_called()
+
+
+class DocxTemplateTests(TestCase):
+    """Test the process-wide base DOCX document"""
+    
+    def setUp(self):
+        clear_docx_template()
+        self.addCleanup(clear_docx_template)
+        with open("inputs/dheeraj_chand_marketing/resume_data.json", "r", encoding="utf-8") as f:
+            self.data = json.load(f)
+        with open("color_schemes/corporate_blue.json", "r", encoding="utf-8") as f:
+            self.config = json.load(f)
+    
+    def test_renders_start_from_independent_copies(self):
+        """Test that the base is built once and renders never see each other's content"""
+        with patch('resumes.docx_template.Document', wraps=docx_template.Document) as build:
+            first = ResumeGenerator.from_data(self.data, self.config, 'corporate_blue').render_bytes('docx')
+            second = ResumeGenerator.from_data(self.data, self.config, 'corporate_blue').render_bytes('docx')
+            self.assertEqual(len(new_document().paragraphs), 0)
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(first, second)
+    
+    def test_document_keeps_headings_and_properties(self):
+        """Test that headings carry the template's heading styles and the fixed core properties are set"""
+        doc = Document(io.BytesIO(ResumeGenerator.from_data(self.data, self.config, 'corporate_blue').render_bytes('docx')))
+        headings = {paragraph.style.name for paragraph in doc.paragraphs if paragraph.style.name.startswith('Heading')}
+        self.assertEqual(headings, {'Heading 2', 'Heading 3'})
+        self.assertIn('PROFESSIONAL EXPERIENCE', [paragraph.text for paragraph in doc.paragraphs if paragraph.style.name == 'Heading 2'])
+        self.assertEqual(doc.core_properties.subject, 'Professional Resume')
+        self.assertEqual(doc.core_properties.author, self.data['personal_info']['name'])
+
+
+class SectionCacheTests(TestCase):
+    """Test the process-wide section flowable cache"""
+    
+    def setUp(self):
+        clear_section_cache()
+        self.addCleanup(clear_section_cache)
+        with open("inputs/dheeraj_chand_marketing/resume_data.json", "r", encoding="utf-8") as f:
+            self.data = json.load(f)
+        with open("color_schemes/corporate_blue.json", "r", encoding="utf-8") as f:
+            self.config = json.load(f)
+    
+    def page_text(self, generator):
+        with pymupdf.open(stream=generator.render_bytes('pdf'), filetype='pdf') as pdf:
+            return [page.get_text() for page in pdf]
+    
+    def test_edit_rebuilds_only_changed_section(self):
+        """Test that editing one bullet misses only the experience section"""
+        sections = ResumeGenerator.from_data(self.data, self.config, 'corporate_blue')._get_sections()
+        cold = section_cache_info()
+        self.assertEqual((cold["hits"], cold["misses"]), (0, len(sections)))
+        
+        edited = json.loads(json.dumps(self.data))
+        edited["experience"][0]["responsibilities"][0] += " Cut costs 12%."
+        ResumeGenerator.from_data(edited, self.config, 'corporate_blue')._get_sections()
+        warm = section_cache_info()
+        self.assertEqual((warm["hits"], warm["misses"]), (len(sections) - 1, len(sections) + 1))
+        
+        ResumeGenerator.from_data(self.data, {}, 'corporate_blue')._get_sections()
+        self.assertEqual(section_cache_info()["misses"], 2 * len(sections) + 1)
+    
+    def test_cached_sections_render_identically(self):
+        """Test that a render from cached sections matches the first, and hits return fresh flowables"""
+        first = ResumeGenerator.from_data(self.data, self.config, 'corporate_blue')
+        expected = self.page_text(first)
+        second = ResumeGenerator.from_data(self.data, self.config, 'corporate_blue')
+        self.assertEqual(self.page_text(second), expected)
+        self.assertGreater(section_cache_info()["hits"], 0)
+        
+        self.assertIsNot(second._get_sections()[0]["content"][0], second._get_sections()[0]["content"][0])
+
+
+class DocumentModelTests(TestCase):
+    """Test span tokenization in the document model"""
+    
+    def test_metric_spans(self):
+        """Test splitting text into metric, link and plain spans"""
+        spans = metric_spans("Saved $4.7M for [Siege](https://example.com) clients")
+        self.assertEqual(spans, [
+            ("Saved ", PLAIN, None),
+            ("$4.7M", METRIC, None),
+            (" for ", PLAIN, None),
+            ("Siege", LINK, "https://example.com"),
+            (" clients", PLAIN, None),
+        ])
+    
+    def test_markdown_emitter_matches_highlighter(self):
+        """Test that the markdown emitter agrees with highlight_quantitative_metrics"""
+        text = "Improved accuracy from 23% to 64% across 12,847 records"
+        self.assertEqual(spans_to_markdown(metric_spans(text)), highlight_quantitative_metrics(text, "md"))
+    
+    def test_tokens_are_cached_across_formats(self):
+        """Test that highlighting one text for several formats tokenizes it once"""
+        text = "Cut costs 41.5% for 3,217 unique clients"
+        highlight_quantitative_metrics(text, "pdf", "#FF0000")
+        misses = token_cache_info().misses
+        for format_type in ("pdf", "docx", "rtf", "md"):
+            highlight_quantitative_metrics(text, format_type, "#00FF00")
+        self.assertEqual(token_cache_info().misses, misses)
+
+
+class ResumeManagerParallelTests(TestCase):
+    """Test process-pool generation of the resume matrix"""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.manager = ResumeManager()
+        # Shrink the matrix: one version, a present and a missing length variant
+        self.manager.versions = {"comprehensive": "dheeraj_chand_comprehensive_full"}
+        self.manager.length_variants = {"long": "full", "short": "abbreviated"}
+        self.manager.color_schemes = ["default_professional"]
+        self.manager.formats = ["rtf", "md"]
+    
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+    
+    def test_results_identical_across_worker_counts(self):
+        """Test that serial and pooled runs produce the same results dict"""
+        serial = self.manager.generate_all_combinations(self.output_dir, "ats", workers=1)
+        pooled = self.manager.generate_all_combinations(self.output_dir, "ats", workers=2, force=True)
+        
+        self.assertEqual(serial, pooled)
+        self.assertEqual(serial["success"], 2)
+        self.assertEqual(serial["failures"], [
+            ("comprehensive", "short", "default_professional", "rtf"),
+            ("comprehensive", "short", "default_professional", "md"),
+        ])
+    
+    def test_on_result_called_in_matrix_order(self):
+        """Test that progress callbacks arrive in matrix order"""
+        seen = []
+        self.manager.generate_all_combinations(
+            self.output_dir, "ats", workers=2,
+            on_result=lambda task, success: seen.append((task[1], task[3], success))
+        )
+        
+        self.assertEqual(seen, [
+            ("long", "rtf", True), ("long", "md", True),
+            ("short", "rtf", False), ("short", "md", False),
+        ])
+    
+    def test_pool_workers_are_recycled(self):
+        """Test that a pool worker is replaced after WORKER_MAX_TASKS render groups"""
+        with patch('resumes.core_services.WORKER_MAX_TASKS', 2):
+            with render_pool(1) as pool:
+                pids = list(pool.imap(_worker_pid, range(6)))
+        self.assertEqual(len(set(pids)), 3)
+        self.assertEqual([len(set(pids[chunk:chunk + 2])) for chunk in range(0, 6, 2)], [1, 1, 1])
+
+
+def _worker_pid(_):
+    """Pool task reporting which process ran it"""
+    return os.getpid()
+
+
+class RenderProfilingTests(TestCase):
+    """Test per-format render profiling"""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+        self.manager = ResumeManager()
+        self.manager.versions = {"comprehensive": "dheeraj_chand_comprehensive_full"}
+        self.manager.length_variants = {"long": "full"}
+        self.manager.color_schemes = ["default_professional"]
+        self.manager.formats = ["pdf", "md"]
+    
+    def test_profiles_aggregate_per_format_with_stages(self):
+        """Test that a profiled run reports setup and each format, with PDF time split by stage"""
+        profiler = RenderProfiler()
+        results = self.manager.generate_all_combinations(self.output_dir, "ats", workers=1, profiler=profiler)
+        
+        self.assertEqual(results["success"], 2)
+        self.assertEqual(profiler.labels(), ["setup", "pdf", "md"])
+        self.assertEqual(profiler.renders, {"setup": 1, "pdf": 1, "md": 1})
+        stages = profiler.stage_report()
+        self.assertGreater(stages["setup"]["data_load"], 0)
+        for stage in ("get_sections", "doc_build", "header_footer"):
+            self.assertGreater(stages["pdf"][stage], 0)
+        self.assertLessEqual(stages["pdf"]["doc_build"] + stages["pdf"]["header_footer"], stages["pdf"]["total"])
+        
+        written = profiler.write(Path(self.output_dir) / "profiles")
+        self.assertEqual(sorted(path.name for path in written),
+                         ["md.pstats", "pdf.pstats", "setup.pstats", "speedscope.json", "stages.json"])
+    
+    def test_speedscope_samples_reference_shared_frames(self):
+        """Test that the flamegraph export is a well-formed sampled speedscope file"""
+        _, raw = profile_call(sorted, [str(n) for n in range(2000)], key=len)
+        document = to_speedscope({"sort": raw})
+        profile = document["profiles"][0]
+        
+        self.assertEqual(profile["type"], "sampled")
+        self.assertEqual(len(profile["samples"]), len(profile["weights"]))
+        frame_count = len(document["shared"]["frames"])
+        self.assertTrue(all(0 <= index < frame_count for sample in profile["samples"] for index in sample))
+        self.assertAlmostEqual(profile["endValue"], stage_times(raw)["total"], places=4)
+
+
+
+class RenderMetricsTests(TestCase):
+    """Test render timing spans and the metrics registry"""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+        metrics_registry.reset()
+        self.addCleanup(metrics_registry.reset)
+    
+    def spans(self):
+        return {(row["name"], row["format"], row["scheme"]): row for row in metrics_registry.snapshot()["spans"]}
+    
+    def test_histogram_quantiles_and_merge(self):
+        """Test that bucketed percentiles land within a bucket of the exact ones and merging adds counts"""
+        first, second = Histogram(), Histogram()
+        for n in range(1, 501):
+            first.observe(n / 1000)
+            second.observe((n + 500) / 1000)
+        first.merge(second.export())
+        
+        summary = first.summary()
+        self.assertEqual(summary["count"], 1000)
+        self.assertEqual((summary["min"], summary["max"]), (0.001, 1.0))
+        self.assertAlmostEqual(summary["p50"], 0.5, delta=0.5 * 0.2)
+        self.assertAlmostEqual(summary["p95"], 0.95, delta=0.95 * 0.2)
+        self.assertIsNone(Histogram().quantile(0.5))
+    
+    def test_pdf_render_records_spans_per_stage(self):
+        """Test that a PDF render records each stage once and the header once per page"""
+        data_file = "inputs/dheeraj_chand_comprehensive_full/resume_data.json"
+        generator = ResumeGenerator(data_file, "color_schemes/default_professional.json", "default_professional")
+        pdf_path = os.path.join(self.output_dir, "resume.pdf")
+        generator.generate("pdf", pdf_path)
+        
+        spans = self.spans()
+        for key in (("load", None, "default_professional"), ("styles", None, "default_professional"),
+                    ("model", None, "default_professional"), ("sections", "pdf", "default_professional"),
+                    ("build", "pdf", "default_professional"), ("render", "pdf", "default_professional")):
+            self.assertEqual(spans[key]["count"], 1, key)
+        with pymupdf.open(pdf_path) as pdf:
+            self.assertEqual(spans[("header", "pdf", "default_professional")]["count"], pdf.page_count)
+        self.assertLessEqual(spans[("build", "pdf", "default_professional")]["p95"],
+                             spans[("render", "pdf", "default_professional")]["max"])
+    
+    def test_pooled_renders_report_spans_to_parent(self):
+        """Test that spans recorded in worker processes are merged into this process's registry"""
+        manager = ResumeManager()
+        manager.versions = {"comprehensive": "dheeraj_chand_comprehensive_full"}
+        manager.length_variants = {"long": "full"}
+        manager.color_schemes = ["default_professional", "corporate_blue"]
+        manager.formats = ["rtf", "md"]
+        results = manager.generate_all_combinations(self.output_dir, "ats", workers=2)
+        
+        self.assertEqual(results["success"], 4)
+        spans = self.spans()
+        for scheme in manager.color_schemes:
+            for format_type in manager.formats:
+                self.assertEqual(spans[("save", format_type, scheme)]["count"], 1)
+        self.assertIn("render", "\n".join(metrics_registry.summary_lines()))
+    
+    def test_metrics_view_is_staff_only(self):
+        """Test that the metrics endpoint returns the snapshot to staff and 403 to everyone else"""
+        metrics_registry.observe("build", 0.25, "pdf", "default_professional")
+        user = CustomUser.objects.create_user(username='viewer', email='viewer@example.com', password='testpass123')
+        self.client.force_login(user)
+        self.assertEqual(self.client.get('/api/metrics/').status_code, 403)
+        
+        user.is_staff = True
+        user.save()
+        response = self.client.get('/api/metrics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["spans"][0]["name"], "build")
+        self.assertEqual(response.json()["spans"][0]["count"], 1)
+
+class IncrementalBuildTests(TestCase):
+    """Test manifest-driven skipping of unchanged artifacts"""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+        self.manager = ResumeManager()
+        self.manager.versions = {"comprehensive": "dheeraj_chand_comprehensive_full"}
+        self.manager.length_variants = {"long": "full"}
+        self.manager.color_schemes = ["default_professional", "corporate_blue"]
+        self.manager.formats = ["md"]
+    
+    def test_unchanged_inputs_are_skipped(self):
+        """Test that a second run skips everything and --force rebuilds"""
+        first = self.manager.generate_all_combinations(self.output_dir, "ats")
+        self.assertEqual((first["success"], first["skipped"]), (2, 0))
+        self.assertTrue((Path(self.output_dir) / ".manifest.json").exists())
+        
+        second = self.manager.generate_all_combinations(self.output_dir, "ats")
+        self.assertEqual((second["success"], second["skipped"]), (0, 2))
+        
+        forced = self.manager.generate_all_combinations(self.output_dir, "ats", force=True)
+        self.assertEqual((forced["success"], forced["skipped"]), (2, 0))
+    
+    def test_changed_color_scheme_rebuilds_only_dependents(self):
+        """Test that changing one input only rebuilds the artifacts that use it"""
+        self.manager.generate_all_combinations(self.output_dir, "ats")
+        
+        real_config_file = self.manager._config_file
+        def edited_config_file(input_dir, color_scheme):
+            if color_scheme == "corporate_blue":
+                return Path("color_schemes") / "modern_clean.json"
+            return real_config_file(input_dir, color_scheme)
+        
+        with patch.object(self.manager, "_config_file", side_effect=edited_config_file):
+            results = self.manager.generate_all_combinations(self.output_dir, "ats")
+        
+        self.assertEqual((results["success"], results["skipped"]), (1, 1))
+    
+    def test_edited_docx_template_rebuilds(self):
+        """Test that a change to the base DOCX template marks DOCX artifacts stale"""
+        self.manager.formats = ["docx"]
+        self.manager.generate_all_combinations(self.output_dir, "ats")
+        
+        real_sha256 = file_sha256
+        def edited_sha256(path):
+            return "edited" if Path(path).name == "docx_template.py" else real_sha256(path)
+        
+        with patch("resumes.manifest.file_sha256", side_effect=edited_sha256):
+            results = self.manager.generate_all_combinations(self.output_dir, "ats")
+        self.assertEqual((results["success"], results["skipped"]), (2, 0))
+    
+    def test_switching_pdf_profile_rebuilds(self):
+        """Test that a run with another PDF profile re-renders, and repeating it skips again"""
+        self.manager.generate_all_combinations(self.output_dir, "ats")
+        
+        archive = self.manager.generate_all_combinations(self.output_dir, "ats", pdf_profile="archive")
+        self.assertEqual((archive["success"], archive["skipped"]), (2, 0))
+        again = self.manager.generate_all_combinations(self.output_dir, "ats", pdf_profile="archive")
+        self.assertEqual((again["success"], again["skipped"]), (0, 2))
+        with self.assertRaises(ValueError):
+            self.manager.generate_all_combinations(self.output_dir, "ats", pdf_profile="tiny")
+    
+    def test_deleted_artifact_is_rebuilt(self):
+        """Test that a missing output is rebuilt even if the manifest lists it"""
+        self.manager.generate_all_combinations(self.output_dir, "ats")
+        output_file = self.manager._output_file(self.output_dir, "comprehensive", "long", "corporate_blue", "ats", "md")
+        output_file.unlink()
+        
+        results = self.manager.generate_all_combinations(self.output_dir, "ats")
+        self.assertEqual((results["success"], results["skipped"]), (1, 1))
+        self.assertTrue(output_file.exists())
+
+
+
+class ShardingTests(TestCase):
+    """Test cost-balanced static sharding of the render matrix"""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+        self.manager = ResumeManager()
+        self.manager.versions = {"comprehensive": "dheeraj_chand_comprehensive_full", "marketing": "dheeraj_chand_marketing"}
+        self.manager.length_variants = {"long": "full"}
+        self.manager.color_schemes = ["default_professional", "corporate_blue", "modern_tech"]
+        self.manager.formats = ["rtf", "md"]
+    
+    def test_parse_shard(self):
+        """Test that shards are written i/n with i counted from 1"""
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for text in ("0/4", "5/4", "2", "a/b", "1/0"):
+            with self.assertRaises(ValueError):
+                parse_shard(text)
+    
+    def test_shards_partition_matrix_by_cost(self):
+        """Test that shards are disjoint, cover the matrix, balance cost and follow recorded history"""
+        manifest = BuildManifest.for_output_dir(self.output_dir)
+        self.manager.formats = ["pdf", "docx", "rtf", "md"]
+        self.manager.length_variants = {"long": "full", "short": "abbreviated"}
+        groups = self.manager._combination_tasks(self.output_dir, "ats")
+        shards = plan_shards(self.manager, manifest, groups, 3)
+        
+        self.assertEqual(sorted(group for shard in shards for group in shard["groups"]), sorted(groups))
+        self.assertEqual(shards, plan_shards(self.manager, manifest, groups, 3))
+        # Missing short inputs cost nothing, so shards balance the real groups rather than the count
+        loads = [shard["cost"] for shard in shards]
+        self.assertLess(max(loads) - min(loads), max(loads) / 2)
+        
+        # A group recorded as very slow gets a shard to itself
+        slow = groups[0]
+        slow_file = self.manager._output_file(self.output_dir, *slow[:3], "ats", "pdf")
+        slow_file.parent.mkdir(parents=True)
+        slow_file.write_bytes(b"%PDF")
+        manifest.record(slow_file, "hash", seconds=100.0)
+        shards = plan_shards(self.manager, manifest, groups, 3)
+        self.assertIn([slow], [shard["groups"] for shard in shards])
+    
+    def test_current_groups_cost_nothing(self):
+        """Test that groups the manifest records as current cost nothing, whatever is on this node's disk"""
+        self.manager.generate_all_combinations(self.output_dir, "ats")
+        manifest = BuildManifest.for_output_dir(self.output_dir)
+        for entry in manifest.artifacts.values():
+            entry["seconds"] = 100.0
+        groups = self.manager._combination_tasks(self.output_dir, "ats")
+        # A small edit: two groups' recorded inputs no longer match
+        edited = [groups[0], groups[2]]
+        for version, length_variant, color_scheme, formats, _, _ in edited:
+            for format_type in formats:
+                path = self.manager._output_file(self.output_dir, version, length_variant, color_scheme, "ats", format_type)
+                manifest.artifacts[manifest._key(path)]["inputs"] = "before the edit"
+        
+        shards = plan_shards(self.manager, manifest, groups, 2)
+        
+        self.assertEqual([shard["cost"] for shard in shards], [200.0, 200.0])
+        self.assertEqual([[group for group in shard["groups"] if group in edited] for shard in shards],
+                         [[groups[0]], [groups[2]]])
+        self.assertEqual(plan_shards(self.manager, manifest, groups, 2, force=True)[0]["cost"], 600.0)
+        
+        # A node missing some outputs computes the same split
+        shutil.rmtree(Path(self.output_dir) / "ats" / "marketing")
+        self.assertEqual(plan_shards(self.manager, manifest, groups, 2), shards)
+    
+    def test_shard_runs_merge_into_one_manifest(self):
+        """Test that shards write disjoint files and partial manifests that merge into a complete one"""
+        written = []
+        for index in (1, 2):
+            results = self.manager.generate_all_combinations(
+                self.output_dir, "ats", shard=(index, 2),
+                on_result=lambda task, success: written.append((task[0], task[2], task[3]))
+            )
+            self.assertEqual(results["failed"], 0)
+        
+        self.assertEqual(len(written), 12)
+        self.assertEqual(len(set(written)), 12)
+        self.assertFalse((Path(self.output_dir) / ".manifest.json").exists())
+        partials = sorted(path.name for path in Path(self.output_dir).glob(".manifest.shard-*"))
+        self.assertEqual(partials, [".manifest.shard-1-of-2.json", ".manifest.shard-2-of-2.json"])
+        
+        self.assertEqual(len(merge_shard_manifests(self.output_dir)), 2)
+        manifest = BuildManifest.for_output_dir(self.output_dir)
+        self.assertEqual(len(manifest.artifacts), 12)
+        self.assertTrue(all("seconds" in entry for entry in manifest.artifacts.values()))
+        self.assertEqual(list(Path(self.output_dir).glob(".manifest.shard-*")), [])
+        
+        results = self.manager.generate_all_combinations(self.output_dir, "ats")
+        self.assertEqual((results["success"], results["skipped"]), (0, 12))
+
+
+class BuildGraphTests(TestCase):
+    """Test dependency ordering in the build graph"""
+    
+    def test_nodes_run_after_dependencies_and_skip_when_current(self):
+        """Test that planning waits for dependencies and None plans are skipped"""
+        graph = BuildGraph()
+        ran = []
+        graph.add("a", [], lambda: (ran.append, ("a",)), lambda result: "built")
+        graph.add("b", ["a"], lambda: None, lambda result: "built")
+        graph.add("c", ["a", "b"], lambda: (ran.append, ("c",)), lambda result: "built")
+        
+        status = graph.run()
+        self.assertEqual(status, {"a": "built", "b": "skipped", "c": "built"})
+        self.assertEqual(ran, ["a", "c"])
+    
+    def test_failed_node_blocks_dependents(self):
+        """Test that dependents of a failed node are not run"""
+        graph = BuildGraph()
+        graph.add("a", [], lambda: (int, ("not a number",)), lambda result: "built")
+        graph.add("b", ["a"], lambda: (int, ("1",)), lambda result: "built")
+        graph.add("c", [], lambda: (int, ("1",)), lambda result: "built")
+        
+        self.assertEqual(graph.run(), {"a": "failed", "b": "blocked", "c": "built"})
+    
+    def test_unknown_dependency_is_rejected(self):
+        """Test that dependencies must be added first"""
+        with self.assertRaises(ValueError):
+            BuildGraph().add("b", ["a"], lambda: None, lambda result: "built")
+
+
+class BuildPipelineTests(TestCase):
+    """Test the master achievements to rendered files pipeline"""
+    
+    def setUp(self):
+        repo_dir = Path.cwd()
+        self.work_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.work_dir, True)
+        for name in ("comprehensive_master_achievements.json", "resume_type_definitions.json"):
+            shutil.copy(repo_dir / name, self.work_dir / name)
+        shutil.copytree(repo_dir / "color_schemes", self.work_dir / "color_schemes")
+        os.chdir(self.work_dir)
+        self.addCleanup(os.chdir, repo_dir)
+        
+        self.manager = ResumeManager()
+        self.manager.versions = {"comprehensive": "dheeraj_chand_comprehensive_full"}
+        self.manager.length_variants = {"long": "full", "short": "abbreviated"}
+        self.manager.color_schemes = ["default_professional"]
+        self.manager.formats = ["md"]
+    
+    def build(self, **kwargs):
+        return build_pipeline("outputs", output_types=("ats",), manager=self.manager, **kwargs)
+    
+    def test_rebuild_does_minimum_work(self):
+        """Test that unchanged and semantically unchanged master data skip every render"""
+        first = self.build()
+        self.assertEqual(first["specialized"]["built"], 1)
+        self.assertEqual(first["inputs_changed"], 3)
+        self.assertEqual((first["success"], first["failed"], first["skipped"]), (2, 0, 0))
+        
+        second = self.build()
+        self.assertEqual(second["specialized"]["skipped"], 1)
+        self.assertEqual((second["success"], second["skipped"]), (0, 2))
+        
+        # Reformatting the master file re-runs specialization, but identical
+        # data files leave every render up to date
+        master_file = Path("comprehensive_master_achievements.json")
+        master_file.write_text(json.dumps(json.loads(master_file.read_text(encoding="utf-8"))), encoding="utf-8")
+        third = self.build()
+        self.assertEqual(third["specialized"]["built"], 1)
+        self.assertEqual(third["inputs_changed"], 0)
+        self.assertEqual((third["success"], third["skipped"]), (0, 2))
+    
+    def test_force_rebuilds_everything(self):
+        """Test that force re-specializes and re-renders"""
+        self.build()
+        forced = self.build(force=True)
+        self.assertEqual(forced["specialized"]["built"], 1)
+        self.assertEqual((forced["success"], forced["skipped"]), (2, 0))
+
+
+
+class GenerationWorkerTests(TestCase):
+    """Test the database-backed generation job worker"""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+        settings_override = override_settings(FILE_GENERATION={
+            'OUTPUT_DIR': Path(self.output_dir) / 'jobs', 'BLOB_DIR': Path(self.output_dir) / 'blobs'
+        })
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        
+        with open("inputs/dheeraj_chand_marketing/resume_data.json", "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.user = CustomUser.objects.create_user(username='worker', email='worker@example.com', password='testpass123')
+        self.resume_data = UserResumeData.objects.create(
+            user=self.user, resume_type='marketing', length_variant='long',
+            **{field: data[field] for field in ('personal_info', 'summary', 'competencies', 'experience',
+                                               'achievements', 'education', 'projects', 'certifications') if field in data}
+        )
+        self.scheme = ColorScheme.objects.create(name='corporate_blue')
+    
+    def queue(self, job_id, formats=('md',), resume_data=True):
+        return ResumeGenerationJob.objects.create(
+            user=self.user, resume_data=self.resume_data if resume_data else None, job_id=job_id,
+            formats=list(formats), color_scheme=self.scheme
+        )
+    
+    def test_claims_oldest_queued_job_once(self):
+        """Test that each queued job is claimed exactly once, oldest first"""
+        first, second = self.queue('a'), self.queue('b')
+        ResumeGenerationJob.objects.filter(id=first.id).update(created_at=timezone.now() - timedelta(minutes=1))
+        
+        self.assertEqual(claim_job('w1').id, first.id)
+        claimed = claim_job('w2')
+        self.assertEqual(claimed.id, second.id)
+        self.assertEqual((claimed.status, claimed.worker_id), ('processing', 'w2'))
+        self.assertIsNotNone(claimed.started_at)
+        self.assertIsNone(claim_job('w1'))
+    
+    def test_worker_renders_jobs_in_process(self):
+        """Test that a draining worker renders each job's formats and records the outcome"""
+        job = self.queue('render', formats=('pdf', 'md'))
+        broken = self.queue('broken', resume_data=False)
+        
+        self.assertEqual(GenerationWorker(pool_size=1).run(drain=True), 2)
+        
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(sorted(job.result_files), ['md', 'pdf'])
+        self.assertTrue(all(Path(path).exists() for path in job.result_files.values()))
+        self.assertTrue(job.result_files['pdf'].startswith(str(Path(self.output_dir) / 'blobs')))
+        self.assertFalse((Path(self.output_dir) / 'jobs' / f"user_{self.user.id}" / 'render').exists())
+        self.assertLessEqual(job.started_at, job.completed_at)
+        self.resume_data.refresh_from_db()
+        self.assertEqual(self.resume_data.last_generated, job.completed_at)
+        
+        broken.refresh_from_db()
+        self.assertEqual(broken.status, 'failed')
+        self.assertIn('no resume data', broken.error_message)
+    
+    def test_pooled_worker_renders_every_job(self):
+        """Test that a process-pool worker completes every queued job"""
+        jobs = [self.queue(f'pooled-{n}', formats=('md', 'rtf')) for n in range(4)]
+        finished = []
+        
+        worker = GenerationWorker(pool_size=2, on_finish=lambda job, error: finished.append((job.job_id, error)))
+        self.assertEqual(worker.run(drain=True), 4)
+        
+        self.assertEqual(sorted(finished), [(job.job_id, '') for job in jobs])
+        self.assertEqual(ResumeGenerationJob.objects.filter(status='completed').count(), 4)
+    
+    def test_pooled_worker_survives_a_dying_render_process(self):
+        """Test that a render process crash fails its job and later jobs render in a fresh pool"""
+        _, crash_data = self.copy_resume_data('crasher')
+        UserResumeData.objects.filter(id=crash_data.id).update(summary='crash')
+        crash = ResumeGenerationJob.objects.create(user=self.user, resume_data=crash_data, job_id='crash',
+                                                   formats=['md'], color_scheme=self.scheme)
+        jobs = [self.queue(f'after-crash-{n}') for n in range(3)]
+        
+        with patch('resumes.generation_worker.render_job', _render_or_crash):
+            self.assertEqual(GenerationWorker(pool_size=2).run(drain=True), 4)
+        
+        crash.refresh_from_db()
+        self.assertEqual(crash.status, 'failed')
+        self.assertIn('BrokenProcessPool', crash.error_message)
+        jobs[-1].refresh_from_db()
+        self.assertEqual(jobs[-1].status, 'completed')
+    
+    def copy_resume_data(self, username):
+        user = CustomUser.objects.create_user(username=username, email=f'{username}@example.com', password='testpass123')
+        resume_data = UserResumeData.objects.get(id=self.resume_data.id)
+        resume_data.pk, resume_data.user = None, user
+        resume_data.save()
+        return user, resume_data
+    
+    def test_identical_submissions_share_one_render(self):
+        """Test that repeat and cross-user submissions of the same render coalesce into one"""
+        job, outcome = submit_job(self.user, self.resume_data, ['md', 'pdf'], self.scheme)
+        self.assertEqual((outcome, job.status), ('queued', 'queued'))
+        self.assertEqual(submit_job(self.user, self.resume_data, ['pdf', 'md'], self.scheme), (job, 'existing'))
+        
+        other_user, other_data = self.copy_resume_data('other')
+        attached, outcome = submit_job(other_user, other_data, ['pdf', 'md'], self.scheme)
+        self.assertEqual(outcome, 'attached')
+        self.assertEqual((attached.canonical_job_id, attached.render_key), (job.id, job.render_key))
+        self.assertNotEqual(attached.job_id, job.job_id)
+        
+        self.assertEqual(GenerationWorker(pool_size=1).run(drain=True), 1)
+        job.refresh_from_db()
+        attached.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual((attached.status, attached.result_files), ('completed', job.result_files))
+        
+        # Later submissions reuse the completed render without queueing anything
+        late_user, late_data = self.copy_resume_data('late')
+        late, outcome = submit_job(late_user, late_data, ['md', 'pdf'], self.scheme)
+        self.assertEqual((outcome, late.status, late.result_files), ('attached', 'completed', job.result_files))
+        self.assertIsNone(claim_job('w1'))
+    
+    def test_different_renders_do_not_coalesce(self):
+        """Test that content, scheme, format and output type changes each get their own render"""
+        job, _ = submit_job(self.user, self.resume_data, ['md'], self.scheme)
+        variants = [
+            submit_job(self.user, self.resume_data, ['md'], None),
+            submit_job(self.user, self.resume_data, ['md', 'rtf'], self.scheme),
+            submit_job(self.user, self.resume_data, ['md'], self.scheme, output_type='human'),
+        ]
+        self.resume_data.summary += ' Updated.'
+        self.resume_data.save()
+        variants.append(submit_job(self.user, self.resume_data, ['md'], self.scheme))
+        
+        self.assertEqual([outcome for _, outcome in variants], ['queued'] * 4)
+        self.assertEqual(len({job.job_id} | {variant.job_id for variant, _ in variants}), 5)
+    
+    def test_worker_renders_reach_resume_downloads(self):
+        """Test that submit -> worker -> download serves a resume's renders through the store, coalesced ones too"""
+        template = ResumeTemplate.objects.create(name='General', role='general', version='long')
+        resume = Resume.objects.create(user=self.user, template=template, title='Marketing')
+        job, _ = submit_job(self.user, self.resume_data, ['pdf', 'md'], self.scheme, resume=resume)
+        other_user, other_data = self.copy_resume_data('coalesced')
+        other_resume = Resume.objects.create(user=other_user, template=template, title='Marketing')
+        attached, outcome = submit_job(other_user, other_data, ['pdf', 'md'], self.scheme, resume=other_resume)
+        self.assertEqual((job.resume, outcome), (resume, 'attached'))
+        
+        self.assertEqual(GenerationWorker(pool_size=1).run(drain=True), 1)
+        
+        job.refresh_from_db()
+        blobs = ArtifactStore().files(job=job)
+        for user, owned in ((self.user, resume), (other_user, other_resume)):
+            self.client.force_login(user)
+            response = self.client.get(f'/resume/{owned.id}/download/pdf/')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['ETag'], f'"{blobs["pdf"].sha256}"')
+            self.assertEqual(b''.join(response), Path(job.result_files['pdf']).read_bytes())
+            files = self.client.get(f'/api/resumes/{owned.id}/files/').json()['files']
+            self.assertEqual(sorted(entry['format'] for entry in files), ['md', 'pdf'])
+    
+    def test_pdf_profile_is_part_of_the_render(self):
+        """Test that a PDF job's profile gets its own render and reaches the worker, and leaves other formats' keys alone"""
+        standard, _ = submit_job(self.user, self.resume_data, ['pdf'], self.scheme)
+        archive, outcome = submit_job(self.user, self.resume_data, ['pdf'], self.scheme, pdf_profile='archive')
+        self.assertEqual((outcome, archive.pdf_profile), ('queued', 'archive'))
+        self.assertNotEqual(archive.render_key, standard.render_key)
+        self.assertEqual(job_payload(archive)['pdf_profile'], 'archive')
+        
+        markdown, _ = submit_job(self.user, self.resume_data, ['md'], self.scheme)
+        self.assertEqual(submit_job(self.user, self.resume_data, ['md'], self.scheme, pdf_profile='archive'), (markdown, 'existing'))
+        with self.assertRaises(ValueError):
+            submit_job(self.user, self.resume_data, ['pdf'], self.scheme, pdf_profile='tiny')
+        
+        self.assertEqual(GenerationWorker(pool_size=1).run(drain=True), 3)
+        standard.refresh_from_db()
+        archive.refresh_from_db()
+        self.assertLess(Path(archive.result_files['pdf']).stat().st_size, Path(standard.result_files['pdf']).stat().st_size)
+    
+    def test_failed_submission_is_retried(self):
+        """Test that resubmitting a failed render requeues the same job"""
+        job, _ = submit_job(self.user, self.resume_data, ['md'], self.scheme)
+        ResumeGenerationJob.objects.filter(id=job.id).update(status='failed', error_message='boom')
+        
+        retried, outcome = submit_job(self.user, self.resume_data, ['md'], self.scheme)
+        self.assertEqual((retried.id, outcome, retried.status, retried.error_message), (job.id, 'queued', 'queued', ''))
+    
+    def test_generate_view_repeats_return_the_same_job(self):
+        """Test that repeated generate clicks no longer collide on job_id"""
+        self.client.force_login(self.user)
+        body = json.dumps({'resume_type': 'marketing', 'length_variant': 'long',
+                           'color_scheme': 'corporate_blue', 'formats': ['md']})
+        first = self.client.post('/api/generate/', body, content_type='application/json').json()
+        second = self.client.post('/api/generate/', body, content_type='application/json').json()
+        
+        self.assertTrue(first['success'] and second['success'])
+        self.assertEqual(first['job_id'], second['job_id'])
+        self.assertEqual((first['coalesced'], second['coalesced']), (False, True))
+        self.assertEqual(ResumeGenerationJob.objects.count(), 1)
+    
+    def test_stored_renders_are_reused_without_rendering(self):
+        """Test that formats already in the artifact store are attached instead of rendered"""
+        first = self.queue('first', formats=('md', 'rtf'))
+        GenerationWorker(pool_size=1).run(drain=True)
+        first.refresh_from_db()
+        
+        second = self.queue('second', formats=('md',))
+        with patch('resumes.generation_worker.render_job', side_effect=AssertionError('rendered again')):
+            self.assertEqual(GenerationWorker(pool_size=1).run(drain=True), 1)
+        second.refresh_from_db()
+        
+        self.assertEqual((second.status, second.result_files), ('completed', {'md': first.result_files['md']}))
+        blob = StoredFile.objects.get(job=second).blob
+        self.assertEqual(blob.ref_count, 2)
+    
+    def test_stale_processing_jobs_are_requeued(self):
+        """Test that jobs orphaned by a dead worker return to the queue, and long renders still beating don't"""
+        stale, fresh, long_running = self.queue('stale'), self.queue('fresh'), self.queue('long')
+        attached = self.queue('attached')
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        ResumeGenerationJob.objects.filter(id=stale.id).update(status='processing', started_at=an_hour_ago,
+                                                                heartbeat_at=an_hour_ago)
+        ResumeGenerationJob.objects.filter(id=attached.id).update(status='processing', started_at=an_hour_ago,
+                                                                   canonical_job=stale)
+        ResumeGenerationJob.objects.filter(id=fresh.id).update(status='processing', started_at=timezone.now())
+        ResumeGenerationJob.objects.filter(id=long_running.id).update(status='processing', started_at=an_hour_ago,
+                                                                       heartbeat_at=timezone.now(), worker_id='w1')
+        
+        self.assertEqual(requeue_stale_jobs(timedelta(minutes=15)), 1)
+        for job in (stale, attached, long_running):
+            job.refresh_from_db()
+        self.assertEqual((stale.status, stale.started_at, stale.heartbeat_at), ('queued', None, None))
+        self.assertEqual(attached.status, 'queued')
+        self.assertEqual(long_running.status, 'processing')
+    
+    def test_heartbeat_keeps_claimed_jobs_alive(self):
+        """Test that a worker's heartbeat refreshes only its own processing jobs"""
+        job = self.queue('beating')
+        claimed = claim_job('w1')
+        self.assertEqual(claimed.heartbeat_at, claimed.started_at)
+        ResumeGenerationJob.objects.filter(id=job.id).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+        
+        self.assertEqual(heartbeat('w2', [job.id]), 0)
+        self.assertEqual(heartbeat('w1', [job.id]), 1)
+        self.assertEqual(requeue_stale_jobs(timedelta(minutes=15)), 0)
+    
+    def test_in_process_render_beats_while_rendering(self):
+        """Test that an in-process worker reports the job alive from a background thread during a slow render"""
+        job = self.queue('slow', formats=('md',))
+        
+        def slow_render(payload):
+            time.sleep(0.2)
+            return render_job(payload)
+        
+        with patch('resumes.generation_worker.render_job', side_effect=slow_render), \
+                patch('resumes.generation_worker.heartbeat') as beat:
+            GenerationWorker(pool_size=1, worker_id='w1', heartbeat_interval=0.02).run(drain=True)
+        
+        beat.assert_called_with('w1', [job.id])
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+
+
+def _render_or_crash(payload):
+    """Pool task that kills its render process for resumes whose summary asks it to"""
+    if payload["data"].get("summary") == "crash":
+        os._exit(1)
+    return render_job(payload)
+
+
+class ArtifactStoreTests(TestCase):
+    """Test the content-addressed render store"""
+    
+    def setUp(self):
+        self.output_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+        self.store = ArtifactStore(self.output_dir / 'blobs')
+        self.user = CustomUser.objects.create_user(username='store', email='store@example.com', password='testpass123')
+        template = ResumeTemplate.objects.create(name='General', role='general', version='long')
+        self.resumes = [Resume.objects.create(user=self.user, template=template, title=f'Resume {n}') for n in range(2)]
+    
+    def write(self, name, content):
+        path = self.output_dir / name
+        path.write_bytes(content)
+        return path
+    
+    def test_identical_files_are_stored_once(self):
+        """Test that ingesting the same bytes twice yields one blob and one file"""
+        first = self.store.ingest(self.write('a.md', b'# Resume'), 'md')
+        moved = self.write('b.md', b'# Resume')
+        second = self.store.ingest(moved, 'md', move=True)
+        
+        self.assertEqual(first, second)
+        self.assertFalse(moved.exists())
+        self.assertEqual(self.store.blob_path(first).read_bytes(), b'# Resume')
+        self.assertEqual((first.size, RenderBlob.objects.count()), (8, 1))
+        self.assertEqual(len(list((self.output_dir / 'blobs').rglob('*'))), 2)
+    
+    def test_references_are_counted_and_unreferenced_blobs_collected(self):
+        """Test that attach/replace/detach keep ref_count exact and garbage collection spares referenced blobs"""
+        old = self.store.ingest(self.write('old.pdf', b'%PDF-old'), 'pdf')
+        new = self.store.ingest(self.write('new.pdf', b'%PDF-new'), 'pdf')
+        self.store.remember('key-old', old)
+        for resume in self.resumes:
+            self.store.attach(old, 'pdf', resume=resume)
+        self.store.attach(old, 'pdf', resume=self.resumes[0])
+        self.store.attach(new, 'pdf', resume=self.resumes[1])
+        old.refresh_from_db()
+        new.refresh_from_db()
+        self.assertEqual((old.ref_count, new.ref_count), (1, 1))
+        self.assertEqual(self.store.resolve('pdf', resume=self.resumes[1]), self.store.blob_path(new))
+        
+        self.assertEqual(self.store.collect_garbage(), 0)
+        self.assertEqual(self.store.detach(resume=self.resumes[0]), 1)
+        self.assertEqual(self.store.collect_garbage(), 1)
+        self.assertFalse(self.store.blob_path(old).exists())
+        self.assertIsNone(self.store.lookup('key-old'))
+        self.assertTrue(self.store.blob_path(new).exists())
+        
+        # Owners deleted by cascade leave ref_count stale; collection goes by the references themselves
+        self.store.attach(new, 'pdf', resume=self.resumes[0])
+        self.resumes[1].delete()
+        new.refresh_from_db()
+        self.assertEqual(new.ref_count, 2)
+        self.assertEqual(self.store.collect_garbage(), 0)
+        new.refresh_from_db()
+        self.assertEqual(new.ref_count, 1)
+        self.resumes[0].delete()
+        self.assertEqual(self.store.collect_garbage(), 1)
+    
+    def test_blob_referenced_during_collection_is_kept(self):
+        """Test that a blob whose delete is blocked by a new reference is skipped, not raised"""
+        blob = self.store.ingest(self.write('racy.pdf', b'%PDF-racy'), 'pdf')
+        
+        with patch.object(RenderBlob, 'delete', side_effect=ProtectedError('referenced', set())):
+            self.assertEqual(self.store.collect_garbage(), 0)
+        self.assertTrue(self.store.blob_path(blob).exists())
+    
+    def test_lookup_forgets_missing_files(self):
+        """Test that a render key whose blob file vanished is treated as not rendered"""
+        blob = self.store.ingest(self.write('gone.md', b'gone'), 'md')
+        self.store.remember('key', blob)
+        self.assertEqual(self.store.lookup('key'), blob)
+        
+        self.store.blob_path(blob).unlink()
+        self.assertIsNone(self.store.lookup('key'))
+        self.assertFalse(RenderArtifact.objects.exists())
+    
+    def test_downloads_resolve_through_store(self):
+        """Test that download_resume and ResumeViewSet.files serve stored blobs"""
+        resume = self.resumes[0]
+        blob = self.store.ingest(self.write('r.md', b'# Stored'), 'md')
+        self.store.attach(blob, 'md', resume=resume)
+        self.client.force_login(self.user)
+        
+        with override_settings(FILE_GENERATION={'BLOB_DIR': self.output_dir / 'blobs'}):
+            response = self.client.get(f'/resume/{resume.id}/download/md/')
+            files = self.client.get(f'/api/resumes/{resume.id}/files/').json()['files']
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response), b'# Stored')
+        self.assertEqual(files, [{'format': 'md', 'sha256': blob.sha256, 'size': 8,
+                                  'url': f'/resume/{resume.id}/download/md/'}])
+    
+    def test_files_lists_legacy_paths(self):
+        """Test that ResumeViewSet.files falls back to the per-format paths of resumes rendered before the store"""
+        resume = self.resumes[1]
+        resume.pdf_path = str(self.write('legacy.pdf', b'%PDF-legacy'))
+        resume.docx_path = str(self.output_dir / 'missing.docx')
+        resume.save()
+        blob = self.store.ingest(self.write('r.md', b'# Stored'), 'md')
+        self.store.attach(blob, 'md', resume=resume)
+        self.client.force_login(self.user)
+        
+        with override_settings(FILE_GENERATION={'BLOB_DIR': self.output_dir / 'blobs'}):
+            files = self.client.get(f'/api/resumes/{resume.id}/files/').json()['files']
+        
+        self.assertEqual(files, [
+            {'format': 'md', 'sha256': blob.sha256, 'size': 8, 'url': f'/resume/{resume.id}/download/md/'},
+            {'format': 'pdf', 'sha256': None, 'size': 11, 'url': f'/resume/{resume.id}/download/pdf/'},
+        ])
+
+
+class DownloadTests(TestCase):
+    """Test streaming downloads, conditional GET and Range requests"""
+    
+    def setUp(self):
+        self.output_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+        settings_override = override_settings(FILE_GENERATION={'BLOB_DIR': self.output_dir / 'blobs'})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        
+        user = CustomUser.objects.create_user(username='downloads', email='downloads@example.com', password='testpass123')
+        template = ResumeTemplate.objects.create(name='General', role='general', version='long')
+        self.resume = Resume.objects.create(user=user, template=template, title='Resume')
+        source = self.output_dir / 'r.pdf'
+        source.write_bytes(b'%PDF-' + bytes(range(256)) * 1024)
+        store = ArtifactStore()
+        self.blob = store.ingest(source, 'pdf')
+        store.attach(self.blob, 'pdf', resume=self.resume)
+        self.url = f'/resume/{self.resume.id}/download/pdf/'
+        self.client.force_login(user)
+    
+    def test_full_download_streams_with_caching_headers(self):
+        """Test that a plain GET streams the file with its MIME type, ETag and Last-Modified"""
+        response = self.client.get(self.url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response['ETag'], f'"{self.blob.sha256}"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('Last-Modified', response)
+        self.assertIn('attachment; filename="Resume.pdf"', response['Content-Disposition'])
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF-' + bytes(range(256)) * 1024)
+    
+    def test_conditional_requests_get_not_modified(self):
+        """Test that a matching If-None-Match or If-Modified-Since gets a 304 with no body"""
+        first = self.client.get(self.url)
+        first.close()
+        
+        by_etag = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        by_date = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH='"other"')
+        changed.close()
+        
+        self.assertEqual((by_etag.status_code, by_date.status_code, changed.status_code), (304, 304, 200))
+        self.assertEqual(by_etag.content, b'')
+        self.assertEqual(by_etag['ETag'], first['ETag'])
+    
+    def test_range_requests(self):
+        """Test single ranges, suffix ranges, stale If-Range and unsatisfiable ranges"""
+        data = b'%PDF-' + bytes(range(256)) * 1024
+        
+        middle = self.client.get(self.url, HTTP_RANGE='bytes=5-260')
+        suffix = self.client.get(self.url, HTTP_RANGE='bytes=-10')
+        stale = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        beyond = self.client.get(self.url, HTTP_RANGE=f'bytes={len(data)}-')
+        
+        self.assertEqual(middle.status_code, 206)
+        self.assertEqual(middle['Content-Range'], f'bytes 5-260/{len(data)}')
+        self.assertEqual(middle['Content-Length'], '256')
+        self.assertEqual(b''.join(middle.streaming_content), data[5:261])
+        self.assertEqual(b''.join(suffix.streaming_content), data[-10:])
+        self.assertEqual(stale.status_code, 200)
+        stale.close()
+        self.assertEqual(beyond.status_code, 416)
+        self.assertEqual(beyond['Content-Range'], f'bytes */{len(data)}')
+    
+    def test_offload_hands_the_file_to_the_web_server(self):
+        """Test that X-Sendfile and X-Accel-Redirect responses carry the path and no body"""
+        blob_dir = self.output_dir / 'blobs'
+        relative = ArtifactStore().blob_path(self.blob).relative_to(blob_dir).as_posix()
+        
+        with override_settings(FILE_GENERATION={'BLOB_DIR': blob_dir, 'DOWNLOAD_OFFLOAD': 'x-sendfile'}):
+            sendfile = self.client.get(self.url)
+        with override_settings(FILE_GENERATION={'BLOB_DIR': blob_dir, 'DOWNLOAD_OFFLOAD': 'x-accel-redirect',
+                                                'ACCEL_REDIRECT_PREFIX': '/protected/blobs/',
+                                                'ACCEL_REDIRECT_ROOT': blob_dir}):
+            accel = self.client.get(self.url)
+        
+        self.assertEqual(sendfile['X-Sendfile'], str(ArtifactStore(blob_dir).blob_path(self.blob).resolve()))
+        self.assertEqual(accel['X-Accel-Redirect'], f'/protected/blobs/{relative}')
+        self.assertEqual((sendfile.content, accel.content), (b'', b''))
+        self.assertEqual(accel['Content-Type'], 'application/pdf')
+    
+    def test_accel_redirect_streams_files_outside_its_root(self):
+        """Test that a legacy path outside ACCEL_REDIRECT_ROOT is streamed instead of offloaded"""
+        legacy = self.output_dir / 'legacy.pdf'
+        legacy.write_bytes(b'%PDF-legacy')
+        resume = Resume.objects.create(user=self.resume.user, template=self.resume.template, title='Legacy',
+                                       pdf_path=str(legacy))
+        
+        with override_settings(FILE_GENERATION={'BLOB_DIR': self.output_dir / 'blobs',
+                                                'DOWNLOAD_OFFLOAD': 'x-accel-redirect',
+                                                'ACCEL_REDIRECT_ROOT': self.output_dir / 'blobs'}):
+            response = self.client.get(f'/resume/{resume.id}/download/pdf/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Accel-Redirect', response)
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF-legacy')
+    
+    def test_render_returns_bytes_without_writing(self):
+        """Test that the synchronous render endpoint returns the format's bytes with its MIME type"""
+        row = UserResumeData.objects.create(user=self.resume.user, resume_type='marketing', length_variant='long',
+                                            personal_info={'name': 'Jane Doe'}, summary='Builds things.')
+        
+        markdown = self.client.get(f'/api/resume-data/{row.id}/render/?format_type=md')
+        pdf = self.client.get(f'/api/resume-data/{row.id}/render/?format_type=pdf&color_scheme=corporate_blue')
+        unsupported = self.client.get(f'/api/resume-data/{row.id}/render/?format_type=odt')
+        
+        self.assertEqual(markdown['Content-Type'], 'text/markdown; charset=utf-8')
+        self.assertTrue(markdown.content.startswith(b'# Jane Doe'))
+        self.assertIn('marketing_long_default_professional.md', markdown['Content-Disposition'])
+        self.assertEqual((pdf.status_code, pdf['Content-Type']), (200, 'application/pdf'))
+        self.assertTrue(pdf.content.startswith(b'%PDF-'))
+        self.assertEqual(unsupported.status_code, 400)
+    
+    def test_bundle_streams_stored_renders_as_zip(self):
+        """Test that the bundle endpoint zips stored renders per length and format, storing PDFs and deflating text"""
+        user = self.resume.user
+        rows = [UserResumeData.objects.create(user=user, resume_type='marketing', length_variant=length,
+                                              summary=f'{length} summary') for length in ('long', 'short')]
+        name, config = scheme_config(None)
+        store = ArtifactStore()
+        for row in rows:
+            for format_type, content in (('pdf', b'%PDF-' + bytes(range(256)) * 64), ('md', b'# Resume\n' * 500)):
+                source = self.output_dir / f'{row.length_variant}.{format_type}'
+                source.write_bytes(content)
+                key = render_key(row.to_resume_data(), name, config, [format_type], row.length_variant, 'ats')
+                store.remember(key, store.ingest(source, format_type))
+        
+        response = self.client.get(f'/api/resume-data/{rows[0].id}/bundle/?formats=pdf,md,rtf')
+        short_md = self.client.get(f'/api/resume-data/{rows[0].id}/bundle/?formats=md&lengths=short')
+        unknown = self.client.get(f'/api/resume-data/{rows[0].id}/bundle/?color_schemes=nope')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), [f'marketing_{length}_{name}.{fmt}' for length in ('long', 'short') for fmt in ('md', 'pdf')])
+        compression = {info.filename.rsplit('.', 1)[1]: info.compress_type for info in archive.infolist()}
+        self.assertEqual(compression, {'md': zipfile.ZIP_DEFLATED, 'pdf': zipfile.ZIP_STORED})
+        self.assertEqual(archive.read(f'marketing_short_{name}.md'), b'# Resume\n' * 500)
+        self.assertEqual(zipfile.ZipFile(io.BytesIO(b''.join(short_md.streaming_content))).namelist(),
+                         [f'marketing_short_{name}.md'])
+        self.assertEqual(unknown.status_code, 400)
+
+
+class PreviewTests(TestCase):
+    """Test the live preview endpoint"""
+    
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        settings_override = override_settings(RESUME_GENERATOR={**settings.RESUME_GENERATOR, 'PREVIEW_DEBOUNCE_SECONDS': 0})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        
+        user = CustomUser.objects.create_user(username='preview', email='preview@example.com', password='testpass123')
+        self.resume_data = UserResumeData.objects.create(
+            user=user, resume_type='marketing', length_variant='long',
+            personal_info={'name': 'Jane Doe'}, summary='Builds things.'
+        )
+        self.url = f'/api/resume-data/{self.resume_data.id}/preview/'
+        self.client.force_login(user)
+    
+    def test_preview_renders_first_page_png_and_caches_it(self):
+        """Test that a preview is a PNG of page 1, rendered once per content and scheme"""
+        with patch('resumes.preview.render_preview', wraps=render_preview) as render:
+            first = self.client.get(self.url)
+            again = self.client.get(self.url)
+            edited = self.client.post(self.url, {'data': {'summary': 'Ships things.'}}, content_type='application/json')
+            other_scheme = self.client.get(self.url, {'color_scheme': 'corporate_blue'})
+        
+        self.assertEqual(first['Content-Type'], 'image/png')
+        self.assertTrue(first.content.startswith(b'\x89PNG'))
+        self.assertEqual(pymupdf.Pixmap(first.content).width, 816)  # Letter width at 96 dpi
+        self.assertEqual(again.content, first.content)
+        self.assertNotEqual(edited.content, first.content)
+        self.assertEqual(other_scheme.status_code, 200)
+        self.assertEqual(render.call_count, 3)
+    
+    def test_only_the_settled_state_of_a_burst_renders(self):
+        """Test that uncached previews get a ticket, and only the newest ticket renders once the window passes"""
+        channel = f"{self.resume_data.user_id}:{self.resume_data.id}"
+        edit = {'data': {'summary': 'Ships things.'}}
+        
+        with override_settings(RESUME_GENERATOR={**settings.RESUME_GENERATOR, 'PREVIEW_DEBOUNCE_SECONDS': 5}), \
+                patch('resumes.preview.render_preview', return_value=b'\x89PNG') as render:
+            first = self.client.get(self.url)
+            edited = self.client.post(self.url, edit, content_type='application/json')
+            overtaken = self.client.get(self.url, {'ticket': first.data['ticket']})
+            early = self.client.post(self.url, {**edit, 'ticket': edited.data['ticket']}, content_type='application/json')
+            cache.set(f"preview-arrival:{channel}:{edited.data['ticket']}", time.time() - 10)  # the edits settled
+            settled = self.client.post(self.url, {**edit, 'ticket': edited.data['ticket']}, content_type='application/json')
+        
+        self.assertEqual((first.status_code, edited.status_code), (202, 202))
+        self.assertEqual(edited.data['ticket'], first.data['ticket'] + 1)
+        self.assertEqual((first['Retry-After'], first.data['retry_after']), ('5', 5))
+        self.assertEqual(overtaken.status_code, 409)
+        self.assertEqual(early.status_code, 202)
+        self.assertEqual(early['Retry-After'], str(early.data['retry_after']))
+        self.assertEqual(settled.status_code, 200)
+        self.assertEqual(render.call_count, 1)
+    
+    def test_ticket_survives_an_expired_counter(self):
+        """Test that a sequence counter expiring between add and incr is recreated rather than failing"""
+        with patch('resumes.preview.cache.incr', side_effect=[ValueError('expired'), 1]) as incr:
+            ticket = take_ticket('1:1')
+        
+        self.assertEqual((ticket, incr.call_count), (1, 2))
+
+
 class ContentManagementTests(TestCase):
     """Test content management functionality"""
     
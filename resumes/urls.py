@@ -25,4 +25,5 @@ urlpatterns = [
     # API endpoints
     path('api/', include(router.urls)),
     path('api/generate/', views.generate_resume, name='generate_resume'),
+    path('api/metrics/', views.render_metrics, name='render_metrics'),
 ]
\ No newline at end of file
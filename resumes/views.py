@@ -2,10 +2,13 @@
 Views for Resume Generator
 """
 
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404, redirect
+from django.urls import reverse
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import get_user_model
 from django.http import JsonResponse, HttpResponse
+from django.utils.http import content_disposition_header
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.core.paginator import Paginator
@@ -26,6 +29,12 @@ from .serializers import (
     UserResumeDataSerializer, ResumeSerializer, ColorSchemeSerializer,
     UserColorSchemeSerializer, ResumeGenerationJobSerializer
 )
+from .artifact_store import ArtifactStore
+from .core_services import DEFAULT_PDF_PROFILE, PDF_PROFILES, ResumeGenerator, ResumeManager
+from .downloads import content_type_for, file_download_response, zip_download_response
+from .generation_worker import stored_renders, submit_job
+from .metrics import registry as metrics_registry
+from .preview import PreviewDeferred, PreviewSuperseded, preview_png
 
 User = get_user_model()
 
@@ -97,6 +106,10 @@ def generate_resume(request):
         length_variant = data.get('length_variant')
         color_scheme = data.get('color_scheme', 'default_professional')
         formats = data.get('formats', ['pdf', 'docx'])
+        output_type = data.get('output_type', 'ats')
+        pdf_profile = data.get('pdf_profile', DEFAULT_PDF_PROFILE)
+        # Resume whose downloads should serve the rendered files, if any
+        resume = get_object_or_404(Resume, id=data['resume_id'], user=request.user) if data.get('resume_id') else None
         
         # Get or create user resume data
         resume_data, created = UserResumeData.objects.get_or_create(
@@ -106,22 +119,19 @@ def generate_resume(request):
             defaults={'is_active': True}
         )
         
-        # Create generation job
-        job = ResumeGenerationJob.objects.create(
-            user=request.user,
-            resume=resume_data,
-            job_id=f"job_{request.user.id}_{resume_type}_{length_variant}",
-            formats=formats,
+        # Queue a generation job, or share an identical render already queued or done;
+        # picked up by the run_generation_worker management command
+        job, outcome = submit_job(
+            request.user, resume_data, formats,
             color_scheme=ColorScheme.objects.get(name=color_scheme) if color_scheme else None,
-            status='queued'
+            output_type=output_type, pdf_profile=pdf_profile, resume=resume
         )
         
-        # TODO: Start background task for resume generation
-        # For now, just return success
-        
         return JsonResponse({
             'success': True,
             'job_id': job.job_id,
+            'status': job.status,
+            'coalesced': outcome != 'queued',
             'message': 'Resume generation started'
         })
         
@@ -137,23 +147,31 @@ def download_resume(request, resume_id, format_type):
     """Download generated resume file"""
     resume = get_object_or_404(Resume, id=resume_id, user=request.user)
     
-    # Get file path based on format
-    file_path = None
-    if format_type == 'pdf':
-        file_path = resume.pdf_path
-    elif format_type == 'docx':
-        file_path = resume.docx_path
-    elif format_type == 'rtf':
-        file_path = resume.rtf_path
+    # Stored renders resolve through the content-addressed store, whose hash
+    # is the ETag; older resumes still carry per-format paths
+    store = ArtifactStore()
+    blob = store.files(resume=resume).get(format_type)
+    if blob is not None:
+        file_path, etag = store.blob_path(blob), blob.sha256
+    else:
+        file_path, etag = {
+            'pdf': resume.pdf_path,
+            'docx': resume.docx_path,
+            'rtf': resume.rtf_path,
+        }.get(format_type), None
     
     if not file_path or not os.path.exists(file_path):
         return HttpResponse('File not found', status=404)
     
-    # Return file for download
-    with open(file_path, 'rb') as f:
-        response = HttpResponse(f.read(), content_type='application/octet-stream')
-        response['Content-Disposition'] = f'attachment; filename="{resume.title}.{format_type}"'
-        return response
+    return file_download_response(request, file_path, f"{resume.title}.{format_type}", format_type, etag=etag)
+
+
+@login_required
+def render_metrics(request):
+    """Render span latencies (p50/p95 per span, format and scheme) recorded by this process; staff only"""
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'error': 'Staff access required'}, status=403)
+    return JsonResponse(metrics_registry.snapshot())
 
 
 class UserResumeDataViewSet(viewsets.ModelViewSet):
@@ -168,22 +186,132 @@ class UserResumeDataViewSet(viewsets.ModelViewSet):
     def generate(self, request, pk=None):
         """Generate resume from user data"""
         resume_data = self.get_object()
+        resume = None
+        if request.data.get('resume'):
+            resume = Resume.objects.filter(id=request.data['resume'], user=request.user).first()
+            if resume is None:
+                return Response({'error': 'Unknown resume'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Create generation job
-        job = ResumeGenerationJob.objects.create(
-            user=request.user,
-            resume=resume_data,
-            job_id=f"api_job_{request.user.id}_{resume_data.resume_type}_{resume_data.length_variant}",
-            formats=request.data.get('formats', ['pdf']),
-            status='queued'
-        )
-        
-        # TODO: Start background task
+        # Queue a generation job, or share an identical render already queued or done;
+        # picked up by the run_generation_worker management command
+        try:
+            job, outcome = submit_job(
+                request.user, resume_data, request.data.get('formats', ['pdf']),
+                output_type=request.data.get('output_type', 'ats'), job_prefix='api_job',
+                pdf_profile=request.data.get('pdf_profile', DEFAULT_PDF_PROFILE), resume=resume
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'job_id': job.job_id,
-            'status': 'queued'
+            'status': job.status,
+            'coalesced': outcome != 'queued'
         })
+    
+    def _scheme_config(self, color_scheme):
+        """Config of a shipped color scheme, or None if the scheme is unknown"""
+        if color_scheme not in ResumeManager().color_schemes:
+            return None
+        with open(settings.BASE_DIR / 'color_schemes' / f'{color_scheme}.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _generator(self, resume_data, color_scheme, pdf_profile=DEFAULT_PDF_PROFILE):
+        """Generator for resume_data in a shipped color scheme, or None if the scheme is unknown"""
+        config = self._scheme_config(color_scheme)
+        if config is None:
+            return None
+        return ResumeGenerator.from_data(
+            resume_data.to_resume_data(), config, color_scheme, resume_data.length_variant, pdf_profile=pdf_profile
+        )
+    
+    @action(detail=True, methods=['get'])
+    def estimate(self, request, pk=None):
+        """Predicted PDF page count and section heights, without rendering"""
+        resume_data = self.get_object()
+        color_scheme = request.query_params.get('color_scheme', 'default_professional')
+        generator = self._generator(resume_data, color_scheme)
+        if generator is None:
+            return Response({'error': f'Unknown color scheme: {color_scheme}'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'color_scheme': color_scheme, **generator.estimate_pages()})
+    
+    @action(detail=True, methods=['get'])
+    def render(self, request, pk=None):
+        """Render one format synchronously and return it, without writing to disk"""
+        resume_data = self.get_object()
+        # Not "format", which DRF reserves for choosing its own renderer
+        format_type = request.query_params.get('format_type', 'pdf')
+        color_scheme = request.query_params.get('color_scheme', 'default_professional')
+        pdf_profile = request.query_params.get('pdf_profile', DEFAULT_PDF_PROFILE)
+        if format_type not in ResumeGenerator.FORMAT_EXTENSIONS:
+            return Response({'error': f'Unsupported format: {format_type}'}, status=status.HTTP_400_BAD_REQUEST)
+        if pdf_profile not in PDF_PROFILES:
+            return Response({'error': f'Unknown PDF profile: {pdf_profile}'}, status=status.HTTP_400_BAD_REQUEST)
+        generator = self._generator(resume_data, color_scheme, pdf_profile)
+        if generator is None:
+            return Response({'error': f'Unknown color scheme: {color_scheme}'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        filename = f"{resume_data.resume_type}_{resume_data.length_variant}_{color_scheme}.{format_type}"
+        return HttpResponse(
+            generator.render_bytes(format_type), content_type=content_type_for(format_type),
+            headers={'Content-Disposition': content_disposition_header(True, filename)}
+        )
+    
+    @action(detail=True, methods=['get', 'post'])
+    def preview(self, request, pk=None):
+        """
+        First page as PNG for live editing.
+        
+        POST {"data": {...}} to preview unsaved edits over the stored content.
+        Uncached previews are debounced: the first answer is a 202 with a
+        ticket and Retry-After, and retrying with ?ticket= renders once no
+        newer request has arrived; an overtaken ticket gets a 409.
+        """
+        resume_data = self.get_object()
+        edits = request.data if request.method == 'POST' else {}
+        color_scheme = request.query_params.get('color_scheme') or edits.get('color_scheme', 'default_professional')
+        config = self._scheme_config(color_scheme)
+        if config is None:
+            return Response({'error': f'Unknown color scheme: {color_scheme}'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        ticket = request.query_params.get('ticket') or edits.get('ticket')
+        if ticket is not None:
+            try:
+                ticket = int(ticket)
+            except (TypeError, ValueError):
+                return Response({'error': f'Invalid ticket: {ticket}'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        data = resume_data.to_resume_data()
+        data.update({key: value for key, value in (edits.get('data') or {}).items() if key in data})
+        try:
+            png = preview_png(data, color_scheme, config, resume_data.length_variant,
+                              channel=f"{request.user.id}:{resume_data.id}", ticket=ticket)
+        except PreviewDeferred as deferred:
+            return Response({'ticket': deferred.ticket, 'retry_after': deferred.retry_after},
+                            status=status.HTTP_202_ACCEPTED, headers={'Retry-After': str(deferred.retry_after)})
+        except PreviewSuperseded:
+            return Response({'error': 'Superseded by a newer preview request'}, status=status.HTTP_409_CONFLICT)
+        return HttpResponse(png, content_type='image/png', headers={'Cache-Control': 'private, no-cache'})
+    
+    @action(detail=True, methods=['get'])
+    def bundle(self, request, pk=None):
+        """Stream a ZIP of this resume's stored renders across formats, color schemes and lengths"""
+        resume_data = self.get_object()
+        
+        def listed(name):
+            value = request.query_params.get(name)
+            return [item.strip() for item in value.split(',') if item.strip()] if value else None
+        
+        try:
+            entries = stored_renders(
+                resume_data, listed('formats'), listed('color_schemes'), listed('lengths'),
+                output_type=request.query_params.get('output_type', 'ats')
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if not entries:
+            return Response({'error': 'No rendered files match'}, status=status.HTTP_404_NOT_FOUND)
+        return zip_download_response(f"{resume_data.resume_type}.zip", entries)
 
 
 class ResumeViewSet(viewsets.ModelViewSet):
@@ -198,8 +326,18 @@ class ResumeViewSet(viewsets.ModelViewSet):
     def files(self, request, pk=None):
         """Get generated files for resume"""
         resume = self.get_object()
-        file_paths = resume.get_file_paths() if hasattr(resume, 'get_file_paths') else []
-        return Response({'files': file_paths})
+        files = {
+            format_type: {'sha256': blob.sha256, 'size': blob.size}
+            for format_type, blob in ArtifactStore().files(resume=resume).items()
+        }
+        # Resumes generated before the store only have per-format paths, like download_resume's fallback
+        for format_type, path in (('pdf', resume.pdf_path), ('docx', resume.docx_path), ('rtf', resume.rtf_path)):
+            if format_type not in files and path and os.path.exists(path):
+                files[format_type] = {'sha256': None, 'size': os.path.getsize(path)}
+        return Response({'files': [
+            {'format': format_type, **details, 'url': reverse('resumes:download_resume', args=[resume.id, format_type])}
+            for format_type, details in sorted(files.items())
+        ]})
 
 
 class ColorSchemeViewSet(viewsets.ReadOnlyModelViewSet):
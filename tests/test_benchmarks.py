@@ -0,0 +1,43 @@
+"""
+Benchmark comparison tests — the regression check must flag real slowdowns only.
+"""
+from benchmarks.run_benchmarks import compare_results, synthetic_input
+
+
+def results(**seconds):
+    return {"meta": {}, "results": {name: {"seconds": value} for name, value in seconds.items()}}
+
+
+def test_compare_flags_changes_beyond_threshold():
+    baseline = results(pdf=0.100, docx=0.100, md=0.100, gone=0.1)
+    current = results(pdf=0.130, docx=0.110, md=0.050, added=0.1)
+    statuses = {row[0]: row[4] for row in compare_results(baseline, current, threshold=0.15)}
+    assert statuses == {
+        "pdf": "regression",
+        "docx": "ok",
+        "md": "improvement",
+        "gone": "missing",
+        "added": "new",
+    }
+
+
+def test_compare_ignores_sub_millisecond_noise():
+    rows = compare_results(results(md=0.0003), results(md=0.0006), threshold=0.15)
+    assert rows[0][4] == "ok"
+
+
+def test_compare_skips_runs_on_different_core_counts():
+    baseline = {"meta": {}, "results": {"matrix.workers2": {"seconds": 10.0, "cpu_count": 1}}}
+    current = {"meta": {}, "results": {"matrix.workers2": {"seconds": 5.0, "cpu_count": 4}}}
+    assert compare_results(baseline, current)[0][4] == "skipped"
+    current["results"]["matrix.workers2"]["cpu_count"] = 1
+    assert compare_results(baseline, current)[0][4] == "improvement"
+
+
+def test_synthetic_input_repeats_list_sections():
+    data = {"experience": [{"company": "A"}], "achievements": {"Impact": ["x", "y"]}, "summary": "s"}
+    synthetic = synthetic_input(data, factor=10)
+    assert len(synthetic["experience"]) == 10
+    assert len(synthetic["achievements"]["Impact"]) == 20
+    assert synthetic["summary"] == "s"
+    assert len(data["experience"]) == 1